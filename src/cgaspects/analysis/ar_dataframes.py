@@ -7,6 +7,7 @@ import pandas as pd
 
 from .shape_analysis import ShapeAnalyser
 from ..fileio.xyz_file import CrystalCloud
+from ..utils.parallel import chunk, iter_process_pool
 
 LOG = logging.getLogger("CA:AR-Dataframes")
 
@@ -182,29 +183,107 @@ def get_xyz_shape_percentage(df, savefolder):
     result_df.to_csv(total_shapes_csv, index=False)
 
 
-def collect_all(folder: Path = None, xyz_files: list[Path] = None, signals=None):
+AR_COLUMNS = [
+    "Simulation Number",
+    "Frame Index",
+    "PC1",
+    "PC2",
+    "PC3",
+    "Length X",
+    "Length Y",
+    "Length Z",
+    "S:M",
+    "M:L",
+    "Shape",
+    "Surface Area",
+    "Volume",
+    "SA:Vol Ratio",
+]
+
+
+def ar_cache_options() -> dict:
+    """ShapeAnalyser settings that the cached aspect ratio rows depend on."""
+    analyser = ShapeAnalyser()
+    return {
+        "l_max": analyser.l_max,
+        "zingg_method": analyser.zingg_method,
+        "center_pca": analyser.center_pca,
+    }
+
+
+def sim_number(file: Path) -> str:
+    """Simulation number of an XYZ file: the last number in its name."""
+    try:
+        return re.findall(r"\d+", file.name)[-1]
+    except IndexError:
+        return file.name.split("_")[0]
+
+
+def analyse_xyz_file(file: Path) -> list[list]:
+    """Return the per-frame aspect ratio rows for a single XYZ file.
+
+    Rows hold every :data:`AR_COLUMNS` entry except the simulation number,
+    which depends on the file name rather than its contents (see
+    :func:`sim_number`).  Files that cannot be decoded yield no rows.
+    """
+    try:
+        crystal = CrystalCloud.from_file(file)
+        shape_analyser = ShapeAnalyser()
+        shape_analyser.analyse_crystal(crystal, frame_idx=None)
+    except (StopIteration, UnicodeDecodeError):
+        return []
+
+    data_rows = []
+    for frame_idx, metrics in shape_analyser.get_all_frame_metrics().items():
+        if metrics is None:
+            continue
+        data_rows.append(
+            [
+                frame_idx,
+                metrics.pc1,
+                metrics.pc2,
+                metrics.pc3,
+                metrics.x,
+                metrics.y,
+                metrics.z,
+                metrics.aspect1,
+                metrics.aspect2,
+                metrics.shape,
+                metrics.surface_area,
+                metrics.volume,
+                metrics.surface_area_to_volume_ratio,
+            ]
+        )
+    return data_rows
+
+
+def analyse_xyz_batch(files: list[Path]) -> list[list[list]]:
+    """Process-pool entry point: aspect ratio rows for each file in *files*."""
+    return [analyse_xyz_file(file) for file in files]
+
+
+def collect_all(
+    folder: Path = None,
+    xyz_files: list[Path] = None,
+    signals=None,
+    n_workers: int = 1,
+    chunk_size: int | None = None,
+    cache=None,
+):
     """
     This collects all the crystal shape
     information from each of the relevant functions
     and congregates that into the final DataFrame
-    """
 
-    col_headings = [
-        "Simulation Number",
-        "Frame Index",
-        "PC1",
-        "PC2",
-        "PC3",
-        "Length X",
-        "Length Y",
-        "Length Z",
-        "S:M",
-        "M:L",
-        "Shape",
-        "Surface Area",
-        "Volume",
-        "SA:Vol Ratio",
-    ]
+    With ``n_workers > 1`` the files are analysed in batches on a process
+    pool; rows are still returned in file order and progress/cancellation
+    are reported between batches.
+
+    With a :class:`~cgaspects.fileio.result_cache.ResultCache` (see
+    :func:`ar_cache_options`) only files missing from the cache are
+    analysed, and their rows are added to it.  The simulation number is
+    taken from each file name afterwards, so it is never cached.
+    """
 
     if xyz_files is None:
         if folder is None:
@@ -232,54 +311,64 @@ def collect_all(folder: Path = None, xyz_files: list[Path] = None, signals=None)
         LOG.error("No XYZ files found in directory/subdirectories of [%s]", str(folder))
         return
 
-    # List for collecting data
-    data_list = []
-    i = 1
-    shape_analyser = ShapeAnalyser()
+    cancel_flag = signals.cancel_flag if signals is not None else None
+
+    # Rows of files analysed before (same contents and options) come from the cache
+    rows_per_file: list[list[list] | None] = [None] * n_xyzs
+    todo = list(range(n_xyzs))
+    if cache is not None:
+        todo = []
+        for i, file in enumerate(xyz_files):
+            cached = cache.get(file)
+            if cached is None:
+                todo.append(i)
+            else:
+                rows_per_file[i] = cached[0]
+        LOG.info("%d / %d XYZ files found in the result cache", n_xyzs - len(todo), n_xyzs)
+
+    def store(i, rows):
+        rows_per_file[i] = rows
+        if cache is not None:
+            cache.put(xyz_files[i], rows)
+
+    n_done = n_xyzs - len(todo)
+    if n_workers > 1 and len(todo) > 1:
+        batches = chunk(todo, n_workers, chunk_size)
+        for batch_idx, batch_rows in iter_process_pool(
+            analyse_xyz_batch,
+            [[xyz_files[i] for i in batch] for batch in batches],
+            n_workers,
+            cancel_flag=cancel_flag,
+        ):
+            for i, rows in zip(batches[batch_idx], batch_rows):
+                store(i, rows)
+            n_done += len(batch_rows)
+            if signals:
+                signals.progress.emit(int((n_done / n_xyzs) * 100))
 
-    for file in xyz_files:
-        if signals is not None and signals.cancel_flag.is_set():
-            LOG.info("Aspect ratio analysis cancelled after %d / %d files.", i - 1, n_xyzs)
+        if cancel_flag is not None and cancel_flag.is_set():
+            LOG.info("Aspect ratio analysis cancelled after %d / %d files.", n_done, n_xyzs)
             signals.cancelled.emit()
             return None
-        try:
-            sim_num = re.findall(r"\d+", file.name)[-1]
-        except IndexError:
-            sim_num = file.name.split("_")[0]
-        try:
-            crystal = CrystalCloud.from_file(file)
-            shape_analyser.analyse_crystal(crystal, frame_idx=None)
-
-            for frame_idx, metrics in shape_analyser.get_all_frame_metrics().items():
-                if metrics is None:
-                    continue
-                data_row = [
-                    sim_num,
-                    frame_idx,
-                    metrics.pc1,
-                    metrics.pc2,
-                    metrics.pc3,
-                    metrics.x,
-                    metrics.y,
-                    metrics.z,
-                    metrics.aspect1,
-                    metrics.aspect2,
-                    metrics.shape,
-                    metrics.surface_area,
-                    metrics.volume,
-                    metrics.surface_area_to_volume_ratio,
-                ]
-                data_list.append(data_row)
+
+    else:
+        for i in todo:
+            if cancel_flag is not None and cancel_flag.is_set():
+                LOG.info("Aspect ratio analysis cancelled after %d / %d files.", n_done, n_xyzs)
+                signals.cancelled.emit()
+                return None
+            store(i, analyse_xyz_file(xyz_files[i]))
+            n_done += 1
             if signals:
-                signals.progress.emit(int((i / n_xyzs) * 100))
-            i += 1
-        except (StopIteration, UnicodeDecodeError):
-            continue
+                signals.progress.emit(int((n_done / n_xyzs) * 100))
+
+    data_list = [
+        [sim_number(file), *row] for file, rows in zip(xyz_files, rows_per_file) for row in rows
+    ]
 
     # Convert data to a DataFrame if not empty
     if data_list:
-        print(col_headings)
-        df = pd.DataFrame(data_list, columns=col_headings)
+        df = pd.DataFrame(data_list, columns=AR_COLUMNS)
         return df
     else:
         LOG.warning("Couldn't create Aspect Ratio Dataframe.Please check the XYZ files provided.")
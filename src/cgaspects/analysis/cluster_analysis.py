@@ -1,20 +1,28 @@
 """Cluster analysis module using DBSCAN/OPTICS on CrystalGrower XYZ files."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import DBSCAN, OPTICS
+from scipy.sparse import coo_array
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+from sklearn.cluster import OPTICS
 from sklearn.preprocessing import StandardScaler
 
 from PySide6.QtCore import QThreadPool, Qt
 from PySide6.QtWidgets import QDialog
 
-from ..fileio.find_data import create_aspects_folder, summary_compare
+from ..fileio.find_data import summary_compare
+from ..fileio.result_cache import ResultCache
 from ..fileio.xyz_file import CrystalCloud
 from ..gui.dialogs.cluster_dialog import ClusterAnalysisDialog
 from ..utils.data_structures import cluster_options_tuple, results_tuple
+from ..utils.parallel import iter_process_pool
+from .cluster_tracking import track_frames
 from .gui_threads import WorkerClusters
 
 logger = logging.getLogger("CA:Clusters")
@@ -25,16 +33,125 @@ logger = logging.getLogger("CA:Clusters")
 # ---------------------------------------------------------------------------
 
 
+def _slab_pairs(X: np.ndarray, eps: float, idx: np.ndarray) -> np.ndarray:
+    pairs = cKDTree(X[idx]).query_pairs(eps, output_type="ndarray")
+    return idx[pairs]
+
+
+def _boundary_pairs(X: np.ndarray, eps: float, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    near = cKDTree(X[left]).sparse_distance_matrix(
+        cKDTree(X[right]), eps, output_type="ndarray"
+    )
+    i, j = left[near["i"]], right[near["j"]]
+    return np.column_stack([np.minimum(i, j), np.maximum(i, j)])
+
+
+def _neighbour_pairs(X: np.ndarray, eps: float, n_jobs: int | None = None) -> np.ndarray:
+    """``(n_pairs, 2)`` array of the point pairs within *eps*, in no set order.
+
+    With *n_jobs* threads (-1 = all cores) the points are cut along x into
+    slabs wider than *eps*; each slab runs its own ``cKDTree.query_pairs``
+    and the pairs across each cut come from the points within *eps* of it.
+    The tree queries release the GIL, so the slabs run in parallel.
+    """
+    n_threads = (os.cpu_count() or 1) if n_jobs == -1 else max(1, n_jobs or 1)
+    if n_threads == 1 or len(X) < 2 * n_threads:
+        return cKDTree(X).query_pairs(eps, output_type="ndarray")
+
+    x = X[:, 0]
+    cuts = []
+    for cut in np.quantile(x, np.arange(1, n_threads) / n_threads):
+        # Pairs may only span neighbouring slabs
+        if not cuts or cut - cuts[-1] > eps:
+            cuts.append(cut)
+    if not cuts:
+        return cKDTree(X).query_pairs(eps, output_type="ndarray")
+
+    slab = np.searchsorted(cuts, x, side="right")
+    members = [np.flatnonzero(slab == k) for k in range(len(cuts) + 1)]
+    with ThreadPoolExecutor(n_threads) as pool:
+        jobs = [pool.submit(_slab_pairs, X, eps, idx) for idx in members]
+        for k, cut in enumerate(cuts):
+            left = members[k][x[members[k]] >= cut - eps]
+            right = members[k + 1][x[members[k + 1]] <= cut + eps]
+            if len(left) and len(right):
+                jobs.append(pool.submit(_boundary_pairs, X, eps, left, right))
+        return np.concatenate([job.result().reshape(-1, 2) for job in jobs])
+
+
+def _neighbour_graph_dbscan(
+    X: np.ndarray, eps: float, min_samples: int, n_jobs: int | None = None
+) -> np.ndarray:
+    """DBSCAN labels from connected components of a radius-neighbour graph.
+
+    The neighbour pairs within *eps* are found once with a cKDTree (on
+    *n_jobs* threads, see :func:`_neighbour_pairs`).  Core
+    points (at least *min_samples* neighbours, counting the point itself)
+    joined by an edge form the clusters, which are numbered in the order of
+    their first core point, and every border point takes the lowest label
+    among its core neighbours.  This reproduces the labels of
+    ``sklearn.cluster.DBSCAN`` exactly without building per-point
+    neighbourhood arrays.
+    """
+    n = len(X)
+    labels = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return labels
+
+    pairs = _neighbour_pairs(X, eps, n_jobs)
+    i, j = pairs[:, 0], pairs[:, 1]
+    core = np.bincount(pairs.ravel(), minlength=n) + 1 >= min_samples
+    core_idx = np.flatnonzero(core)
+    n_core = len(core_idx)
+    if n_core == 0:
+        return labels
+
+    # Connected components of the core-core subgraph
+    core_pos = np.cumsum(core) - 1
+    both = core[i] & core[j]
+    graph = coo_array(
+        (np.ones(int(both.sum()), dtype=bool), (core_pos[i[both]], core_pos[j[both]])),
+        shape=(n_core, n_core),
+    )
+    n_comp, comp = connected_components(graph, directed=False)
+    first = np.full(n_comp, n_core)
+    np.minimum.at(first, comp, np.arange(n_core))
+    rank = np.empty(n_comp, dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(n_comp)
+    labels[core_idx] = rank[comp]
+
+    # Border points join the lowest-numbered neighbouring cluster
+    to_j = core[i] & ~core[j]
+    to_i = core[j] & ~core[i]
+    border = np.concatenate([j[to_j], i[to_i]])
+    if len(border):
+        best = np.full(n, n_comp, dtype=np.int64)
+        np.minimum.at(best, border, np.concatenate([labels[i[to_j]], labels[j[to_i]]]))
+        hit = best < n_comp
+        labels[hit] = best[hit]
+    return labels
+
+
 def _cluster(
-    coords: np.ndarray, algo: str, eps: float, min_samples: int, scale: bool
+    coords: np.ndarray,
+    algo: str,
+    eps: float,
+    min_samples: int,
+    scale: bool,
+    n_jobs: int | None = None,
 ) -> np.ndarray:
-    """Cluster *coords* and return integer label array (-1 = noise)."""
+    """Cluster *coords* and return integer label array (-1 = noise).
+
+    DBSCAN runs on a single cKDTree neighbour graph (see
+    :func:`_neighbour_graph_dbscan`).  *n_jobs* is the number of threads
+    for the neighbour search of either algorithm (None = 1, -1 = all cores).
+    """
     X = StandardScaler().fit_transform(coords) if scale else coords
     if algo == "DBSCAN":
-        return DBSCAN(eps=eps, min_samples=min_samples).fit_predict(X)
+        return _neighbour_graph_dbscan(X, eps, min_samples, n_jobs=n_jobs)
     if algo == "OPTICS":
         max_eps = eps if eps > 0 else np.inf
-        return OPTICS(min_samples=min_samples, max_eps=max_eps).fit_predict(X)
+        return OPTICS(min_samples=min_samples, max_eps=max_eps, n_jobs=n_jobs).fit_predict(X)
     raise ValueError(f"Unknown clustering algorithm: {algo!r}")
 
 
@@ -45,7 +162,8 @@ def _global_stats(labels: np.ndarray) -> dict:
         return dict(
             n_clusters=0, avg_size=0.0, max_size=0, noise_frac=1.0, size_std=0.0
         )
-    _, counts = np.unique(cl, return_counts=True)
+    counts = np.bincount(cl)
+    counts = counts[counts > 0]
     return dict(
         n_clusters=int(len(counts)),
         avg_size=float(counts.mean()),
@@ -55,6 +173,60 @@ def _global_stats(labels: np.ndarray) -> dict:
     )
 
 
+def _type_stats(labels: np.ndarray, types: np.ndarray, unique_types: np.ndarray) -> dict:
+    """Per-type and mixed-cluster metrics from a cluster x type contingency table.
+
+    The table holds the number of particles of each type in each cluster and
+    is built with a single ``np.bincount``, so the cost is O(N) however many
+    clusters there are.
+    """
+    n_types = len(unique_types)
+    type_idx = np.searchsorted(unique_types, types)
+    clustered = labels >= 0
+    n_labels = int(labels.max()) + 1 if clustered.any() else 0
+    table = np.bincount(
+        labels[clustered] * n_types + type_idx[clustered], minlength=n_labels * n_types
+    ).reshape(n_labels, n_types)
+    table = table[table.any(axis=1)]
+    type_totals = np.bincount(type_idx, minlength=n_types)
+    type_noise = np.bincount(type_idx[labels == -1], minlength=n_types)
+
+    out: dict = {}
+    for k, t in enumerate(unique_types):
+        sizes = table[:, k][table[:, k] > 0]
+        key = f"type{t}"
+        if len(sizes) == 0:
+            out.update(
+                {
+                    f"{key}_n_clusters": 0,
+                    f"{key}_avg_size": 0.0,
+                    f"{key}_max_size": 0,
+                    f"{key}_noise_frac": 1.0,
+                    f"{key}_size_std": 0.0,
+                }
+            )
+        else:
+            out.update(
+                {
+                    f"{key}_n_clusters": int(len(sizes)),
+                    f"{key}_avg_size": float(sizes.mean()),
+                    f"{key}_max_size": int(sizes.max()),
+                    f"{key}_noise_frac": int(type_noise[k]) / int(type_totals[k]),
+                    f"{key}_size_std": float(sizes.std()),
+                }
+            )
+
+    # Mixed-cluster metrics
+    if len(table):
+        n_types_per_cl = (table > 0).sum(axis=1)
+        out["mixed_cluster_frac"] = int((n_types_per_cl > 1).sum()) / len(table)
+        out["avg_types_per_cluster"] = float(np.mean(n_types_per_cl))
+    else:
+        out["mixed_cluster_frac"] = 0.0
+        out["avg_types_per_cluster"] = 0.0
+    return out
+
+
 def analyse_frame(
     frame,
     algo: str,
@@ -63,6 +235,7 @@ def analyse_frame(
     scale: bool,
     downsample: float = 1.0,
     ratios_only: bool = False,
+    n_jobs: int | None = None,
 ) -> tuple[dict, np.ndarray]:
     """Run clustering on a Frame and return (metrics_dict, labels_array).
 
@@ -74,15 +247,17 @@ def analyse_frame(
         results are reproducible.
     ratios_only : bool
         If True, skip clustering entirely and only compute particle-type ratios.
+    n_jobs : int, optional
+        Threads for the neighbour search inside the clustering call.
     """
     types = frame.raw[:, 0].astype(int)
-    unique_types = np.unique(types)
+    unique_types, counts = np.unique(types, return_counts=True)
     total_particles = len(types)
 
     out: dict = {}
 
     # Pairwise ratios between types (type_i / type_j counts) — no clustering needed
-    type_counts = {int(t): int((types == t).sum()) for t in unique_types}
+    type_counts = dict(zip(unique_types.tolist(), counts.tolist()))
     for t in unique_types:
         out[f"type{t}_ratio"] = float(type_counts[int(t)] / total_particles)
     for i, ti in enumerate(unique_types):
@@ -108,51 +283,148 @@ def analyse_frame(
         coords = coords[keep_mask]
         types = types[keep_mask]
 
-    labels = _cluster(coords, algo, eps, min_samples, scale)
+    labels = _cluster(coords, algo, eps, min_samples, scale, n_jobs=n_jobs)
 
     # Global metrics
     for k, v in _global_stats(labels).items():
         out[f"global_{k}"] = v
 
-    # Per-particle-type cluster metrics
-    for t in unique_types:
-        t_mask = types == t
-        cl_ids = np.unique(labels[t_mask & (labels >= 0)])
-        key = f"type{t}"
-        if len(cl_ids) == 0:
-            out.update(
-                {
-                    f"{key}_n_clusters": 0,
-                    f"{key}_avg_size": 0.0,
-                    f"{key}_max_size": 0,
-                    f"{key}_noise_frac": 1.0,
-                    f"{key}_size_std": 0.0,
-                }
-            )
-        else:
-            sizes = np.array([(t_mask & (labels == c)).sum() for c in cl_ids])
-            n_noise = int((t_mask & (labels == -1)).sum())
-            out.update(
-                {
-                    f"{key}_n_clusters": int(len(cl_ids)),
-                    f"{key}_avg_size": float(sizes.mean()),
-                    f"{key}_max_size": int(sizes.max()),
-                    f"{key}_noise_frac": n_noise / int(t_mask.sum()),
-                    f"{key}_size_std": float(sizes.std()),
-                }
+    # Per-particle-type and mixed-cluster metrics
+    out.update(_type_stats(labels, types, unique_types))
+
+    return out, labels
+
+
+def analyse_xyz_clusters(task: tuple) -> tuple[dict | None, np.ndarray | None]:
+    """Load one XYZ file and cluster its selected frame.
+
+    This is the unit of work for the process pool, so it takes and returns
+    only picklable values.  Files that cannot be loaded or clustered are
+    logged and give ``(None, None)``.
+
+    Parameters
+    ----------
+    task : tuple
+        ``(xyz_path, frame_index, kwargs)``, where *kwargs* are passed on
+        to :func:`analyse_frame`.
+    """
+    xyz_path, frame_idx, kwargs = task
+    xyz_path = Path(xyz_path)
+    try:
+        frames = CrystalCloud.from_file(xyz_path, normalise=False).frames
+    except Exception as e:
+        logger.warning("Failed to load %s: %s", xyz_path.name, e)
+        return None, None
+
+    if len(frames) == 0:
+        logger.warning("No frames found in %s", xyz_path.name)
+        return None, None
+
+    if frame_idx == -1 or frame_idx >= len(frames):
+        frame_idx = len(frames) - 1
+    frame = frames[frame_idx]
+
+    if len(frame.coords) == 0:
+        logger.warning("Empty frame in %s", xyz_path.name)
+        return None, None
+
+    try:
+        return analyse_frame(frame, **kwargs)
+    except Exception as e:
+        logger.warning("Clustering failed for %s: %s", xyz_path.name, e)
+        return None, None
+
+
+def track_xyz_clusters(task: tuple) -> tuple[list[dict] | None, np.ndarray | None]:
+    """Track DBSCAN clusters over every frame of one XYZ movie.
+
+    Frames are clustered incrementally with
+    :func:`~cgaspects.analysis.cluster_tracking.track_frames`, so cluster
+    IDs (the labels) are stable from frame to frame.  With *scale* the
+    StandardScaler is fitted on the last frame and applied to all of them,
+    so distances stay comparable over the movie.
+
+    Parameters
+    ----------
+    task : tuple
+        ``(xyz_path, frame_index, kwargs)`` with *eps*, *min_samples* and
+        *scale* in *kwargs*.
+
+    Returns
+    -------
+    records : list[dict] or None
+        One metrics dict per frame, with ``Frame``, ``n_particles``,
+        ``tracked`` (False where missing or repeated site numbers forced
+        the frame to be clustered on its own), ``n_new_clusters``,
+        ``n_merged_clusters`` and ``largest_cluster_id`` next to the
+        single-frame cluster metrics.
+    labels : np.ndarray or None
+        Track IDs of the particles of frame *frame_index*.
+    """
+    xyz_path, frame_idx, kwargs = task
+    xyz_path = Path(xyz_path)
+    try:
+        frames = CrystalCloud.from_file(xyz_path, normalise=False).frames
+    except Exception as e:
+        logger.warning("Failed to load %s: %s", xyz_path.name, e)
+        return None, None
+
+    if len(frames) == 0:
+        logger.warning("No frames found in %s", xyz_path.name)
+        return None, None
+
+    if frame_idx == -1 or frame_idx >= len(frames):
+        frame_idx = len(frames) - 1
+
+    transform = None
+    if kwargs["scale"] and len(frames[len(frames) - 1].coords):
+        transform = StandardScaler().fit(frames[len(frames) - 1].coords).transform
+
+    records = []
+    frame_labels = None
+    try:
+        for i, labels, update in track_frames(
+            frames, kwargs["eps"], kwargs["min_samples"], transform=transform, name=xyz_path.name
+        ):
+            types = frames[i].raw[:, 0].astype(int)
+            record = {"Frame": i, "n_particles": len(labels), "tracked": update["tracked"]}
+            if len(labels):
+                for k, v in _global_stats(labels).items():
+                    record[f"global_{k}"] = v
+                record.update(_type_stats(labels, types, np.unique(types)))
+            record["n_new_clusters"] = update["n_new_clusters"]
+            record["n_merged_clusters"] = update["n_merged_clusters"]
+            clustered = labels[labels >= 0]
+            record["largest_cluster_id"] = (
+                int(np.bincount(clustered).argmax()) if len(clustered) else -1
             )
+            records.append(record)
+            if i == frame_idx:
+                frame_labels = labels
+    except Exception as e:
+        logger.warning("Cluster tracking failed for %s: %s", xyz_path.name, e)
+        return None, None
 
-    # Mixed-cluster metrics
-    all_cl = np.unique(labels[labels >= 0])
-    if len(all_cl):
-        n_types_per_cl = [len(np.unique(types[labels == c])) for c in all_cl]
-        out["mixed_cluster_frac"] = sum(n > 1 for n in n_types_per_cl) / len(all_cl)
-        out["avg_types_per_cluster"] = float(np.mean(n_types_per_cl))
-    else:
-        out["mixed_cluster_frac"] = 0.0
-        out["avg_types_per_cluster"] = 0.0
+    return records, frame_labels
 
-    return out, labels
+
+def cluster_cache(input_folder: Path, options: cluster_options_tuple) -> ResultCache:
+    """Result cache for per-file cluster metrics and labels under *options*."""
+    cache_options = options._asdict()
+    cache_options.pop("n_workers")
+    # Version 2: frame-series records carry the ``tracked`` flag
+    return ResultCache.for_input_folder(input_folder, "clusters", cache_options, version=2)
+
+
+def cluster_output_folder(
+    input_folder: Path, xyz_files: list, information, cache: ResultCache
+) -> Path:
+    """Output folder of a cluster run; unchanged inputs and options reuse the previous one."""
+    summary_file = information.summary_file if information is not None else None
+    summary = None
+    if summary_file and Path(summary_file).is_file():
+        summary = cache.digest(summary_file)
+    return cache.output_folder(input_folder, xyz_files, extra=[summary])
 
 
 def run_cluster_analysis(
@@ -161,69 +433,106 @@ def run_cluster_analysis(
     options: cluster_options_tuple,
     output_folder: Path,
     signals=None,
+    cache=None,
 ) -> tuple[Path | None, dict]:
     """
     Run cluster analysis on all XYZ files.
 
+    With ``options.n_workers > 1`` the files are clustered on a process pool,
+    one file per task; otherwise they are clustered one after another with
+    the neighbour search of each clustering call spread over
+    ``options.n_workers`` threads.  Results are kept in file order either way.
+
+    With ``options.frame_series`` every frame is clustered (see
+    :func:`track_xyz_clusters`) and the CSV holds one row per frame.
+
+    With a *cache* (see :func:`cluster_cache`) files already clustered with
+    the same options are not clustered again.
+
     Returns
     -------
     csv_path : Path
-        Path to the saved cluster_analysis.csv
+        Path to the saved cluster_analysis.csv (cluster_time_series.csv in
+        frame-series mode)
     labels_cache : dict[str, np.ndarray]
         Mapping from str(xyz_path) → per-particle label array for the analysed frame.
     """
-    records = []
-    labels_cache: dict[str, np.ndarray] = {}
     total = len(xyz_files)
+    n_workers = max(1, options.n_workers)
+    cancel_flag = signals.cancel_flag if signals is not None else None
+    frame_series = options.frame_series and not options.ratios_only
+    worker = track_xyz_clusters if frame_series else analyse_xyz_clusters
+    results: list[tuple[dict | None, np.ndarray | None]] = [(None, None)] * total
+
+    def task(xyz_path, n_jobs):
+        kwargs = dict(
+            algo=options.algorithm,
+            eps=options.eps,
+            min_samples=options.min_samples,
+            scale=options.scale,
+            downsample=options.downsample,
+            ratios_only=options.ratios_only,
+            n_jobs=n_jobs,
+        )
+        return xyz_path, options.frame_index, kwargs
 
-    for i, xyz_path in enumerate(xyz_files):
-        if signals is not None and signals.cancel_flag.is_set():
+    def report(n_done):
+        if signals is not None:
+            signals.progress.emit(int(n_done / total * 80))
+
+    # Files clustered before with the same options come from the cache
+    todo = list(range(total))
+    if cache is not None:
+        todo = []
+        for i, xyz_path in enumerate(xyz_files):
+            cached = cache.get(xyz_path)
+            if cached is None:
+                todo.append(i)
+            else:
+                results[i] = (cached[0], cached[1]["labels"])
+        logger.info("%d / %d XYZ files found in the result cache", total - len(todo), total)
+
+    def store(i, result):
+        results[i] = result
+        metrics, labels = result
+        if cache is not None and metrics is not None:
+            cache.put(xyz_files[i], metrics, {"labels": labels})
+
+    n_done = total - len(todo)
+    if n_workers > 1 and len(todo) > 1:
+        logger.info("Clustering %d files on %d worker processes", len(todo), n_workers)
+        tasks = [task(xyz_files[i], 1) for i in todo]
+        for k, result in iter_process_pool(worker, tasks, n_workers, cancel_flag=cancel_flag):
+            store(todo[k], result)
+            n_done += 1
+            report(n_done)
+        if cancel_flag is not None and cancel_flag.is_set():
             logger.info(
-                "Cluster analysis cancelled after %d / %d files processed.", i, total
+                "Cluster analysis cancelled after %d / %d files processed.", n_done, total
             )
             signals.cancelled.emit()
             return None, {}
-        xyz_path = Path(xyz_path)
-        try:
-            frames = CrystalCloud.parse_xyz_file(xyz_path)
-        except Exception as e:
-            logger.warning("Failed to load %s: %s", xyz_path.name, e)
-            continue
-
-        if len(frames) == 0:
-            logger.warning("No frames found in %s", xyz_path.name)
-            continue
-
-        frame_idx = options.frame_index
-        if frame_idx == -1 or frame_idx >= len(frames):
-            frame_idx = len(frames) - 1
-        frame = frames[frame_idx]
-
-        if len(frame.coords) == 0:
-            logger.warning("Empty frame in %s", xyz_path.name)
-            continue
+    else:
+        for i in todo:
+            if cancel_flag is not None and cancel_flag.is_set():
+                logger.info(
+                    "Cluster analysis cancelled after %d / %d files processed.", n_done, total
+                )
+                signals.cancelled.emit()
+                return None, {}
+            store(i, worker(task(xyz_files[i], n_workers)))
+            n_done += 1
+            report(n_done)
 
-        try:
-            metrics, labels = analyse_frame(
-                frame,
-                algo=options.algorithm,
-                eps=options.eps,
-                min_samples=options.min_samples,
-                scale=options.scale,
-                downsample=options.downsample,
-                ratios_only=options.ratios_only,
-            )
-        except Exception as e:
-            logger.warning("Clustering failed for %s: %s", xyz_path.name, e)
+    records = []
+    labels_cache: dict[str, np.ndarray] = {}
+    for i, (xyz_path, (metrics, labels)) in enumerate(zip(xyz_files, results)):
+        if metrics is None:
             continue
-
-        metrics["Simulation Number"] = i + 1
-        records.append(metrics)
-        labels_cache[str(xyz_path)] = labels
-
-        if signals is not None:
-            progress = int((i + 1) / total * 80)
-            signals.progress.emit(progress)
+        for record in metrics if frame_series else [metrics]:
+            record["Simulation Number"] = i + 1
+            records.append(record)
+        labels_cache[str(Path(xyz_path))] = labels
 
     if not records:
         raise RuntimeError("No XYZ files could be clustered.")
@@ -253,7 +562,8 @@ def run_cluster_analysis(
     if signals is not None:
         signals.progress.emit(95)
 
-    csv_path = output_folder / "cluster_analysis.csv"
+    csv_name = "cluster_time_series.csv" if frame_series else "cluster_analysis.csv"
+    csv_path = output_folder / csv_name
     cluster_df.to_csv(csv_path, index=False)
     logger.info("Cluster analysis CSV saved: %s", csv_path)
 
@@ -317,10 +627,6 @@ class ClusterAnalysis:
             return
         self.options = dialog.get_options()
 
-        if self.output_folder is None:
-            self.output_folder = create_aspects_folder(self.input_folder)
-            self.signals.location.emit(self.output_folder)
-
         if self.threadpool:
             self.worker = WorkerClusters(
                 information=self.information,
@@ -347,17 +653,21 @@ class ClusterAnalysis:
             self.run_on_same_thread()
 
     def run_on_same_thread(self):
-        if self.output_folder is None:
-            self.output_folder = create_aspects_folder(self.input_folder)
-            self.signals.location.emit(self.output_folder)
         try:
-            csv_path, labels_cache = run_cluster_analysis(
-                xyz_files=self.xyz_files,
-                information=self.information,
-                options=self.options,
-                output_folder=self.output_folder,
-                signals=self.signals,
-            )
+            with cluster_cache(self.input_folder, self.options) as cache:
+                self.get_location(
+                    cluster_output_folder(
+                        self.input_folder, self.xyz_files, self.information, cache
+                    )
+                )
+                csv_path, labels_cache = run_cluster_analysis(
+                    xyz_files=self.xyz_files,
+                    information=self.information,
+                    options=self.options,
+                    output_folder=self.output_folder,
+                    signals=self.signals,
+                    cache=cache,
+                )
             self.set_plotting((csv_path, labels_cache))
         except Exception as e:
             logger.error("Cluster analysis failed: %s", e)
@@ -0,0 +1,288 @@
+"""Incremental DBSCAN cluster tracking across the frames of a growth movie."""
+
+import logging
+
+import numpy as np
+from scipy.sparse import coo_array
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+logger = logging.getLogger("CA:ClusterTracking")
+
+# IDs are looked up in a dense table while the largest ID stays below
+# this many entries per tracked particle (plus a fixed allowance)
+_LOOKUP_PER_PARTICLE = 64
+_LOOKUP_MIN_SIZE = 1 << 20
+
+
+class ClusterTracker:
+    """Persistent DBSCAN clustering of a growing set of particles.
+
+    Particles are added frame by frame; only the newly added ones are
+    queried for neighbours.  Neighbour counts only grow as particles are
+    added, so points only ever become core points and clusters only ever
+    merge.  The core points are therefore kept in a union-find forest
+    (``parent``, kept flat so every entry points straight at its root),
+    and the neighbour pairs that do not yet join two core points are kept
+    until they do or are needed to attach border points.
+
+    Every cluster carries a track ID that is stable over time: a new
+    cluster gets the next unused ID, and when clusters merge the result
+    keeps the oldest (lowest) ID.  Border points take the lowest ID among
+    their neighbouring clusters, as in DBSCAN.
+
+    Parameters
+    ----------
+    eps : float
+        Neighbourhood radius.
+    min_samples : int
+        Neighbours (including the point itself) needed for a core point.
+    """
+
+    def __init__(self, eps: float, min_samples: int):
+        self.eps = eps
+        self.min_samples = min_samples
+        self.next_id = 0
+        self.reset()
+
+    def reset(self):
+        """Forget all particles; track IDs issued so far are not reused."""
+        self.ids = np.empty(0, dtype=np.int64)
+        self.coords = np.empty((0, 3))
+        self.n_neighbours = np.empty(0, dtype=np.int64)
+        self.core = np.empty(0, dtype=bool)
+        self.parent = np.empty(0, dtype=np.int64)
+        self.track_id = np.empty(0, dtype=np.int64)
+        self.pending = np.empty((0, 2), dtype=np.int64)
+        # Tracker index by ID: a dense table for compact non-negative IDs
+        # (CrystalGrower site numbers), otherwise a sorted copy of the IDs
+        self._lookup = np.empty(0, dtype=np.int64)
+        self._sorted = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def positions(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Tracker index of each of *ids*, and a mask of those already tracked."""
+        ids = np.asarray(ids, dtype=np.int64)
+        if self._sorted is None:
+            pos = np.full(len(ids), -1, dtype=np.int64)
+            inside = (ids >= 0) & (ids < len(self._lookup))
+            pos[inside] = self._lookup[ids[inside]]
+            return pos, pos >= 0
+
+        order, sorted_ids = self._sorted
+        if len(sorted_ids) == 0:
+            return np.full(len(ids), -1, dtype=np.int64), np.zeros(len(ids), dtype=bool)
+        found = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        known = sorted_ids[found] == ids
+        return np.where(known, order[found], -1), known
+
+    def _index_ids(self, n_old: int):
+        """Add the IDs from *n_old* onwards to the ID lookup."""
+        new_ids = self.ids[n_old:]
+        if self._sorted is None and len(new_ids):
+            limit = _LOOKUP_PER_PARTICLE * len(self.ids) + _LOOKUP_MIN_SIZE
+            if new_ids.min() >= 0 and new_ids.max() < limit:
+                if new_ids.max() >= len(self._lookup):
+                    grown = np.full(max(int(new_ids.max()) + 1, 2 * len(self._lookup)), -1)
+                    grown[: len(self._lookup)] = self._lookup
+                    self._lookup = grown
+                self._lookup[new_ids] = np.arange(n_old, len(self.ids))
+                return
+            self._lookup = np.empty(0, dtype=np.int64)
+            self._sorted = ()
+        if self._sorted is not None:
+            order = np.argsort(self.ids, kind="stable")
+            self._sorted = (order, self.ids[order])
+
+    def add(self, coords: np.ndarray, ids: np.ndarray) -> dict:
+        """Insert new particles and update the clusters.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            ``(n, 3)`` coordinates of the new particles.
+        ids : np.ndarray
+            Unique identifiers of the new particles (not already tracked).
+
+        Returns
+        -------
+        dict
+            ``n_new_clusters`` and ``n_merged_clusters`` for this update.
+        """
+        n_old = len(self.ids)
+        n_new = len(ids)
+        ids = np.asarray(ids, dtype=np.int64)
+        self.ids = np.concatenate([self.ids, ids])
+        self.coords = np.concatenate([self.coords, np.asarray(coords, dtype=float)])
+        self.n_neighbours = np.concatenate([self.n_neighbours, np.ones(n_new, np.int64)])
+        self.core = np.concatenate([self.core, np.zeros(n_new, bool)])
+        self.parent = np.concatenate([self.parent, np.arange(n_old, n_old + n_new)])
+        self.track_id = np.concatenate([self.track_id, np.full(n_new, -1, np.int64)])
+        self._index_ids(n_old)
+        if n_new == 0:
+            return dict(n_new_clusters=0, n_merged_clusters=0)
+
+        # Pairs between the new particles and every tracked particle; the
+        # tree over all particles is rebuilt each update, so it is built
+        # quickly rather than balanced
+        everything = cKDTree(self.coords, balanced_tree=False, compact_nodes=False)
+        found = cKDTree(self.coords[n_old:]).sparse_distance_matrix(
+            everything, self.eps, output_type="ndarray"
+        )
+        i = found["i"] + n_old
+        j = found["j"]
+        keep = (j < n_old) | (j > i)
+        pairs = np.column_stack([i[keep], j[keep]])
+        self.n_neighbours += np.bincount(pairs.ravel(), minlength=len(self.ids))
+        self.core = self.n_neighbours >= self.min_samples
+
+        pairs = np.concatenate([self.pending, pairs])
+        joins = self.core[pairs[:, 0]] & self.core[pairs[:, 1]]
+        self.pending = pairs[~joins]
+
+        n_ids = self.next_id
+        n_merged = self._union(pairs[joins])
+
+        # Clusters with no track ID yet are new
+        roots = np.flatnonzero(
+            self.core & (self.parent == np.arange(len(self.parent))) & (self.track_id < 0)
+        )
+        self.track_id[roots] = np.arange(self.next_id, self.next_id + len(roots))
+        self.next_id += len(roots)
+        return dict(n_new_clusters=self.next_id - n_ids, n_merged_clusters=n_merged)
+
+    def _union(self, edges: np.ndarray) -> int:
+        """Merge the clusters joined by *edges*; return how many tracked clusters vanished."""
+        if len(edges) == 0:
+            return 0
+        a = self.parent[edges[:, 0]]
+        b = self.parent[edges[:, 1]]
+        roots = np.sort(np.concatenate([a, b]))
+        roots = roots[np.concatenate([[True], roots[1:] != roots[:-1]])]
+        n_roots = len(roots)
+        graph = coo_array(
+            (
+                np.ones(len(a), dtype=bool),
+                (np.searchsorted(roots, a), np.searchsorted(roots, b)),
+            ),
+            shape=(n_roots, n_roots),
+        )
+        n_comp, comp = connected_components(graph, directed=False)
+
+        # Each component keeps the root with the oldest track ID; untracked
+        # roots sort after all tracked ones, by index
+        ids = self.track_id[roots]
+        rank = np.where(ids >= 0, ids, self.next_id + roots)
+        order = np.lexsort((rank, comp))
+        first = np.ones(n_roots, dtype=bool)
+        first[1:] = comp[order][1:] != comp[order][:-1]
+        keeper = np.empty(n_comp, dtype=np.int64)
+        keeper[comp[order][first]] = roots[order][first]
+
+        tracked = ids >= 0
+        n_tracked = np.bincount(comp[tracked], minlength=n_comp)
+        n_merged = int(np.maximum(n_tracked - 1, 0).sum())
+
+        remap = np.arange(len(self.parent))
+        remap[roots] = keeper[comp]
+        self.parent = remap[self.parent]
+        return n_merged
+
+    def labels(self) -> np.ndarray:
+        """Track ID of every particle (in insertion order), -1 for noise."""
+        labels = np.full(len(self.ids), -1, dtype=np.int64)
+        labels[self.core] = self.track_id[self.parent[self.core]]
+
+        i, j = self.pending[:, 0], self.pending[:, 1]
+        to_j = self.core[i] & ~self.core[j]
+        to_i = self.core[j] & ~self.core[i]
+        border = np.concatenate([j[to_j], i[to_i]])
+        if len(border):
+            best = np.full(len(labels), self.next_id, dtype=np.int64)
+            np.minimum.at(best, border, np.concatenate([labels[i[to_j]], labels[j[to_i]]]))
+            hit = best < self.next_id
+            labels[hit] = best[hit]
+        return labels
+
+
+def track_frames(
+    frames,
+    eps: float,
+    min_samples: int,
+    id_column: int = 6,
+    transform=None,
+    name: str = "movie",
+):
+    """Yield ``(frame_index, labels, update)`` for every frame of a movie.
+
+    Particles are matched between frames by the *id_column* of the raw
+    frame data (the CrystalGrower site number).  A frame that is missing
+    particles of the previous frame (dissolution), or that has no usable
+    ID column, restarts the tracker from that frame; track IDs issued
+    before are not reused.  Frames without usable IDs (missing or
+    repeated) are clustered on their own, flagged with ``tracked`` False,
+    and logged once per movie as *name*.
+
+    Parameters
+    ----------
+    frames : Iterable[Frame]
+        Frames of one movie, in order.
+    transform : callable, optional
+        Applied to each frame's coordinates before clustering.
+
+    Yields
+    ------
+    tuple
+        Frame index, per-particle track IDs in the frame's row order, and
+        the ``update`` dict of :meth:`ClusterTracker.add` with
+        ``restarted`` and ``tracked`` flags.
+    """
+    tracker = ClusterTracker(eps, min_samples)
+    warned = False
+    for frame_idx, frame in enumerate(frames):
+        coords = frame.coords if len(frame.raw) else np.empty((0, 3))
+        if transform is not None and len(coords):
+            coords = transform(coords)
+
+        ids = None
+        if frame.raw.ndim == 2 and frame.raw.shape[1] > id_column:
+            ids = frame.raw[:, id_column].astype(np.int64)
+            sorted_ids = np.sort(ids)
+            if len(ids) > 1 and (sorted_ids[1:] == sorted_ids[:-1]).any():
+                ids = None
+
+        # Empty frames have nothing to track
+        tracked = ids is not None or len(coords) == 0
+        restarted = False
+        if ids is None:
+            if not tracked and not warned:
+                logger.warning(
+                    "%s has no unique site numbers (column %d) from frame %d; "
+                    "clustering those frames independently, without tracking",
+                    name,
+                    id_column,
+                    frame_idx,
+                )
+                warned = True
+            restarted = len(tracker) > 0
+            tracker.reset()
+            ids = np.arange(len(coords))
+            pos = np.empty(len(ids), dtype=np.int64)
+            new = np.ones(len(ids), dtype=bool)
+        else:
+            pos, known = tracker.positions(ids)
+            if int(known.sum()) < len(tracker):
+                logger.debug("Frame %d lost particles; restarting cluster tracking", frame_idx)
+                restarted = True
+                tracker.reset()
+                known[:] = False
+            new = ~known
+
+        n_old = len(tracker)
+        update = tracker.add(coords[new], ids[new])
+        update["restarted"] = restarted
+        update["tracked"] = tracked
+        pos[new] = np.arange(n_old, len(tracker))
+        yield frame_idx, tracker.labels()[pos], update
@@ -1,12 +1,18 @@
 import logging
 import re
-from typing import List
+from functools import partial
+from typing import List, NamedTuple, Optional
 from pathlib import Path
 import numpy as np
 import pandas as pd
 
+from ..utils.parallel import chunk, iter_process_pool
+
 logger = logging.getLogger("CA:GR-Dataframes")
 
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 200
+
 
 def get_x_axis(df: pd.DataFrame, *, time_col: str = "time", tol: float = 1e-12):
     """Return a suitable x-axis for growth-rate fitting.
@@ -28,6 +34,146 @@ def get_x_axis(df: pd.DataFrame, *, time_col: str = "time", tol: float = 1e-12):
     return x_time
 
 
+def _time_is_valid(x_time: Optional[np.ndarray], tol: float = 1e-12) -> bool:
+    return (
+        x_time is not None
+        and len(x_time) >= 2
+        and np.isfinite(x_time).all()
+        and np.ptp(x_time) >= tol
+    )
+
+
+class SizeSeries(NamedTuple):
+    """The columns of one size.csv file needed for growth-rate fitting."""
+
+    time: Optional[np.ndarray]
+    sizes: Optional[np.ndarray]
+    missing: List[str]
+
+
+def read_size_file(path, directions: List[str], time_col: str = "time") -> SizeSeries:
+    """Read only the time and direction columns of a size file.
+
+    ``sizes`` is an ``(n_rows, n_directions)`` array, or ``None`` when any
+    direction is missing (listed in ``missing``).  ``time`` is ``None`` when
+    the file has no time column.
+    """
+    wanted = set(directions) | {time_col}
+    lt_df = pd.read_csv(
+        path, encoding="utf-8", encoding_errors="replace", usecols=lambda c: c in wanted
+    )
+
+    columns = lt_df.columns
+    missing = [d for d in directions if d not in columns]
+    # One conversion of the (already column-filtered) frame, then positional slicing
+    values = lt_df.to_numpy(dtype=float)
+    sizes = None if missing else values[:, columns.get_indexer(directions)]
+    time = values[:, columns.get_loc(time_col)] if time_col in columns else None
+    return SizeSeries(time=time, sizes=sizes, missing=missing)
+
+
+def read_size_batch(paths, directions: List[str], time_col: str = "time") -> List[SizeSeries]:
+    """Process-pool entry point: read each size file in *paths*."""
+    return [read_size_file(path, directions, time_col) for path in paths]
+
+
+def fit_slopes(x_data: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Least-squares slope of every column of *sizes* against *x_data*.
+
+    Only rows before the first row where any direction is non-positive are
+    used.  The slopes for all directions come from one closed-form solve;
+    fewer than two usable rows (or a constant x) give zero slopes.
+    """
+    all_positive = np.all(sizes > 0, axis=1)
+    cutoff = len(all_positive) if all_positive.all() else int(np.argmin(all_positive))
+    if cutoff < 2:
+        return np.zeros(sizes.shape[1])
+
+    x = x_data[:cutoff]
+    y = sizes[:cutoff]
+    dx = x - x.mean()
+    sxx = dx @ dx
+    if sxx == 0:
+        return np.zeros(sizes.shape[1])
+    return dx @ (y - y.mean(axis=0)) / sxx
+
+
+def _cached_series(cache, path) -> Optional[SizeSeries]:
+    cached = cache.get(path)
+    if cached is None:
+        return None
+    missing, arrays = cached
+    return SizeSeries(time=arrays.get("time"), sizes=arrays.get("sizes"), missing=missing)
+
+
+def _cache_series(cache, path, series: SizeSeries) -> None:
+    arrays = {name: getattr(series, name) for name in ("time", "sizes")}
+    cache.put(path, series.missing, {k: v for k, v in arrays.items() if v is not None})
+
+
+def _read_size_files(size_file_list, directions, signals=None, n_workers: int = 1, cache=None):
+    """Read every size file once; returns ``None`` if cancelled.
+
+    Files found in *cache* (a ResultCache keyed on *directions*) are not
+    read again; files that are read are added to it.
+    """
+    n_size_files = len(size_file_list)
+    cancel_flag = signals.cancel_flag if signals is not None else None
+
+    series: List[Optional[SizeSeries]] = [None] * n_size_files
+    todo = list(range(n_size_files))
+    if cache is not None:
+        todo = []
+        for i, f in enumerate(size_file_list):
+            series[i] = _cached_series(cache, f)
+            if series[i] is None:
+                todo.append(i)
+        logger.info(
+            "%d / %d size files found in the result cache", n_size_files - len(todo), n_size_files
+        )
+
+    def store(i, size_series):
+        series[i] = size_series
+        if cache is not None:
+            _cache_series(cache, size_file_list[i], size_series)
+
+    n_done = n_size_files - len(todo)
+    if n_workers > 1 and len(todo) >= PARALLEL_MIN_FILES:
+        batches = chunk(todo, n_workers)
+        for batch_idx, batch_series in iter_process_pool(
+            partial(read_size_batch, directions=directions),
+            [[Path(size_file_list[i]) for i in batch] for batch in batches],
+            n_workers,
+            cancel_flag=cancel_flag,
+        ):
+            for i, size_series in zip(batches[batch_idx], batch_series):
+                store(i, size_series)
+            n_done += len(batch_series)
+            if signals:
+                signals.progress.emit((100 * n_done) // n_size_files)
+
+        if cancel_flag is not None and cancel_flag.is_set():
+            logger.info(
+                "Growth rate analysis cancelled after %d / %d files.", n_done, n_size_files
+            )
+            signals.cancelled.emit()
+            return None
+        return series
+
+    for i in todo:
+        if cancel_flag is not None and cancel_flag.is_set():
+            logger.info(
+                "Growth rate analysis cancelled after %d / %d files.", n_done, n_size_files
+            )
+            signals.cancelled.emit()
+            return None
+        store(i, read_size_file(Path(size_file_list[i]), directions))
+        n_done += 1
+        if signals:
+            signals.progress.emit((100 * n_done) // n_size_files)
+    return series
+
+
 def build_growthrates(
     size_file_list: List[str | Path],
     supersat_list: List[float],
@@ -35,9 +181,15 @@ def build_growthrates(
     signals=None,
     time_tol: float = 1e-12,
     xaxis_mode: str = "auto",
+    n_workers: int = 1,
+    cache=None,
 ):
     """Generate the growth rate dataframe from size.csv files.
 
+    Every file is read once (on a process pool when ``n_workers > 1`` and
+    there are enough files); the x-axis is then chosen from the time columns
+    already in memory and all direction slopes of a file are fitted together.
+
     Parameters
     ----------
     xaxis_mode : str
@@ -47,6 +199,12 @@ def build_growthrates(
         - ``"time"``  – always use the time column; files without a
           valid time column are skipped.
         - ``"index"`` – always use row index, ignoring any time column.
+    n_workers : int
+        Number of worker processes used to read the size files.
+    cache : ResultCache, optional
+        Cache of the time and direction columns of each size file, built
+        with the same *directions*.  The x-axis is chosen after reading, so
+        one cache entry serves every *xaxis_mode*.
     """
     n_size_files = len(size_file_list)
 
@@ -63,109 +221,56 @@ def build_growthrates(
     logger.info("X-axis mode: %s", xaxis_mode)
     logger.info("Directions: %s", directions)
 
-    growth_list = []
-    kept_supersats = []
+    all_series = _read_size_files(size_file_list, directions, signals, n_workers, cache)
+    if all_series is None:
+        return None
 
-    # In "index" mode we never look at the time column
+    usable = []
+    for i, (f, series) in enumerate(zip(size_file_list, all_series)):
+        if series.missing:
+            logger.warning(
+                "Skipping file %s: missing direction columns %s",
+                Path(f).name,
+                series.missing,
+            )
+            continue
+        usable.append(i)
+
+    # Pre-scan: in auto mode a single file without a valid time column
+    # switches every file to the row index
     use_index_for_all = xaxis_mode == "index"
-    restart = True
+    if xaxis_mode == "auto":
+        for i in usable:
+            if not _time_is_valid(all_series[i].time, time_tol):
+                logger.info(
+                    "Time column missing or unsuitable in file %s - using index for all files",
+                    Path(size_file_list[i]).name,
+                )
+                use_index_for_all = True
+                break
 
-    while restart:
-        restart = False
-        growth_list = []
-        kept_supersats = []
+    growth_list = []
+    kept_supersats = []
+    for i in usable:
+        f = Path(size_file_list[i])
+        series = all_series[i]
 
-        for i, f in enumerate(size_file_list):
-            if signals is not None and signals.cancel_flag.is_set():
-                logger.info("Growth rate analysis cancelled after %d / %d files.", i, n_size_files)
-                signals.cancelled.emit()
-                return None
-            f = Path(f)
-            lt_df = pd.read_csv(f, encoding="utf-8", encoding_errors="replace")
-
-            missing_directions = [d for d in directions if d not in lt_df.columns]
-            if missing_directions:
-                logger.warning(
-                    "Skipping file %s: missing direction columns %s",
-                    f.name,
-                    missing_directions,
-                )
-                continue
-
-            # Determine x-axis data
-            if use_index_for_all:
-                x_data = np.arange(len(lt_df), dtype=float)
-            else:
-                # Check if time column is suitable
-                time_col = "time"
-                if time_col not in lt_df.columns:
-                    if xaxis_mode == "time":
-                        logger.warning(
-                            "Skipping file %s: time column not found (forced time mode)",
-                            f.name,
-                        )
-                        continue
-                    # auto mode: fall back to index for all files
-                    logger.info(
-                        "Time column missing in file %s - restarting with index for all files",
-                        f.name,
-                    )
-                    use_index_for_all = True
-                    restart = True
-                    break
-                else:
-                    x_time = lt_df[time_col].to_numpy(dtype=float)
-                    if (
-                        not np.isfinite(x_time).all()
-                        or len(x_time) < 2
-                        or np.ptp(x_time) < time_tol
-                    ):
-                        if xaxis_mode == "time":
-                            logger.warning(
-                                "Skipping file %s: time column unsuitable (forced time mode)",
-                                f.name,
-                            )
-                            continue
-                        # auto mode: fall back to index for all files
-                        logger.info(
-                            "Time column unsuitable in file %s - restarting with index for all files",
-                            f.name,
-                        )
-                        use_index_for_all = True
-                        restart = True
-                        break
-                    else:
-                        x_data = x_time
-
-            tokens = re.findall(r"\d+", f.name)
-            sim_num = int(tokens[-1])
-
-            # Keep rows only up to the first row where any direction is 0
-            all_positive = np.all(
-                [np.asarray(lt_df[d], dtype=float) > 0 for d in directions],
-                axis=0,
+        if use_index_for_all:
+            x_data = np.arange(len(series.sizes), dtype=float)
+        elif _time_is_valid(series.time, time_tol):
+            x_data = series.time
+        else:
+            logger.warning(
+                "Skipping file %s: time column missing or unsuitable (forced time mode)",
+                f.name,
             )
-            first_false = np.argmin(all_positive)
-            # If all True, argmin returns 0 — check if the first element is actually True
-            cutoff = first_false if not all_positive[first_false] else len(all_positive)
-            mask = np.zeros(len(all_positive), dtype=bool)
-            mask[:cutoff] = True
-
-            gr_list = [sim_num]
-            for direction in directions:
-                y_data = np.asarray(lt_df[direction], dtype=float)
-                if mask.sum() < 2:
-                    gr_list.append(0.0)
-                    continue
-                model = np.polyfit(x_data[mask], y_data[mask], 1)
-                gr_list.append(model[0])
-
-            growth_list.append(gr_list)
-            kept_supersats.append(supersat_list[i])
+            continue
 
-            if signals:
-                prog = (100 * (i + 1)) // n_size_files
-                signals.progress.emit(prog)
+        tokens = re.findall(r"\d+", f.name)
+        sim_num = int(tokens[-1])
+
+        growth_list.append([sim_num, *fit_slopes(x_data, series.sizes)])
+        kept_supersats.append(supersat_list[i])
 
     if not growth_list:
         logger.warning("No files were processed successfully")
@@ -7,10 +7,11 @@ from PySide6.QtWidgets import QDialog
 
 from ..fileio import find_data as fd
 from ..fileio.find_data import apply_supersat_mode, summary_has_starting_delmu
+from ..fileio.result_cache import ResultCache
 from ..gui.dialogs.growthrate_dialog import GrowthRateAnalysisDialogue
 from ..utils.data_structures import results_tuple
 from . import gr_dataframes as gr
-from .gui_threads import WorkerGrowthRates
+from .gui_threads import WorkerGrowthRates, growth_rates_output_folder
 
 logger = logging.getLogger("CA:G-Rates")
 
@@ -84,8 +85,11 @@ class GrowthRate:
         self.xaxis_mode = growth_rate_dialog.xaxis_mode
         self.supersat_mode = growth_rate_dialog.supersat_mode
 
-        self.output_folder = fd.create_aspects_folder(self.input_folder)
-        self.signals.location.emit(self.output_folder)
+        # Size files are cached by content; unchanged inputs and options
+        # reuse the previous run's output folder (looked up by the worker)
+        cache = ResultCache.for_input_folder(
+            self.input_folder, "growth_rates", {"directions": self.selected_directions}
+        )
         # self.circular_progress = CircularProgress(calc_type="Growth Rates")
         # self.circular_progress.show()
         # self.circular_progress.raise_()
@@ -93,12 +97,19 @@ class GrowthRate:
         # self.circular_progress.update_text(f"Calculating...\nFor Directions:\n{directions_text}")
 
         if not self.threadpool:
+            self.get_location(
+                growth_rates_output_folder(
+                    self.input_folder, self.information, self.xaxis_mode, self.supersat_mode, cache
+                )
+            )
             growth_rate_df = gr.build_growthrates(
                 size_file_list=self.information.size_files,
                 supersat_list=self.information.supersats,
                 directions=self.selected_directions,
                 xaxis_mode=self.xaxis_mode,
+                cache=cache,
             )
+            cache.flush()
             if growth_rate_df is not None and not growth_rate_df.empty:
                 if self.information.summary_file:
                     logger.info("Merging growth rates with summary file: %s", self.information.summary_file)
@@ -110,12 +121,15 @@ class GrowthRate:
             self.plot(plotting_csv=growth_rate_df)
         if self.threadpool:
             self.worker = WorkerGrowthRates(
+                input_folder=self.input_folder,
                 information=self.information,
                 selected_directions=self.selected_directions,
                 xaxis_mode=self.xaxis_mode,
                 supersat_mode=self.supersat_mode,
+                cache=cache,
             )
-            
+
+            self.worker.signals.location.connect(self.get_location, Qt.QueuedConnection)
             self.worker.signals.progress.connect(self.update_progress, Qt.QueuedConnection)
             self.worker.signals.result.connect(self.plot, Qt.QueuedConnection)
             self.worker.signals.cancelled.connect(self.signals.finished.emit, Qt.QueuedConnection)
@@ -123,6 +137,10 @@ class GrowthRate:
             self.signals.started.emit()
             self.threadpool.start(self.worker)
 
+    def get_location(self, location):
+        self.output_folder = location
+        self.signals.location.emit(location)
+
     def plot(self, plotting_csv):
         # self.circular_progress.hide()
         if plotting_csv is None:
@@ -1,4 +1,5 @@
 import functools
+import itertools
 import logging
 import threading
 from pathlib import Path
@@ -7,6 +8,7 @@ from typing import NamedTuple
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
 from .ar_dataframes import (
+    ar_cache_options,
     collect_all,
     get_xyz_shape_percentage,
     build_cda,
@@ -20,7 +22,15 @@ from ..fileio.find_data import (
     create_aspects_folder,
     combine_xyz_cda,
 )
+from ..fileio.result_cache import ResultCache
+from ..fileio.site_results import (
+    SITE_RESULTS_JSON_NAME,
+    SITE_RESULTS_NAME,
+    SiteResultsWriter,
+    export_site_results_json,
+)
 from .shape_analysis import ShapeAnalyser
+from ..utils.parallel import default_worker_count, iter_process_pool
 
 logger = logging.getLogger("CA:Threads")
 
@@ -127,7 +137,22 @@ class WorkerAspectRatios(CancellableRunnable):
 
     @emit_error_on_exception
     def run(self):
-        self.output_folder = create_aspects_folder(self.input_folder)
+        cache = None
+        if self.options.selected_ar and self.xyz_files:
+            # Unchanged inputs and options reuse the previous run's output folder
+            # Version 2: cached rows no longer hold the simulation number
+            cache = ResultCache.for_input_folder(
+                self.input_folder, "aspect_ratios", ar_cache_options(), version=2
+            )
+            options = self.options._asdict()
+            options.pop("n_workers", None)
+            summary_file = self.information.summary_file
+            summary = cache.digest(summary_file) if summary_file else None
+            self.output_folder = cache.output_folder(
+                self.input_folder, self.xyz_files, extra=[options, summary]
+            )
+        else:
+            self.output_folder = create_aspects_folder(self.input_folder)
         self.signals.location.emit(self.output_folder)
         summary_file = self.information.summary_file
         folders = self.information.folders
@@ -145,8 +170,14 @@ class WorkerAspectRatios(CancellableRunnable):
 
         if self.options.selected_ar:
             xyz_df = collect_all(
-                folder=self.input_folder, xyz_files=self.xyz_files, signals=self.signals
+                folder=self.input_folder,
+                xyz_files=self.xyz_files,
+                signals=self.signals,
+                n_workers=self.options.n_workers,
+                cache=cache,
             )
+            if cache is not None:
+                cache.flush()
             if xyz_df is None:
                 # cancelled signal already emitted from inside collect_all
                 self.signals.finished.emit()
@@ -212,23 +243,69 @@ class WorkerAspectRatios(CancellableRunnable):
         self.signals.result.emit(self.plotting_csv)
 
 
+def growth_rates_output_folder(
+    input_folder: Path, information, xaxis_mode, supersat_mode, cache=None
+) -> Path:
+    """Output folder of a growth-rate run.
+
+    With a *cache*, unchanged inputs and options reuse the previous run's
+    folder; this hashes every size file on the first run, so call it from
+    the worker rather than the GUI thread.
+    """
+    if cache is None:
+        return create_aspects_folder(input_folder)
+    summary_file = information.summary_file
+    return cache.output_folder(
+        input_folder,
+        information.size_files,
+        extra=[
+            information.supersats,
+            xaxis_mode,
+            supersat_mode,
+            cache.digest(summary_file) if summary_file else None,
+        ],
+    )
+
+
 class WorkerGrowthRates(CancellableRunnable):
-    def __init__(self, information, selected_directions, xaxis_mode="auto", supersat_mode="native"):
+    def __init__(
+        self,
+        input_folder: Path,
+        information,
+        selected_directions,
+        xaxis_mode="auto",
+        supersat_mode="native",
+        n_workers=None,
+        cache=None,
+    ):
         super().__init__()
+        self.input_folder = input_folder
+        self.output_folder = None
         self.information = information
         self.selected_directions = selected_directions
         self.xaxis_mode = xaxis_mode
         self.supersat_mode = supersat_mode
+        self.n_workers = default_worker_count() if n_workers is None else n_workers
+        self.cache = cache
 
     @emit_error_on_exception
     def run(self):
+        self.output_folder = growth_rates_output_folder(
+            self.input_folder, self.information, self.xaxis_mode, self.supersat_mode, self.cache
+        )
+        self.signals.location.emit(self.output_folder)
+
         growth_rate_df = build_growthrates(
             size_file_list=self.information.size_files,
             supersat_list=self.information.supersats,
             directions=self.selected_directions,
             signals=self.signals,
             xaxis_mode=self.xaxis_mode,
+            n_workers=self.n_workers,
+            cache=self.cache,
         )
+        if self.cache is not None:
+            self.cache.flush()
 
         logger.debug("build_growthrates returned: %s, shape=%s", type(growth_rate_df), getattr(growth_rate_df, "shape", None))
 
@@ -258,6 +335,8 @@ class WorkerSiteAnalysis(CancellableRunnable):
         crystallisation_files: list[Path],
         population_files: list[Path],
         count_files: list[Path],
+        export_json: bool = False,
+        n_workers=None,
     ):
         super().__init__()
         self.input_folder = input_folder
@@ -265,153 +344,114 @@ class WorkerSiteAnalysis(CancellableRunnable):
         self.crystallisation_files = crystallisation_files
         self.population_files = population_files
         self.count_files = count_files
+        self.export_json = export_json
+        self.n_workers = default_worker_count() if n_workers is None else n_workers
+
+    def _iter_parsed_groups(self, tasks):
+        """Yield ``(task_index, (merged_result, errors))`` as each prefix finishes."""
+        from .site_parser import parse_site_group
+
+        if self.n_workers > 1 and len(tasks) > 1:
+            yield from iter_process_pool(
+                parse_site_group, tasks, self.n_workers, cancel_flag=self.signals.cancel_flag
+            )
+            return
+
+        for i, task in enumerate(tasks):
+            if self.is_cancelled:
+                return
+            self.signals.message.emit(f"Parsing site files for prefix: {task[0]}")
+            yield i, parse_site_group(task)
 
     def run(self):
-        from .site_parser import (
-            parse_site_csv,
-            merge_site_results,
-            get_site_summary,
-            parse_count,
-            merge_interactions,
-            extract_file_prefix,
-        )
+        from .site_parser import get_site_summary, group_site_files
 
         self.output_folder = create_aspects_folder(self.input_folder)
         self.signals.location.emit(self.output_folder)
 
         try:
-            # Parse all CSV files
-            results_with_paths = []
+            # Group files by prefix; each group is parsed and merged independently
+            csv_files = list(self.crystallisation_files) + list(self.population_files)
+            groups = group_site_files(csv_files, self.count_files)
+            tasks = [(prefix, csvs, counts) for prefix, (csvs, counts) in groups.items()]
 
             # Calculate total number of files to process for progress tracking
-            total_files = len(self.crystallisation_files) + len(self.population_files)
+            total_files = len(csv_files)
             files_processed = 0
-
-            if self.crystallisation_files:
-                logger.info(
-                    f"Parsing {len(self.crystallisation_files)} crystallisation event files"
-                )
-                for csv_path in self.crystallisation_files:
-                    if self.is_cancelled:
-                        self.signals.cancelled.emit()
-                        self.signals.finished.emit()
-                        return
-                    try:
-                        self.signals.message.emit(f"Parsing crystallisation file: {csv_path.name}")
-                        result = parse_site_csv(csv_path)
-                        results_with_paths.append((result, csv_path))
-                        files_processed += 1
-                        progress = int((files_processed / total_files) * 80)  # Use 80% for parsing
-                        self.signals.progress.emit(progress)
-                    except Exception as e:
-                        logger.error(f"Error parsing {csv_path}: {e}", exc_info=True)
-                        files_processed += 1
-                        progress = int((files_processed / total_files) * 80)
-                        self.signals.progress.emit(progress)
-
-            if self.population_files:
-                logger.info(f"Parsing {len(self.population_files)} population files")
-                for csv_path in self.population_files:
-                    if self.is_cancelled:
-                        self.signals.cancelled.emit()
-                        self.signals.finished.emit()
-                        return
-                    try:
-                        self.signals.message.emit(f"Parsing population file: {csv_path.name}")
-                        result = parse_site_csv(csv_path)
-                        results_with_paths.append((result, csv_path))
-                        files_processed += 1
-                        progress = int((files_processed / total_files) * 80)
-                        self.signals.progress.emit(progress)
-                    except Exception as e:
-                        logger.error(f"Error parsing {csv_path}: {e}", exc_info=True)
-                        files_processed += 1
-                        progress = int((files_processed / total_files) * 80)
-                        self.signals.progress.emit(progress)
-
-            # Merge results by file prefix
-            self.signals.message.emit("Merging results by file prefix...")
-            self.signals.progress.emit(85)
-            merged_results = merge_site_results(results_with_paths)
-
-            # Parse and merge count files if available
-            if self.count_files:
-                self.signals.message.emit("Processing interaction count files...")
-                self.signals.progress.emit(87)
-                logger.info(f"Parsing {len(self.count_files)} count files")
-
-                for count_file in self.count_files:
-                    if self.is_cancelled:
-                        self.signals.cancelled.emit()
-                        self.signals.finished.emit()
-                        return
-                    try:
-                        # Extract prefix from count file
-                        count_filename = count_file.stem
-                        if count_filename.endswith("_count"):
-                            prefix = count_filename[:-6]  # Remove "_count"
-                        elif count_filename == "count":
-                            # Use parent directory name or try to match with available prefixes
-                            prefix = count_file.parent.name
-                            # If that doesn't match, try the first available prefix
-                            if prefix not in merged_results and len(merged_results) == 1:
-                                prefix = next(iter(merged_results))
-                        else:
-                            prefix = count_filename
-
-                        # Parse the count file
-                        interactions = parse_count(count_file)
-
-                        # Merge interactions into the corresponding merged result
-                        if prefix in merged_results:
-                            merge_interactions(merged_results[prefix]["sites"], interactions)
+            logger.info(
+                f"Parsing {len(self.crystallisation_files)} crystallisation event files, "
+                f"{len(self.population_files)} population files and "
+                f"{len(self.count_files)} count files for {len(tasks)} prefixes "
+                f"using {min(self.n_workers, max(1, len(tasks)))} worker(s)"
+            )
+            self.signals.message.emit(f"Parsing site files for {len(tasks)} prefixes...")
+
+            # Merged results are written to disk as each prefix completes, so only
+            # the text summaries are kept in memory
+            results_path = self.output_folder / SITE_RESULTS_NAME
+            json_results = {} if self.export_json else None
+            summaries = {}
+            writer = SiteResultsWriter(results_path, prefixes=list(groups))
+            try:
+                for task_idx, (merged, errors) in self._iter_parsed_groups(tasks):
+                    prefix, csvs, counts = tasks[task_idx]
+                    self.signals.message.emit(f"Parsed site files for prefix: {prefix}")
+                    for path, message in errors:
+                        logger.error(f"Error parsing {path}: {message}")
+
+                    if merged is not None:
+                        writer.add(prefix, merged)
+                        summary = get_site_summary(merged)
+                        logger.debug(
+                            f"{prefix}: {summary['total_sites']} sites, "
+                            f"{summary['occupied_sites']} occupied, "
+                            f"{summary['time_points']} time points"
+                        )
+                        if counts:
                             logger.info(
-                                f"Merged {len(interactions)} site interactions from {count_file.name} "
+                                f"Merged site interactions from {len(counts)} count file(s) "
                                 f"into prefix '{prefix}'"
                             )
-                        else:
-                            logger.warning(
-                                f"Could not find matching prefix '{prefix}' for count file {count_file.name}. "
-                                f"Available prefixes: {list(merged_results.keys())}"
-                            )
+                        summaries[prefix] = self._summary_section(prefix, merged, summary)
+                        if json_results is not None:
+                            json_results[prefix] = merged
 
-                    except Exception as e:
-                        logger.error(f"Error processing count file {count_file}: {e}", exc_info=True)
+                    files_processed += len(csvs)
+                    progress = int((files_processed / total_files) * 80)  # Use 80% for parsing
+                    self.signals.progress.emit(progress)
+            except BaseException:
+                writer.discard()
+                raise
 
-            # Generate summaries
-            self.signals.message.emit("Generating summaries...")
+            if self.is_cancelled:
+                writer.discard()
+                self.signals.cancelled.emit()
+                self.signals.finished.emit()
+                return
+            self.signals.message.emit("Saving site data for plotting...")
             self.signals.progress.emit(90)
-            for prefix, result in merged_results.items():
-                if self.is_cancelled:
-                    self.signals.cancelled.emit()
-                    self.signals.finished.emit()
-                    return
-                summary = get_site_summary(result)
-                logger.debug(
-                    f"{prefix}: {summary['total_sites']} sites, "
-                    f"{summary['occupied_sites']} occupied, "
-                    f"{summary['time_points']} time points"
-                )
+            writer.close()
 
             # Save parsed data summary to a file
             self.signals.message.emit("Saving summary file...")
             self.signals.progress.emit(95)
             summary_path = self.output_folder / "site_analysis_summary.txt"
-            self._save_summary(merged_results, summary_path)
+            self._save_summary([summaries[p] for p in groups if p in summaries], summary_path)
 
-            # Save parsed data as JSON for plotting
-            self.signals.message.emit("Saving JSON data for plotting...")
-            self.signals.progress.emit(98)
-            json_path = self.output_folder / "site_analysis_data.json"
-            self._save_json(merged_results, json_path)
+            if json_results is not None:
+                self.signals.message.emit("Exporting JSON data...")
+                self.signals.progress.emit(98)
+                export_site_results_json(
+                    json_results, self.output_folder / SITE_RESULTS_JSON_NAME
+                )
 
             logger.info(f"Site analysis complete. Results saved to {self.output_folder}")
             self.signals.message.emit("Site analysis complete!")
             self.signals.progress.emit(100)
 
             # Convert Path to string for signal emission
-            logger.info(f"About to emit result signal with path: {json_path}")
-            self.signals.result.emit(str(json_path))
+            logger.info(f"About to emit result signal with path: {results_path}")
+            self.signals.result.emit(str(results_path))
             logger.info("Result signal emitted successfully")
 
             # Emit finished signal to indicate worker completion
@@ -423,94 +463,65 @@ class WorkerSiteAnalysis(CancellableRunnable):
             logger.error(f"Error during site analysis: {e}", exc_info=True)
             self.signals.error.emit((type(e), e, str(e)))
 
-    def _save_summary(self, merged_results: dict[str, dict], output_path: Path):
-        """Save a text summary of the merged parsed data."""
-        from .site_parser import (
-            get_site_summary,
-        )
-
+    @staticmethod
+    def _save_summary(sections: list[str], output_path: Path):
+        """Save a text summary from the per-prefix summary sections."""
         with open(output_path, "w") as f:
             f.write("Site Analysis Summary\n")
             f.write("=" * 80 + "\n\n")
+            for section in sections:
+                f.write(section)
+
+    @staticmethod
+    def _summary_section(prefix: str, result: dict, summary: dict) -> str:
+        """Summary text for one merged prefix result."""
+        source_files = result.get("source_files", [])
+
+        lines = [
+            f"Prefix: {prefix}\n",
+            f"Source Files: {', '.join(source_files)}\n",
+            "-" * 80 + "\n",
+            f"Total sites: {summary['total_sites']}\n",
+            f"Occupied sites: {summary['occupied_sites']}\n",
+            f"Unoccupied sites: {summary['unoccupied_sites']}\n",
+            f"Sites with events data: {summary.get('sites_with_events', 'N/A')}\n",
+            f"Sites with population data: {summary.get('sites_with_population', 'N/A')}\n",
+            f"Sites with both: {summary.get('sites_with_both', 'N/A')}\n",
+            f"Time points: {summary['time_points']}\n",
+            f"Iterations: {summary['iterations']}\n",
+            f"Supersaturation points: {summary['supersaturation_points']}\n",
+            f"Tile types: {summary['tile_types']}\n",
+            f"Energy range: {summary['energy_range']}\n",
+            f"Coordination range: {summary['coordination_range']}\n",
+            "\n",
+        ]
+
+        # Write site details
+        lines.append("Site Details (first 10 sites):\n")
+        site_items = itertools.islice(result["sites"].items(), 10)
+        for site_num, site_data in site_items:
+            energy_str = (
+                f"{site_data['energy']:.2f}" if site_data["energy"] is not None else "None"
+            )
+            events_len = len(site_data["events"]) if site_data["events"] is not None else 0
+            pop_len = len(site_data["population"]) if site_data["population"] is not None else 0
+
+            lines.append(f"  Site {site_num}:\n")
+            lines.append(
+                f"    Metadata: tile_type={site_data['tile_type']}, "
+                f"energy={energy_str}, occupation={site_data['occupation']}, "
+                f"coordination={site_data['coordination']}\n"
+            )
+            lines.append(f"    Events: total={site_data['total_events']}, data_points={events_len}\n")
+            lines.append(
+                f"    Population: total={site_data['total_population']}, data_points={pop_len}\n"
+            )
 
-            for prefix, result in merged_results.items():
-                summary = get_site_summary(result)
-                source_files = result.get("source_files", [])
-
-                f.write(f"Prefix: {prefix}\n")
-                f.write(f"Source Files: {', '.join(source_files)}\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Total sites: {summary['total_sites']}\n")
-                f.write(f"Occupied sites: {summary['occupied_sites']}\n")
-                f.write(f"Unoccupied sites: {summary['unoccupied_sites']}\n")
-                f.write(f"Sites with events data: {summary.get('sites_with_events', 'N/A')}\n")
-                f.write(
-                    f"Sites with population data: {summary.get('sites_with_population', 'N/A')}\n"
-                )
-                f.write(f"Sites with both: {summary.get('sites_with_both', 'N/A')}\n")
-                f.write(f"Time points: {summary['time_points']}\n")
-                f.write(f"Iterations: {summary['iterations']}\n")
-                f.write(f"Supersaturation points: {summary['supersaturation_points']}\n")
-                f.write(f"Tile types: {summary['tile_types']}\n")
-                f.write(f"Energy range: {summary['energy_range']}\n")
-                f.write(f"Coordination range: {summary['coordination_range']}\n")
-                f.write("\n")
-
-                # Write site details
-                f.write("Site Details (first 10 sites):\n")
-                site_items = list(result["sites"].items())[:10]
-                for site_num, site_data in site_items:
-                    energy_str = (
-                        f"{site_data['energy']:.2f}" if site_data["energy"] is not None else "None"
-                    )
-                    events_len = len(site_data["events"]) if site_data["events"] is not None else 0
-                    pop_len = (
-                        len(site_data["population"]) if site_data["population"] is not None else 0
-                    )
-
-                    f.write(f"  Site {site_num}:\n")
-                    f.write(
-                        f"    Metadata: tile_type={site_data['tile_type']}, "
-                        f"energy={energy_str}, occupation={site_data['occupation']}, "
-                        f"coordination={site_data['coordination']}\n"
-                    )
-                    f.write(
-                        f"    Events: total={site_data['total_events']}, data_points={events_len}\n"
-                    )
-                    f.write(
-                        f"    Population: total={site_data['total_population']}, "
-                        f"data_points={pop_len}\n"
-                    )
-
-                if len(result["sites"]) > 10:
-                    f.write(f"  ... and {len(result['sites']) - 10} more sites\n")
-
-                f.write("\n" + "=" * 80 + "\n\n")
-
-    def _save_json(self, merged_results: dict[str, dict], output_path: Path):
-        """Save the merged parsed data as JSON for plotting."""
-        import json
-        import numpy as np
-
-        def convert_to_serializable(obj):
-            """Convert numpy types to Python native types for JSON serialization."""
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, (np.integer, np.floating)):
-                return obj.item()
-            elif isinstance(obj, dict):
-                return {k: convert_to_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_serializable(item) for item in obj]
-            return obj
-
-        # Convert the results to JSON-serializable format
-        serializable_results = convert_to_serializable(merged_results)
-
-        with open(output_path, "w") as f:
-            json.dump(serializable_results, f, indent=2)
+        if len(result["sites"]) > 10:
+            lines.append(f"  ... and {len(result['sites']) - 10} more sites\n")
 
-        logger.info(f"Saved site analysis data to {output_path}")
+        lines.append("\n" + "=" * 80 + "\n\n")
+        return "".join(lines)
 
 
 class WorkerClusters(CancellableRunnable):
@@ -531,22 +542,27 @@ class WorkerClusters(CancellableRunnable):
 
     @emit_error_on_exception
     def run(self):
-        from .cluster_analysis import run_cluster_analysis
+        from .cluster_analysis import cluster_cache, cluster_output_folder, run_cluster_analysis
 
-        if self.output_folder is None:
-            self.output_folder = create_aspects_folder(self.input_folder)
+        # Unchanged inputs and options reuse the previous run's output folder
+        cache = cluster_cache(self.input_folder, self.options)
+        self.output_folder = cluster_output_folder(
+            self.input_folder, self.xyz_files, self.information, cache
+        )
         self.signals.location.emit(self.output_folder)
         self.signals.progress.emit(1)
         self.signals.message.emit(f"Starting cluster analysis on {len(self.xyz_files)} files…")
 
         try:
-            csv_path, labels_cache = run_cluster_analysis(
-                xyz_files=self.xyz_files,
-                information=self.information,
-                options=self.options,
-                output_folder=self.output_folder,
-                signals=self.signals,
-            )
+            with cache:
+                csv_path, labels_cache = run_cluster_analysis(
+                    xyz_files=self.xyz_files,
+                    information=self.information,
+                    options=self.options,
+                    output_folder=self.output_folder,
+                    signals=self.signals,
+                    cache=cache,
+                )
             if csv_path is None:
                 pass  # cancelled signal already emitted from inside run_cluster_analysis
             else:
@@ -1,17 +1,109 @@
 import logging
+from itertools import product
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Optional, Literal, Dict
+from typing import List, Optional, Literal, Dict, Sequence
 
 import numpy as np
 import trimesh
 
-from scipy.spatial import ConvexHull  # pylint: disable=no-name-in-module
+from scipy.spatial import ConvexHull, QhullError  # pylint: disable=no-name-in-module
 
 from ..fileio.xyz_file import CrystalCloud, ShapeMetrics
 
 LOG = logging.getLogger("CA:ShapeAnalysis")
 
+SCATTER_CHUNK_SIZE = 262_144
+
+
+def scatter_matrix(
+    xyz: np.ndarray, center: bool = False, chunk_size: int = SCATTER_CHUNK_SIZE
+) -> np.ndarray:
+    """3x3 scatter matrix of *xyz*, accumulated in a single chunked pass.
+
+    With ``center=False`` this is ``X.T @ X``, whose eigenvalues are the
+    squared singular values of ``X``.  With ``center=True`` the moments are
+    taken about the centroid; the sums are accumulated relative to the first
+    point so that clouds far from the origin do not lose precision.
+    """
+    xyz = np.asarray(xyz)
+    n_points = len(xyz)
+    origin = xyz[0].astype(np.float64) if center else None
+    scatter = np.zeros((3, 3))
+    total = np.zeros(3)
+    for start in range(0, n_points, chunk_size):
+        block = xyz[start : start + chunk_size].astype(np.float64, copy=False)
+        if center:
+            block = block - origin
+            total += block.sum(axis=0)
+        scatter += block.T @ block
+    if center:
+        scatter -= np.outer(total, total) / n_points
+    return scatter
+
+
+def pca_from_scatter(scatter: np.ndarray):
+    """Singular values and right singular vectors from (stacked) scatter matrices.
+
+    Matches ``np.linalg.svd(X, full_matrices=False)[1:]``: singular values in
+    descending order and ``vh`` with principal axes as rows.
+    """
+    eigvals, eigvecs = np.linalg.eigh(scatter)
+    # eigh returns ascending eigenvalues; SVD order is descending
+    singular_values = np.sqrt(np.clip(eigvals[..., ::-1], 0, None))
+    right_vectors = np.swapaxes(eigvecs[..., ::-1], -1, -2)
+    return singular_values, right_vectors
+
+
+HULL_PREFILTER_MIN_POINTS = 4096
+_HULL_DIRECTIONS = np.array([d for d in product((-1.0, 0.0, 1.0), repeat=3) if any(d)])
+
+
+def hull_candidates(points: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+    """Indices of the points that may be convex hull vertices.
+
+    Akl-Toussaint prefilter: the extreme points along the 26 lattice
+    directions span an inner polytope, and every point strictly inside it is
+    discarded.  This never removes a hull vertex, so the hull of the
+    returned subset is identical to the hull of *points*.  The inside test
+    runs in float32 chunks with a conservative tolerance (points near a face
+    are kept), preceded by a cheap inscribed-ball test.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n_points = len(points)
+    if n_points < HULL_PREFILTER_MIN_POINTS:
+        return np.arange(n_points)
+
+    # Work relative to a point of the cloud so float32 keeps its precision
+    origin = points[0]
+    local_t = np.ascontiguousarray((points - origin).T, dtype=np.float32)
+
+    extremes = np.unique(np.argmax(_HULL_DIRECTIONS.astype(np.float32) @ local_t, axis=1))
+    try:
+        inner = ConvexHull(points[extremes] - origin)
+    except (ValueError, QhullError):
+        # Flat or degenerate extremes; let Qhull see everything
+        return np.arange(n_points)
+
+    normals, offsets = inner.equations[:, :3], inner.equations[:, 3]
+    centre = inner.points.mean(axis=0)
+    tol = 1e-4 * np.abs(inner.points - centre).max()
+
+    # Ball around the centre of the extremes that fits inside the polytope
+    radius = max(-(normals @ centre + offsets).max() - tol, 0.0)
+    shifted = local_t - centre.astype(np.float32)[:, None]
+    outside_ball = np.flatnonzero(np.einsum("ij,ij->j", shifted, shifted) >= radius**2)
+    local_t = np.ascontiguousarray(local_t[:, outside_ball])
+
+    normals = normals.astype(np.float32)
+    offsets = offsets.astype(np.float32)[:, None]
+    keep = np.empty(len(outside_ball), dtype=bool)
+    for start in range(0, len(outside_ball), chunk_size):
+        dist = normals @ local_t[:, start : start + chunk_size]
+        dist += offsets
+        keep[start : start + chunk_size] = dist.max(axis=0) > -tol
+    return outside_ball[keep]
+
 
 @dataclass
 class ShapeAnalyser:
@@ -19,6 +111,8 @@ class ShapeAnalyser:
 
     l_max: int = 10
     zingg_method: Literal["bounding_box", "svd"] = "svd"
+    # PCA is taken about the origin by default, as the original SVD path did
+    center_pca: bool = False
     # Computed attributes
     points: List[np.ndarray] = field(default_factory=list)
 
@@ -42,14 +136,43 @@ class ShapeAnalyser:
                 return
             self.frame_metrics[frame_idx] = metrics
         else:
-            # Analyse all frames
-            for idx, frame in enumerate(crystal.frames):
-                coords = frame.coords
-                metrics = self.shape_info(coords)
-                if metrics is None:
-                    LOG.warning("Skipping frame %d: insufficient points for shape analysis.", idx)
-                    continue
-                self.frame_metrics[idx] = metrics
+            # Analyse all frames in one batch
+            self.frame_metrics.update(
+                self.analyse_frames([frame.coords for frame in crystal.frames])
+            )
+
+    def analyse_frames(
+        self, coords_list: Sequence[np.ndarray], get_sa_vol: bool = True
+    ) -> Dict[int, ShapeMetrics]:
+        """Shape metrics for every frame of a movie, computed as a batch.
+
+        The per-frame 3x3 scatter matrices are stacked and eigendecomposed in
+        a single call.  Hulls are carried across frames: when a frame extends the previous
+        one (same leading rows), only the previous hull vertices and the new
+        particles are passed to Qhull.
+        """
+        valid = [
+            idx for idx, xyz in enumerate(coords_list) if xyz is not None and len(xyz) >= 3
+        ]
+        for idx in sorted(set(range(len(coords_list))) - set(valid)):
+            LOG.warning("Skipping frame %d: insufficient points for shape analysis.", idx)
+        if not valid:
+            return {}
+
+        scatter = np.stack(
+            [scatter_matrix(coords_list[idx], center=self.center_pca) for idx in valid]
+        )
+        singular_values, right_vectors = pca_from_scatter(scatter)
+
+        hull = _GrowingHull() if get_sa_vol else None
+        metrics = {}
+        for k, idx in enumerate(valid):
+            xyz = coords_list[idx]
+            sa_vol_vals = hull.update(xyz) if hull is not None else None
+            metrics[idx] = self._metrics_from_pca(
+                xyz, singular_values[k], right_vectors[k], sa_vol_vals
+            )
+        return metrics
 
     def get_frame_metrics(self, frame_idx: int) -> Optional[ShapeMetrics]:
         """Get metrics for a specific frame."""
@@ -77,12 +200,12 @@ class ShapeAnalyser:
     def get_sa_vol_ratio(xyz: np.ndarray) -> np.ndarray:
         """Returns surface area, volume, and SA:Vol ratio of a crystal shape."""
         try:
-            hull = ConvexHull(xyz)
+            hull = ConvexHull(xyz[hull_candidates(xyz)])
             vol_hull = hull.volume
             sa_hull = hull.area
             sa_vol = sa_hull / vol_hull
             sa_vol_ratio_array = np.array([sa_hull, vol_hull, sa_vol])
-        except ValueError as ve:
+        except (ValueError, QhullError) as ve:
             LOG.error("Encountered: %s\nHull information will be set to -1.", ve)
             sa_vol_ratio_array = np.array([-1, -1, -1])
 
@@ -94,23 +217,33 @@ class ShapeAnalyser:
         get_sa_vol: bool = True,
     ) -> Optional[ShapeMetrics]:
         """Calculate comprehensive shape information for crystal coordinates."""
-        if xyz_vals is None or len(xyz_vals) < 3:
+        if xyz_vals is None or len(xyz_vals) < 3 or np.shape(xyz_vals)[1] < 3:
             return None
 
-        # Perform PCA via SVD
-        _, s, vh = np.linalg.svd(xyz_vals, full_matrices=False)
+        # PCA from the 3x3 scatter matrix (same singular values as an SVD of the cloud)
+        s, vh = pca_from_scatter(scatter_matrix(xyz_vals, center=self.center_pca))
 
-        if s.shape[0] < 3:
-            return None
-        transformed_xyz = xyz_vals @ vh.T
+        sa_vol_vals = self.get_sa_vol_ratio(xyz_vals) if get_sa_vol else None
+        return self._metrics_from_pca(xyz_vals, s, vh, sa_vol_vals)
+
+    def _metrics_from_pca(
+        self,
+        xyz_vals: np.ndarray,
+        s: np.ndarray,
+        vh: np.ndarray,
+        sa_vol_vals: Optional[np.ndarray] = None,
+    ) -> ShapeMetrics:
+        """Assemble ShapeMetrics from singular values *s* and right singular vectors *vh*."""
+        # Project as (3, N) so the per-axis reductions run over contiguous rows
+        transformed_xyz = vh @ np.asarray(xyz_vals).T
 
         # Explained variance ratios
         var = s**2 / (len(xyz_vals) - 1)
         evr = var / var.sum()
 
         # Axis-aligned lengths (match PC1, PC2, PC3)
-        mins_pc = np.min(transformed_xyz, axis=0)
-        maxs_pc = np.max(transformed_xyz, axis=0)
+        mins_pc = np.min(transformed_xyz, axis=1)
+        maxs_pc = np.max(transformed_xyz, axis=1)
         lengths_pc = maxs_pc - mins_pc
         x_pc, y_pc, z_pc = lengths_pc
 
@@ -132,8 +265,7 @@ class ShapeAnalyser:
         shape = self.get_shape_class(aspect1, aspect2)
 
         sa_hull, vol_hull, sa_vol = None, None, None
-        if get_sa_vol:
-            sa_vol_vals = self.get_sa_vol_ratio(xyz_vals)
+        if sa_vol_vals is not None:
             sa_hull, vol_hull, sa_vol = sa_vol_vals[0], sa_vol_vals[1], sa_vol_vals[2]
 
         return ShapeMetrics(
@@ -150,3 +282,41 @@ class ShapeAnalyser:
             surface_area_to_volume_ratio=sa_vol,
             shape=shape,
         )
+
+
+class _GrowingHull:
+    """Convex hull carried across the frames of a growth movie.
+
+    The hull of a point set equals the hull of (previous hull vertices +
+    added points), so when a frame starts with exactly the rows of the
+    previous frame only those are handed to Qhull.  Any other frame
+    (dissolution, reordering) is hulled from scratch.
+    """
+
+    def __init__(self):
+        self._points: Optional[np.ndarray] = None
+        self._vertices: Optional[np.ndarray] = None
+
+    def update(self, xyz: np.ndarray) -> np.ndarray:
+        """Return surface area, volume and SA:Vol ratio for the frame *xyz*."""
+        n_prev = len(self._points) if self._points is not None else 0
+        if (
+            self._vertices is not None
+            and len(xyz) >= n_prev
+            and np.array_equal(xyz[:n_prev], self._points)
+        ):
+            candidates = np.concatenate([self._vertices, xyz[n_prev:]])
+        else:
+            candidates = xyz
+
+        candidates = candidates[hull_candidates(candidates)]
+        try:
+            hull = ConvexHull(candidates)
+        except (ValueError, QhullError) as ve:
+            LOG.error("Encountered: %s\nHull information will be set to -1.", ve)
+            self._points, self._vertices = None, None
+            return np.array([-1, -1, -1])
+
+        self._points = xyz
+        self._vertices = candidates[hull.vertices]
+        return np.array([hull.area, hull.volume, hull.area / hull.volume])
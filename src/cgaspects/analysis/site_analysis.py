@@ -2,12 +2,11 @@
 Site Analysis module for processing crystallisation events and population data.
 """
 
-import json
+import itertools
 import logging
 from pathlib import Path
 from typing import List, Optional
 
-import numpy as np
 from PySide6.QtCore import QThreadPool
 from PySide6.QtWidgets import QDialog
 
@@ -16,11 +15,17 @@ from .site_parser import (
     merge_site_results,
     parse_multiple_site_csvs,
     parse_site_csv,
-    parse_count,
+    parse_count_matrix,
     merge_interactions,
 )
 from .gui_threads import WorkerSiteAnalysis
 from ..fileio import find_data as fd
+from ..fileio.site_results import (
+    SITE_RESULTS_JSON_NAME,
+    SITE_RESULTS_NAME,
+    export_site_results_json,
+    save_site_results,
+)
 from ..utils.data_structures import results_tuple
 
 logger = logging.getLogger("CA:SiteAnalysis")
@@ -42,6 +47,7 @@ class SiteAnalysis:
         self.worker = None
         self.result_tuple = results_tuple
         self.plotting_csv = None
+        self.export_json = False
 
         self.crystallisation_files: List[Path] = []
         self.population_files: List[Path] = []
@@ -121,6 +127,7 @@ class SiteAnalysis:
                 crystallisation_files=self.crystallisation_files,
                 population_files=self.population_files,
                 count_files=self.count_files,
+                export_json=self.export_json,
             )
             # Use Qt.QueuedConnection for thread-safe signal delivery
             from PySide6.QtCore import Qt
@@ -236,7 +243,7 @@ class SiteAnalysis:
                             prefix = count_filename
 
                         # Parse the count file
-                        interactions = parse_count(count_file)
+                        interactions = parse_count_matrix(count_file)
 
                         # Merge interactions into the corresponding merged result
                         if prefix in merged_results:
@@ -271,16 +278,19 @@ class SiteAnalysis:
             summary_path = self.output_folder / "site_analysis_summary.txt"
             self._save_summary(merged_results, summary_path)
 
-            # Save parsed data as JSON for plotting
-            self.signals.message.emit("Saving JSON data for plotting...")
+            # Save parsed data for plotting
+            self.signals.message.emit("Saving site data for plotting...")
             self.signals.progress.emit(98)
-            json_path = self.output_folder / "site_analysis_data.json"
-            self._save_json(merged_results, json_path)
+            results_path = save_site_results(merged_results, self.output_folder / SITE_RESULTS_NAME)
+            if self.export_json:
+                export_site_results_json(
+                    merged_results, self.output_folder / SITE_RESULTS_JSON_NAME
+                )
 
             logger.info(f"Site analysis complete. Results saved to {self.output_folder}")
             self.signals.message.emit("Site analysis complete!")
             self.signals.progress.emit(100)
-            self.plotting_csv = json_path
+            self.plotting_csv = results_path
 
         except Exception as e:
             logger.error(f"Error during site analysis: {e}", exc_info=True)
@@ -321,7 +331,7 @@ class SiteAnalysis:
 
                 # Write site details
                 f.write("Site Details (first 10 sites):\n")
-                site_items = list(result["sites"].items())[:10]
+                site_items = itertools.islice(result["sites"].items(), 10)
                 for site_num, site_data in site_items:
                     energy_str = (
                         f"{site_data['energy']:.2f}" if site_data["energy"] is not None else "None"
@@ -349,26 +359,3 @@ class SiteAnalysis:
                     f.write(f"  ... and {len(result['sites']) - 10} more sites\n")
 
                 f.write("\n" + "=" * 80 + "\n\n")
-
-    def _save_json(self, merged_results: dict[str, dict], output_path: Path):
-        """Save the merged parsed data as JSON for plotting."""
-
-        def convert_to_serializable(obj):
-            """Convert numpy types to Python native types for JSON serialization."""
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, (np.integer, np.floating)):
-                return obj.item()
-            elif isinstance(obj, dict):
-                return {k: convert_to_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_serializable(item) for item in obj]
-            return obj
-
-        # Convert the results to JSON-serializable format
-        serializable_results = convert_to_serializable(merged_results)
-
-        with open(output_path, "w") as f:
-            json.dump(serializable_results, f, indent=2)
-
-        logger.info(f"Saved site analysis data to {output_path}")
@@ -5,15 +5,95 @@ This module provides functionality to parse the complex CSV structure of
 *_crystallisation_events.csv and *_populations.csv files.
 """
 
+import csv
 import logging
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
+
+from .site_table import SiteInteractions, SiteRecords, SiteTable, nan_to_python
 
 logger = logging.getLogger("CA:SiteParser")
 
 
+_HEADER_ROWS = 7
+_SITE_COL = 4  # columns 0-2: supersaturation, time, iterations; 3: row labels
+
+# Count-file site lines, e.g. "grown tile 1 5 3(1) 1(4) coord 4": the site
+# number (fourth token) and the rest of the line
+_COUNT_LINE = re.compile(
+    rb"^(?:empty|grown)\S*[ \t]+\S+[ \t]+\S+[ \t]+(\S+)([^\n]*)", re.MULTILINE
+)
+_COUNT_TAIL = re.compile(rb"coord[^\n]*")
+# A "frequency(interaction ID)" token
+_COUNT_PAIR = re.compile(rb"(?<!\S)(-?\d+)\((-?\d+)\)(?!\S)")
+
+
+def _read_header_rows(csv_path: Path, max_rows: int = _HEADER_ROWS):
+    """Read the labelled metadata rows at the top of a site CSV.
+
+    Stops after the TOTAL row (or *max_rows* non-blank rows).  Returns the
+    rows as lists of strings and the number of physical lines consumed, so
+    the numeric block can be read separately.
+    """
+    rows = []
+    n_lines = 0
+    with open(csv_path, encoding="utf-8", errors="replace", newline="") as fh:
+        reader = csv.reader(fh)
+        for row in reader:
+            n_lines = reader.line_num
+            if not row:
+                # pandas skips blank lines when counting rows
+                continue
+            rows.append(row)
+            label = row[3].strip().lower() if len(row) > 3 else ""
+            if len(rows) >= max_rows or ("total" in label and ("events" in label or "population" in label)):
+                break
+    return rows, n_lines
+
+
+def _row_values(row: List[str], n_sites: int) -> np.ndarray:
+    """Per-site float values of a metadata row (NaN where empty)."""
+    values = pd.to_numeric(pd.Series(row[_SITE_COL:], dtype=object), errors="coerce")
+    values = values.to_numpy(dtype=float)
+    if len(values) < n_sites:
+        values = np.concatenate([values, np.full(n_sites - len(values), np.nan)])
+    return values[:n_sites]
+
+
+def _read_series_block(csv_path: Path, skip_lines: int, n_cols: int) -> np.ndarray:
+    """Numeric time-series block as a float array of shape (n_rows, 3 + n_sites)."""
+    usecols = [0, 1, 2, *range(_SITE_COL, n_cols)]
+    try:
+        block = np.loadtxt(
+            csv_path,
+            delimiter=",",
+            skiprows=skip_lines,
+            usecols=usecols,
+            dtype=np.float64,
+            comments=None,
+            ndmin=2,
+            encoding="utf-8",
+        )
+    except ValueError:
+        # Blank cells: let pandas fill them with NaN
+        block = pd.read_csv(
+            csv_path,
+            header=None,
+            skiprows=skip_lines,
+            names=range(n_cols),
+            usecols=usecols,
+            dtype=np.float64,
+            encoding="utf-8",
+            encoding_errors="replace",
+        ).to_numpy()
+    return block
+
+
 def parse_site_csv(csv_path: Path) -> Dict:
     """
     Parse a crystallisation events or populations CSV file.
@@ -30,6 +110,11 @@ def parse_site_csv(csv_path: Path) -> Dict:
     - Rows 8+: time series data (supersaturation, time, iterations in first 3 cols,
                then event/population values per site)
 
+    The labelled header rows and the numeric block are read separately: the
+    metadata rows become one array per row, and the events/population values
+    are held in a single contiguous ``(n_sites, n_times)`` int64 matrix whose
+    rows are handed out as views.
+
     Args:
         csv_path: Path to the CSV file
 
@@ -40,6 +125,12 @@ def parse_site_csv(csv_path: Path) -> Dict:
             'time': numpy array of float values,
             'iterations': numpy array of int values,
             'file_type': 'events' or 'population',
+            'site_numbers': numpy int array of site numbers (matrix row order),
+            'site_metadata': {'tile_type', 'energy', 'occupation', 'coordination',
+                              'total'} -> float arrays aligned with site_numbers
+                              (NaN where missing),
+            'site_series': (n_sites, n_times) int64 array or None,
+            'site_has_series': (n_sites,) bool array of rows holding data, or None,
             'sites': {
                 site_number (int): {
                     'tile_type': int or None,
@@ -56,14 +147,12 @@ def parse_site_csv(csv_path: Path) -> Dict:
         }
 
         Note: sites is a dictionary where keys are site numbers (int) and values
-        are dictionaries containing the site data.
+        are dictionaries containing the site data.  Blank cells inside a site's
+        time series are read as 0.
     """
     logger.debug(f"Parsing site CSV: {csv_path}")
 
-    # Read the entire CSV without headers to handle the complex structure
-    df = pd.read_csv(
-        csv_path, header=None, encoding="utf-8", encoding_errors="replace", low_memory=False
-    )
+    header_rows, header_lines = _read_header_rows(csv_path)
 
     # Initialize the result dictionary
     result = {
@@ -71,47 +160,36 @@ def parse_site_csv(csv_path: Path) -> Dict:
         "time": None,
         "iterations": None,
         "file_type": None,
+        "site_numbers": None,
+        "site_metadata": {},
+        "site_series": None,
+        "site_has_series": None,
         "sites": {},
     }
 
-    # The structure is fixed, so we can use direct indexing
-    # Row 0: sitenumbers header + site numbers
-    # Row 1: tile type header + values
-    # Row 2: energies header + values
-    # Row 3: grown(1) ungrown(0) header + values
-    # Row 4: coordination header + values
-    # Row 5: Empty row with supersaturation, time, iterations headers
-    # Row 6: TOTAL EVENTS/TOTAL POPULATION header + totals
-    # Row 7+: Time series data
-
     # Find the row with site numbers
     site_numbers_idx = None
-    tile_type_idx = None
-    energies_idx = None
-    occupation_idx = None
-    coordination_idx = None
-    total_idx = None
+    row_indices = {}
     data_row_idx = None
 
-    headers = df.iloc[:7, 3]
-
-    for idx, value in enumerate(headers):
-        if pd.isna(value):
+    for idx, row in enumerate(header_rows):
+        value = row[3] if len(row) > 3 else ""
+        val_str = value.strip().lower()
+        if not val_str:
             continue
-        val_str = str(value).strip().lower()
 
         if "sitenumbers" in val_str or "site numbers" in val_str:
             site_numbers_idx = idx
         elif "tile type" in val_str or "tile_type" in val_str:
-            tile_type_idx = idx
+            row_indices["tile_type"] = idx
         elif "energies" in val_str or "energy" in val_str:
-            energies_idx = idx
+            row_indices["energy"] = idx
         elif "grown" in val_str and "ungrown" in val_str:
-            occupation_idx = idx
+            row_indices["occupation"] = idx
         elif "coordination" in val_str:
-            coordination_idx = idx
+            row_indices["coordination"] = idx
         elif "total" in val_str and ("events" in val_str or "population" in val_str):
-            total_idx = idx
+            row_indices["total"] = idx
             # Detect file type from the total row header
             if "events" in val_str:
                 result["file_type"] = "events"
@@ -125,131 +203,194 @@ def parse_site_csv(csv_path: Path) -> Dict:
         logger.error(f"Could not find site numbers row in {csv_path}")
         return result
 
-    supersat_val = df.iloc[data_row_idx:, 0]
-    time_val = df.iloc[data_row_idx:, 1]
-    iter_val = df.iloc[data_row_idx:, 2]
+    n_cols = len(header_rows[site_numbers_idx])
+    n_columns = max(0, n_cols - _SITE_COL)
+    site_numbers = _row_values(header_rows[site_numbers_idx], n_columns)
+    valid = ~np.isnan(site_numbers)
+    site_numbers = site_numbers[valid].astype(np.int64)
+    result["site_numbers"] = site_numbers
 
-    if supersat_val.notna().any():
-        result["supersaturation"] = supersat_val.to_numpy(dtype=float)
-
-    if time_val.notna().any():
-        result["time"] = time_val.to_numpy(dtype=float)
-
-    if iter_val.notna().any():
-        result["iterations"] = iter_val.to_numpy(dtype=int)
+    metadata = {
+        key: _row_values(header_rows[idx], n_columns)[valid] for key, idx in row_indices.items()
+    }
+    result["site_metadata"] = metadata
+
+    series = None
+    has_data = np.zeros(len(site_numbers), dtype=bool)
+    if data_row_idx is not None:
+        block = _read_series_block(csv_path, header_lines, n_cols)
+
+        supersat_val, time_val, iter_val = block[:, 0], block[:, 1], block[:, 2]
+        if (~np.isnan(supersat_val)).any():
+            result["supersaturation"] = supersat_val.copy()
+        if (~np.isnan(time_val)).any():
+            result["time"] = time_val.copy()
+        if (~np.isnan(iter_val)).any():
+            result["iterations"] = iter_val.astype(int)
+
+        values = block[:, 3:][:, valid]
+        missing = np.isnan(values)
+        has_data = ~missing.all(axis=0)
+        if missing.any():
+            values = np.where(missing, 0, values)
+        # Site-major so every site's series is a contiguous row
+        series = values.T.astype(np.int64, order="C")
+        result["site_series"] = series
+        result["site_has_series"] = has_data
+
+    # Per-site dictionaries, built from whole rows at a time
+    n_sites = len(site_numbers)
+    columns = {
+        "tile_type": (int, metadata.get("tile_type")),
+        "energy": (float, metadata.get("energy")),
+        "occupation": (bool, metadata.get("occupation")),
+        "coordination": (int, metadata.get("coordination")),
+        "total": (int, metadata.get("total")),
+    }
+    per_site = {
+        key: nan_to_python(values, convert) if values is not None else [None] * n_sites
+        for key, (convert, values) in columns.items()
+    }
+    total_key = {"events": "total_events", "population": "total_population"}.get(result["file_type"])
+    series_key = {"events": "events", "population": "population"}.get(result["file_type"])
 
-    # Extract site numbers from the header row (starting from column 3)
-    # Columns 0-2 are supersaturation, time, iterations
-    numerical_block = df.iloc[:5, 4:]
     sites = result["sites"]
-    # row that contains the site numbers
-    site_numbers = numerical_block.iloc[site_numbers_idx]
-
-    for col_idx, site_num in site_numbers.items():
-        if pd.isna(site_num):
-            continue
-
-        site_num = int(site_num)
-
-        sites[site_num] = {
-            "tile_type": None,
-            "energy": None,
-            "occupation": None,
-            "coordination": None,
+    for j, site_num in enumerate(site_numbers.tolist()):
+        site = {
+            "tile_type": per_site["tile_type"][j],
+            "energy": per_site["energy"][j],
+            "occupation": per_site["occupation"][j],
+            "coordination": per_site["coordination"][j],
             "total_events": None,
             "total_population": None,
             "events": None,
             "population": None,
         }
-
-        if tile_type_idx is not None:
-            val = df.iloc[tile_type_idx, col_idx]
-            if pd.notna(val):
-                sites[site_num]["tile_type"] = int(val)
-
-        if energies_idx is not None:
-            val = df.iloc[energies_idx, col_idx]
-            if pd.notna(val):
-                sites[site_num]["energy"] = float(val)
-
-        if occupation_idx is not None:
-            val = df.iloc[occupation_idx, col_idx]
-            if pd.notna(val):
-                sites[site_num]["occupation"] = bool(int(val))
-
-        if coordination_idx is not None:
-            val = df.iloc[coordination_idx, col_idx]
-            if pd.notna(val):
-                sites[site_num]["coordination"] = int(val)
-
-        if total_idx is not None:
-            val = df.iloc[total_idx, col_idx]
-            if pd.notna(val):
-                total_value = int(val)
-                if result["file_type"] == "events":
-                    sites[site_num]["total_events"] = total_value
-                elif result["file_type"] == "population":
-                    sites[site_num]["total_population"] = total_value
-
-        if data_row_idx is not None:
-            val = df.iloc[data_row_idx:, col_idx]
-            if pd.notna(val).any():
-                data_array = val.to_numpy(dtype=int)
-                if result["file_type"] == "events":
-                    sites[site_num]["events"] = data_array
-                elif result["file_type"] == "population":
-                    sites[site_num]["population"] = data_array
+        if total_key is not None:
+            site[total_key] = per_site["total"][j]
+        if series_key is not None and has_data[j]:
+            site[series_key] = series[j]
+        sites[site_num] = site
 
     logger.debug(f"Parsed {len(result['sites'])} sites from {csv_path.name}")
-    logger.debug(
-        f"Global parameters - Supersaturation points: {len(result['supersaturation'])}, "
-        f"Time points: {len(result['time'])}, Iterations: {len(result['iterations'])}"
-    )
+    if result["time"] is not None:
+        logger.debug(f"Global parameters - Time points: {len(result['time'])}")
 
     return result
 
 
-def parse_count(f: Path) -> dict[int, dict[int, int]]:
+def parse_count_matrix(f: Path) -> SiteInteractions:
     """
-    Parse a count file to extract interaction information per site.
+    Parse a count file into a sparse sites x interaction IDs frequency matrix.
+
+    Each site line lists the site number as its fourth token followed by
+    "frequency(interaction ID)" tokens up to "coord".  Lines are matched
+    with one regular expression over the whole file and the numbers are
+    converted in bulk rather than token by token.  If a site appears on
+    several lines the last one wins.
 
     Args:
         f: Path to the count file
 
     Returns:
-        Dictionary mapping site numbers to their interaction dictionaries.
-        Each interaction dictionary maps interaction IDs to their frequencies.
+        SiteInteractions with one matrix row per site, in file order.
     """
-    count_info: dict[int, dict[int, int]] = dict()
+    with open(f, "rb") as fh:
+        lines = _COUNT_LINE.findall(fh.read())
+    if not lines:
+        return SiteInteractions.from_dict({})
+
+    site_numbers = _int_array(b" ".join([line[0] for line in lines]))
+    pair_text = _COUNT_TAIL.sub(b"", b"\n".join([line[1] for line in lines]))
+    if not pair_text.translate(None, b"0123456789-() \t\r\n"):
+        # Pairs per line from the positions of "(" relative to the line breaks
+        chars = np.frombuffer(pair_text, dtype=np.uint8)
+        breaks = np.flatnonzero(chars == ord("\n"))
+        opens = np.flatnonzero(chars == ord("("))
+        lengths = np.diff(np.searchsorted(opens, np.concatenate([[-1], breaks, [len(chars)]])))
+        numbers = _int_array(pair_text.replace(b"(", b" ").replace(b")", b" "))
+    else:
+        lengths, numbers = None, None
+    if lengths is None or len(numbers) != 2 * lengths.sum():
+        # Stray tokens between the site number and "coord"; match pairs line by line
+        pairs = [_COUNT_PAIR.findall(line) for line in pair_text.split(b"\n")]
+        lengths = np.array([len(p) for p in pairs], dtype=np.int64)
+        numbers = _int_array(b" ".join(n for p in pairs for pair in p for n in pair))
+    freqs, ids = numbers[0::2], numbers[1::2]
+    rows = np.repeat(np.arange(len(site_numbers)), lengths)
+
+    n_ids = int(ids.max()) + 1 if ids.size else 0
+    keys = rows * n_ids + ids
+    if _has_duplicates(site_numbers) or _has_duplicates(keys):
+        # Keep the last line of a repeated site and the last frequency of a
+        # repeated interaction ID within a line, like the dict-based parser
+        _, last = np.unique(site_numbers[::-1], return_index=True)
+        keep_lines = np.sort(len(site_numbers) - 1 - last)
+        _, last = np.unique(keys[::-1], return_index=True)
+        entries = np.sort(len(keys) - 1 - last)
+        entries = entries[np.isin(rows[entries], keep_lines)]
+
+        new_rows = np.empty(len(site_numbers), dtype=np.int64)
+        new_rows[keep_lines] = np.arange(len(keep_lines))
+        site_numbers = site_numbers[keep_lines]
+        rows, freqs, ids = new_rows[rows[entries]], freqs[entries], ids[entries]
+        lengths = np.bincount(rows, minlength=len(site_numbers))
+
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    return SiteInteractions(
+        site_numbers=site_numbers,
+        matrix=sparse.csr_array(
+            (freqs.astype(np.int32), ids.astype(np.int32), indptr.astype(np.int32)),
+            shape=(len(site_numbers), n_ids),
+        ),
+    )
 
-    with open(f, encoding="utf-8") as fh:
-        for line in fh:
-            if not line.startswith(("empty", "grown")):
-                continue
 
-            tokens = line.split("coord")[0].split()
-            site = int(tokens[3])
+def _has_duplicates(values: np.ndarray) -> bool:
+    """Whether an integer array contains a repeated value."""
+    if values.size < 2 or np.all(values[1:] > values[:-1]):
+        return False
+    ordered = np.sort(values)
+    return bool(np.any(ordered[1:] == ordered[:-1]))
 
-            interactions: dict[int, int] = dict()
-            for tok in tokens:
-                if "(" in tok and ")" in tok:
-                    freq, rest = tok.split("(")
-                    inter_id = rest.rstrip(")")
-                    interactions[int(inter_id)] = int(freq)
 
-            count_info[site] = interactions
+def _int_array(text: bytes) -> np.ndarray:
+    """Convert whitespace-separated integers to an int64 array."""
+    if not text.strip():
+        return np.empty(0, dtype=np.int64)
+    return np.fromstring(text, dtype=np.int64, sep=" ")
 
-    return count_info
 
+def parse_count(f: Path) -> dict[int, dict[int, int]]:
+    """
+    Parse a count file to extract interaction information per site.
+
+    Args:
+        f: Path to the count file
 
-def merge_interactions(sites: dict, interactions: dict[int, dict[int, int]]):
+    Returns:
+        Dictionary mapping site numbers to their interaction dictionaries.
+        Each interaction dictionary maps interaction IDs to their frequencies.
+        Use parse_count_matrix to keep the compact sparse form instead.
+    """
+    return parse_count_matrix(f).to_dict()
+
+
+def merge_interactions(sites, interactions):
     """
     Merge interaction data into site dictionaries.
 
     Args:
-        sites: Dictionary of site data (site_number -> site_data dict)
-        interactions: Dictionary of interactions (site_number -> interaction_dict)
+        sites: Sites of a merged result (a SiteRecords view, whose table is
+            updated in place) or a plain dict of site_number -> site_data dict
+        interactions: SiteInteractions from parse_count_matrix, or a dict of
+            interactions (site_number -> interaction_dict)
     """
+    if isinstance(sites, SiteRecords):
+        sites.table.set_interactions(interactions)
+        return
+    if isinstance(interactions, SiteInteractions):
+        interactions = interactions.to_dict()
     for site_str, site_data in sites.items():
         site = int(site_str)
         site_data.update({"interactions": interactions.get(site, {})})
@@ -284,11 +425,18 @@ def merge_site_results(results_with_paths: List[tuple]) -> Dict[str, Dict]:
     'run1_populations.csv') are merged together. Each site will have both
     events and population data if available.
 
+    The merge works on the columnar arrays of each parse result (see
+    SiteTable.merge); the per-site dictionaries of the inputs are not used.
+
     Args:
         results_with_paths: List of (parsed_result, file_path) tuples
 
     Returns:
-        Dict of merged results, keyed by file prefix
+        Dict of merged results, keyed by file prefix.  Each result has the
+        keys 'supersaturation', 'time', 'iterations', 'file_prefix',
+        'source_files' and 'sites', where 'sites' is a read-only
+        {site_number: site_dict} view whose 'table' attribute is the
+        underlying SiteTable.
     """
     from collections import defaultdict
 
@@ -296,97 +444,113 @@ def merge_site_results(results_with_paths: List[tuple]) -> Dict[str, Dict]:
     prefix_groups = defaultdict(list)
     for result, file_path in results_with_paths:
         prefix = extract_file_prefix(file_path)
-        prefix_groups[prefix].append((result, file_path))
+        prefix_groups[prefix].append(SiteTable.from_parsed(result, file_path.name))
 
     merged_results = {}
+    for prefix, tables in prefix_groups.items():
+        logger.debug(f"Merging {len(tables)} file(s) with prefix '{prefix}'")
+        table = SiteTable.merge(tables, file_prefix=prefix)
+        logger.debug(
+            f"Merged result for '{prefix}': {len(table)} sites from {table.source_files}"
+        )
+        merged_results[prefix] = table.to_result()
 
-    for prefix, group in prefix_groups.items():
-        logger.debug(f"Merging {len(group)} file(s) with prefix '{prefix}'")
-
-        # Initialize merged result with data from first file
-        first_result, _ = group[0]
-        merged = {
-            "supersaturation": first_result["supersaturation"],
-            "time": first_result["time"],
-            "iterations": first_result["iterations"],
-            "file_prefix": prefix,
-            "source_files": [fp.name for _, fp in group],
-            "sites": {},
-        }
+    return merged_results
 
-        # Collect all unique site numbers across all files in this group
-        all_site_numbers = set()
-        for result, _ in group:
-            all_site_numbers.update(result["sites"].keys())
-
-        # Merge data for each site
-        for site_num in all_site_numbers:
-            merged_site = {
-                "tile_type": None,
-                "energy": None,
-                "occupation": None,
-                "coordination": None,
-                "total_events": None,
-                "total_population": None,
-                "events": None,
-                "population": None,
-                "interactions": None,
-            }
 
-            # Track if we've seen metadata for validation
-            first_metadata = None
-
-            for result, file_path in group:
-                if site_num not in result["sites"]:
-                    continue
-
-                site_data = result["sites"][site_num]
-                file_type = result["file_type"]
-
-                # Get or set metadata (from first occurrence)
-                if first_metadata is None:
-                    first_metadata = {
-                        "tile_type": site_data["tile_type"],
-                        "energy": site_data["energy"],
-                        "occupation": site_data["occupation"],
-                        "coordination": site_data["coordination"],
-                    }
-                    # Set metadata in merged site
-                    for key in first_metadata:
-                        merged_site[key] = first_metadata[key]
-                else:
-                    # Validate metadata matches
-                    for key in ["tile_type", "energy", "occupation", "coordination"]:
-                        if (
-                            site_data[key] is not None
-                            and first_metadata[key] is not None
-                            and site_data[key] != first_metadata[key]
-                        ):
-                            logger.warning(
-                                f"Site {site_num} metadata mismatch for '{key}': "
-                                f"{first_metadata[key]} != {site_data[key]} in {file_path.name}"
-                            )
-
-                # Merge type-specific data
-                if file_type == "events":
-                    if site_data["total_events"] is not None:
-                        merged_site["total_events"] = site_data["total_events"]
-                    if site_data["events"] is not None:
-                        merged_site["events"] = site_data["events"]
-                elif file_type == "population":
-                    if site_data["total_population"] is not None:
-                        merged_site["total_population"] = site_data["total_population"]
-                    if site_data["population"] is not None:
-                        merged_site["population"] = site_data["population"]
-
-            merged["sites"][site_num] = merged_site
+def count_file_prefix(count_file: Path, prefixes: List[str]) -> str:
+    """
+    Determine which file prefix a count file belongs to.
 
-        logger.debug(
-            f"Merged result for '{prefix}': {len(merged['sites'])} sites from {merged['source_files']}"
-        )
-        merged_results[prefix] = merged
+    Args:
+        count_file: Path to the count file
+        prefixes: File prefixes of the site CSV files being analysed
 
-    return merged_results
+    Returns:
+        The prefix ('run1' from 'run1_count.txt'; the parent directory name, or
+        the only available prefix, for a bare 'count' file)
+    """
+    count_filename = count_file.stem
+    if count_filename.endswith("_count"):
+        return count_filename[:-6]  # Remove "_count"
+    if count_filename == "count":
+        # Use parent directory name or try to match with available prefixes
+        prefix = count_file.parent.name
+        # If that doesn't match, try the first available prefix
+        if prefix not in prefixes and len(prefixes) == 1:
+            prefix = prefixes[0]
+        return prefix
+    return count_filename
+
+
+def group_site_files(
+    csv_paths: List[Path], count_paths: Optional[List[Path]] = None
+) -> Dict[str, tuple]:
+    """
+    Group site CSV files and count files by file prefix.
+
+    Args:
+        csv_paths: Crystallisation events and population CSV files, in the
+            order their prefixes should appear in the results
+        count_paths: Interaction count files
+
+    Returns:
+        Dict of prefix -> (csv_paths, count_paths), in first-seen prefix order.
+        Count files that match no CSV prefix are logged and left out.
+    """
+    groups: Dict[str, tuple] = {}
+    for csv_path in csv_paths:
+        groups.setdefault(extract_file_prefix(csv_path), ([], []))[0].append(csv_path)
+
+    prefixes = list(groups)
+    for count_file in count_paths or []:
+        prefix = count_file_prefix(count_file, prefixes)
+        if prefix in groups:
+            groups[prefix][1].append(count_file)
+        else:
+            logger.warning(
+                f"Could not find matching prefix '{prefix}' for count file {count_file.name}. "
+                f"Available prefixes: {prefixes}"
+            )
+    return groups
+
+
+def parse_site_group(task: tuple) -> tuple:
+    """
+    Parse and merge all files sharing one prefix.
+
+    This is the unit of work for the parallel parse stage, so it only takes
+    and returns picklable values and reports failures instead of logging them.
+
+    Args:
+        task: (prefix, csv_paths, count_paths) as produced by group_site_files
+
+    Returns:
+        (merged_result or None, errors), where merged_result is the entry
+        merge_site_results would produce for this prefix (None if no CSV
+        file could be parsed) and errors is a list of (path, message) tuples.
+    """
+    prefix, csv_paths, count_paths = task
+    errors = []
+
+    results_with_paths = []
+    for csv_path in csv_paths:
+        try:
+            results_with_paths.append((parse_site_csv(csv_path), csv_path))
+        except Exception as e:
+            errors.append((csv_path, f"{type(e).__name__}: {e}"))
+
+    if not results_with_paths:
+        return None, errors
+    merged = merge_site_results(results_with_paths)[prefix]
+
+    for count_file in count_paths:
+        try:
+            merge_interactions(merged["sites"], parse_count_matrix(count_file))
+        except Exception as e:
+            errors.append((count_file, f"{type(e).__name__}: {e}"))
+
+    return merged, errors
 
 
 def parse_multiple_site_csvs(csv_paths: List[Path]) -> List[Dict]:
@@ -420,57 +584,9 @@ def get_site_summary(parsed_data: Dict) -> Dict:
     Returns:
         Summary dictionary with statistics
     """
-    summary = {
-        "total_sites": len(parsed_data["sites"]),
-        "occupied_sites": sum(
-            1 for site in parsed_data["sites"].values() if site.get("occupation")
-        ),
-        "unoccupied_sites": sum(
-            1 for site in parsed_data["sites"].values() if not site.get("occupation")
-        ),
-        "time_points": len(parsed_data["time"]) if parsed_data["time"] is not None else 0,
-        "iterations": len(parsed_data["iterations"])
-        if parsed_data["iterations"] is not None
-        else 0,
-        "supersaturation_points": len(parsed_data["supersaturation"])
-        if parsed_data["supersaturation"] is not None
-        else 0,
-        "tile_types": set(),
-        "energy_range": [None, None],
-        "coordination_range": [None, None],
-        "sites_with_events": 0,
-        "sites_with_population": 0,
-        "sites_with_both": 0,
-    }
-
-    # Gather tile types, energy range, coordination range, and data availability
-    energies = []
-    coordinations = []
-    for site_data in parsed_data["sites"].values():
-        if site_data.get("tile_type") is not None:
-            summary["tile_types"].add(site_data["tile_type"])
-        if site_data.get("energy") is not None:
-            energies.append(site_data["energy"])
-        if site_data.get("coordination") is not None:
-            coordinations.append(site_data["coordination"])
-
-        # Count data availability
-        has_events = site_data.get("events") is not None
-        has_population = site_data.get("population") is not None
-
-        if has_events:
-            summary["sites_with_events"] += 1
-        if has_population:
-            summary["sites_with_population"] += 1
-        if has_events and has_population:
-            summary["sites_with_both"] += 1
-
-    if energies:
-        summary["energy_range"] = [min(energies), max(energies)]
-
-    if coordinations:
-        summary["coordination_range"] = [min(coordinations), max(coordinations)]
-
-    summary["tile_types"] = sorted(list(summary["tile_types"]))
-
-    return summary
+    sites = parsed_data["sites"]
+    if isinstance(sites, SiteRecords):
+        table = sites.table
+    else:
+        table = SiteTable.from_parsed(parsed_data)
+    return table.summary()
@@ -0,0 +1,769 @@
+"""
+Columnar site data for one file prefix.
+
+A :class:`SiteTable` holds every site of a prefix as aligned NumPy arrays
+(site number, metadata columns with NaN for missing values, one time-series
+matrix per series type, and a sparse sites x interaction-ID matrix), so
+merging, filtering and summarising are array operations rather than loops
+over per-site dictionaries.  Code that still wants the old
+``{site_number: site_dict}`` shape uses :attr:`SiteTable.sites`, a read-only
+view that builds those dictionaries on demand.
+"""
+
+import logging
+import operator as _operator
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence as SequenceType
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger("CA:SiteTable")
+
+# Per-site scalar columns and the Python type each is returned as
+METADATA_FIELDS = {
+    "tile_type": int,
+    "energy": float,
+    "occupation": bool,
+    "coordination": int,
+    "total_events": int,
+    "total_population": int,
+}
+# Columns taken from the first file a site appears in when merging
+SITE_FIELDS = ("tile_type", "energy", "occupation", "coordination")
+SERIES_FIELDS = ("events", "population")
+GLOBAL_FIELDS = ("supersaturation", "time", "iterations")
+
+_TOTAL_FIELDS = {"events": "total_events", "population": "total_population"}
+_COMPARISONS = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
+
+
+def nan_to_python(values: np.ndarray, convert) -> list:
+    """Convert a float array to a list of *convert*-ed values, with None for NaN."""
+    missing = np.isnan(values)
+    filled = np.where(missing, 0, values)
+    if convert is float:
+        items = filled.tolist()
+    else:
+        items = filled.astype(np.int64).tolist()
+        if convert is bool:
+            items = [bool(v) for v in items]
+    if missing.any():
+        items = [None if m else v for v, m in zip(items, missing.tolist())]
+    return items
+
+
+@dataclass
+class SiteInteractions:
+    """
+    Interaction frequencies of the sites in a count file.
+
+    Attributes:
+        site_numbers: (n_sites,) int64 site numbers, one per matrix row
+        matrix: (n_sites, n_interaction_ids) sparse frequency matrix
+    """
+
+    site_numbers: np.ndarray
+    matrix: sparse.csr_array
+
+    def __len__(self) -> int:
+        return len(self.site_numbers)
+
+    @classmethod
+    def from_dict(cls, interactions: Dict[int, Dict[int, int]]) -> "SiteInteractions":
+        """
+        Build from a ``{site_number: {interaction ID: frequency}}`` dict.
+
+        Args:
+            interactions: site number -> {interaction ID: frequency}
+        """
+        lengths = np.array([len(v) for v in interactions.values()], dtype=np.int64)
+        n_entries = int(lengths.sum())
+        ids = np.fromiter(
+            (int(k) for v in interactions.values() for k in v), dtype=np.int64, count=n_entries
+        )
+        freqs = np.fromiter(
+            (int(f) for v in interactions.values() for f in v.values()),
+            dtype=np.int64,
+            count=n_entries,
+        )
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        n_ids = int(ids.max()) + 1 if ids.size else 0
+        return cls(
+            site_numbers=np.fromiter(
+                (int(n) for n in interactions), dtype=np.int64, count=len(interactions)
+            ),
+            matrix=sparse.csr_array((freqs, ids, indptr), shape=(len(interactions), n_ids)),
+        )
+
+    def to_dict(self) -> Dict[int, Dict[int, int]]:
+        """The ``{site_number: {interaction ID: frequency}}`` dict."""
+        indptr = self.matrix.indptr.tolist()
+        ids = self.matrix.indices.tolist()
+        freqs = self.matrix.data.tolist()
+        return {
+            site: dict(zip(ids[start:end], freqs[start:end]))
+            for site, start, end in zip(self.site_numbers.tolist(), indptr[:-1], indptr[1:])
+        }
+
+
+@dataclass
+class SiteTable:
+    """Columnar site data for a single file prefix.
+
+    Attributes:
+        site_numbers: (n_sites,) int64 site numbers; row order of every other array
+        columns: METADATA_FIELDS -> (n_sites,) float arrays, NaN where missing
+        series: 'events'/'population' -> (n_sites, n_times) int64 matrix or None
+        has_series: 'events'/'population' -> (n_sites,) bool, rows holding data
+        interactions: (n_sites, n_interaction_ids) sparse frequency matrix or None
+        has_interactions: (n_sites,) bool, sites that have count-file data
+    """
+
+    site_numbers: np.ndarray
+    columns: Dict[str, np.ndarray]
+    series: Dict[str, Optional[np.ndarray]]
+    has_series: Dict[str, np.ndarray]
+    interactions: Optional[sparse.csr_array] = None
+    has_interactions: Optional[np.ndarray] = None
+    supersaturation: Optional[np.ndarray] = None
+    time: Optional[np.ndarray] = None
+    iterations: Optional[np.ndarray] = None
+    file_prefix: Optional[str] = None
+    source_files: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._row_index: Optional[Dict[int, int]] = None
+        self._sites: Optional["SiteRecords"] = None
+
+    def __len__(self) -> int:
+        return len(self.site_numbers)
+
+    @classmethod
+    def empty(cls, **kwargs) -> "SiteTable":
+        """A table with no sites."""
+        return cls(
+            site_numbers=np.empty(0, dtype=np.int64),
+            columns={name: np.empty(0) for name in METADATA_FIELDS},
+            series={name: None for name in SERIES_FIELDS},
+            has_series={name: np.zeros(0, dtype=bool) for name in SERIES_FIELDS},
+            **kwargs,
+        )
+
+    @classmethod
+    def from_parsed(cls, result: Dict, source_file: Optional[str] = None) -> "SiteTable":
+        """
+        Build a table from a parse_site_csv result without touching its site dicts.
+
+        Args:
+            result: Dictionary returned by parse_site_csv
+            source_file: Name of the parsed file, recorded in source_files
+        """
+        source_files = [source_file] if source_file is not None else []
+        globals_ = {name: result.get(name) for name in GLOBAL_FIELDS}
+        site_numbers = result.get("site_numbers")
+        if site_numbers is None:
+            return cls.empty(source_files=source_files, **globals_)
+
+        n_sites = len(site_numbers)
+        metadata = result.get("site_metadata", {})
+        columns = {name: np.full(n_sites, np.nan) for name in METADATA_FIELDS}
+        for name in SITE_FIELDS:
+            if metadata.get(name) is not None:
+                columns[name] = np.asarray(metadata[name], dtype=float)
+
+        series = {name: None for name in SERIES_FIELDS}
+        has_series = {name: np.zeros(n_sites, dtype=bool) for name in SERIES_FIELDS}
+        file_type = result.get("file_type")
+        if file_type in _TOTAL_FIELDS:
+            if metadata.get("total") is not None:
+                columns[_TOTAL_FIELDS[file_type]] = np.asarray(metadata["total"], dtype=float)
+            if result.get("site_series") is not None:
+                series[file_type] = result["site_series"]
+                has_series[file_type] = np.asarray(result["site_has_series"], dtype=bool)
+
+        return cls(
+            site_numbers=np.asarray(site_numbers, dtype=np.int64),
+            columns=columns,
+            series=series,
+            has_series=has_series,
+            source_files=source_files,
+            **globals_,
+        )
+
+    @classmethod
+    def merge(cls, tables: List["SiteTable"], file_prefix: Optional[str] = None) -> "SiteTable":
+        """
+        Merge the tables of files sharing a prefix into one table.
+
+        Sites are the union of all tables, in order of first appearance.
+        Site metadata comes from the first table containing the site (a
+        mismatch in a later table is logged), totals and time series from
+        whichever table provides them, and global time arrays from the
+        first table.
+
+        Args:
+            tables: Tables to merge, in file order
+            file_prefix: Prefix recorded on the merged table
+        """
+        source_files = [name for table in tables for name in table.source_files]
+        if not tables:
+            return cls.empty(file_prefix=file_prefix)
+
+        all_numbers = np.concatenate([table.site_numbers for table in tables])
+        _, first_seen = np.unique(all_numbers, return_index=True)
+        site_numbers = all_numbers[np.sort(first_seen)]
+        n_sites = len(site_numbers)
+        order = np.argsort(site_numbers, kind="stable")
+        sorted_numbers = site_numbers[order]
+
+        columns = {name: np.full(n_sites, np.nan) for name in METADATA_FIELDS}
+        has_series = {name: np.zeros(n_sites, dtype=bool) for name in SERIES_FIELDS}
+        series = {name: None for name in SERIES_FIELDS}
+        n_times = {
+            name: max(
+                (t.series[name].shape[1] for t in tables if t.series[name] is not None),
+                default=None,
+            )
+            for name in SERIES_FIELDS
+        }
+        assigned = np.zeros(n_sites, dtype=bool)
+
+        for table in tables:
+            rows = order[np.searchsorted(sorted_numbers, table.site_numbers)]
+
+            # Metadata from the first occurrence; warn where later files disagree
+            seen = assigned[rows]
+            for name in SITE_FIELDS:
+                ours, theirs = columns[name][rows[seen]], table.columns[name][seen]
+                differs = ~np.isnan(ours) & ~np.isnan(theirs) & (ours != theirs)
+                if differs.any():
+                    logger.warning(
+                        f"{int(differs.sum())} site(s) have mismatched '{name}' in "
+                        f"{', '.join(table.source_files)} (e.g. site "
+                        f"{int(table.site_numbers[seen][differs][0])}); keeping the first value"
+                    )
+                columns[name][rows[~seen]] = table.columns[name][~seen]
+            assigned[rows] = True
+
+            for name in SERIES_FIELDS:
+                total_name = _TOTAL_FIELDS[name]
+                totals = table.columns[total_name]
+                known = ~np.isnan(totals)
+                columns[total_name][rows[known]] = totals[known]
+
+                values = table.series[name]
+                if values is None:
+                    continue
+                if series[name] is None:
+                    series[name] = np.zeros((n_sites, n_times[name]), dtype=np.int64)
+                if values.shape[1] != n_times[name]:
+                    logger.warning(
+                        f"{name} series in {', '.join(table.source_files)} have "
+                        f"{values.shape[1]} time points, padding to {n_times[name]}"
+                    )
+                present = table.has_series[name]
+                series[name][rows[present], : values.shape[1]] = values[present]
+                has_series[name][rows[present]] = True
+
+        first = tables[0]
+        return cls(
+            site_numbers=site_numbers,
+            columns=columns,
+            series=series,
+            has_series=has_series,
+            supersaturation=first.supersaturation,
+            time=first.time,
+            iterations=first.iterations,
+            file_prefix=file_prefix,
+            source_files=source_files,
+        )
+
+    @classmethod
+    def from_result(cls, result: Dict) -> "SiteTable":
+        """
+        Table for a merged result, built from its site dicts if it has no table.
+
+        Args:
+            result: Merged result (from merge_site_results, a loaded results
+                file, or an exported JSON file)
+        """
+        sites = result["sites"]
+        if isinstance(sites, SiteRecords):
+            return sites.table
+
+        site_values = list(sites.values())
+        n_sites = len(site_values)
+        columns = {
+            name: np.array(
+                [np.nan if site.get(name) is None else float(site[name]) for site in site_values],
+                dtype=float,
+            )
+            for name in METADATA_FIELDS
+        }
+
+        series = {name: None for name in SERIES_FIELDS}
+        has_series = {}
+        for name in SERIES_FIELDS:
+            rows = [site.get(name) for site in site_values]
+            has_series[name] = np.array([r is not None for r in rows], dtype=bool)
+            n_times = max((len(r) for r in rows if r is not None), default=None)
+            if n_times is not None:
+                matrix = np.zeros((n_sites, n_times), dtype=np.int64)
+                for j, r in enumerate(rows):
+                    if r is not None:
+                        matrix[j, : len(r)] = r
+                series[name] = matrix
+
+        table = cls(
+            site_numbers=np.array([int(n) for n in sites], dtype=np.int64),
+            columns=columns,
+            series=series,
+            has_series=has_series,
+            supersaturation=_optional_array(result.get("supersaturation")),
+            time=_optional_array(result.get("time")),
+            iterations=_optional_array(result.get("iterations")),
+            file_prefix=result.get("file_prefix"),
+            source_files=list(result.get("source_files", [])),
+        )
+
+        interactions = [site.get("interactions") for site in site_values]
+        if any(i is not None for i in interactions):
+            table.set_interactions(
+                {
+                    int(n): {int(k): int(v) for k, v in i.items()}
+                    for n, i in zip(sites, interactions)
+                    if i
+                }
+            )
+            table.has_interactions = np.array([i is not None for i in interactions], dtype=bool)
+        return table
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Flat name -> array mapping for storage (see from_arrays)."""
+        arrays = {
+            "site_numbers": self.site_numbers,
+            "source_files": np.array(self.source_files, dtype=str),
+        }
+        for name in GLOBAL_FIELDS:
+            if getattr(self, name) is not None:
+                arrays[name] = np.asarray(getattr(self, name))
+        arrays.update(self.columns)
+
+        for name in SERIES_FIELDS:
+            arrays[f"{name}_present"] = self.has_series[name]
+            if self.series[name] is not None:
+                arrays[name] = _compact_int(self.series[name])
+
+        if self.interactions is not None:
+            arrays["interactions_present"] = self.has_interactions
+            arrays["interactions_indptr"] = self.interactions.indptr
+            arrays["interactions_ids"] = _compact_int(self.interactions.indices)
+            arrays["interactions_counts"] = _compact_int(self.interactions.data)
+            arrays["interactions_shape"] = np.array(self.interactions.shape, dtype=np.int64)
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Mapping, file_prefix: Optional[str] = None) -> "SiteTable":
+        """Rebuild a table from the arrays written by to_arrays."""
+        series = {
+            name: arrays[name].astype(np.int64) if name in arrays else None
+            for name in SERIES_FIELDS
+        }
+        table = cls(
+            site_numbers=arrays["site_numbers"].astype(np.int64),
+            columns={name: arrays[name] for name in METADATA_FIELDS},
+            series=series,
+            has_series={name: arrays[f"{name}_present"] for name in SERIES_FIELDS},
+            file_prefix=file_prefix,
+            source_files=arrays["source_files"].tolist(),
+            **{name: arrays.get(name) for name in GLOBAL_FIELDS},
+        )
+        if "interactions_indptr" in arrays:
+            table.interactions = sparse.csr_array(
+                (
+                    arrays["interactions_counts"].astype(np.int64),
+                    arrays["interactions_ids"].astype(np.int32),
+                    arrays["interactions_indptr"],
+                ),
+                shape=tuple(arrays["interactions_shape"].tolist()),
+            )
+            table.has_interactions = arrays["interactions_present"]
+        return table
+
+    def rows_of(self, site_numbers) -> np.ndarray:
+        """Row index of each site number (-1 where the site is not in the table)."""
+        site_numbers = np.asarray(site_numbers, dtype=np.int64)
+        if len(self) == 0:
+            return np.full(site_numbers.shape, -1, dtype=np.int64)
+        order = np.argsort(self.site_numbers, kind="stable")
+        sorted_numbers = self.site_numbers[order]
+        pos = np.clip(np.searchsorted(sorted_numbers, site_numbers), 0, len(self) - 1)
+        return np.where(sorted_numbers[pos] == site_numbers, order[pos], -1)
+
+    def row_of(self, site_number) -> int:
+        """Row index of *site_number*; raises KeyError if it is not in the table."""
+        if self._row_index is None:
+            self._row_index = {n: j for j, n in enumerate(self.site_numbers.tolist())}
+        return self._row_index[int(site_number)]
+
+    def set_interactions(self, interactions) -> None:
+        """
+        Attach count-file interactions to the table.
+
+        Every site gets an interaction row (empty for sites missing from
+        *interactions*), matching merge_interactions on site dictionaries.
+
+        Args:
+            interactions: A SiteInteractions from parse_count_matrix, or a
+                site number -> {interaction ID: frequency} dict
+        """
+        if not isinstance(interactions, SiteInteractions):
+            interactions = SiteInteractions.from_dict(interactions)
+
+        source = interactions.matrix.tocoo()
+        rows = self.rows_of(interactions.site_numbers)[source.row]
+        keep = rows >= 0
+        matrix = sparse.coo_array(
+            (source.data[keep], (rows[keep], source.col[keep])),
+            shape=(len(self), interactions.matrix.shape[1]),
+        )
+        self.interactions = matrix.tocsr()
+        self.has_interactions = np.ones(len(self), dtype=bool)
+        self._sites = None
+
+    def interactions_of(self, row: int) -> Optional[Dict[int, int]]:
+        """Interaction dict of the site at *row*, or None without count-file data."""
+        if self.has_interactions is None or not self.has_interactions[row]:
+            return None
+        span = slice(self.interactions.indptr[row], self.interactions.indptr[row + 1])
+        return dict(
+            zip(self.interactions.indices[span].tolist(), self.interactions.data[span].tolist())
+        )
+
+    def series_of(self, name: str, row: int) -> Optional[np.ndarray]:
+        """Time series *name* of the site at *row* (a view), or None."""
+        if self.series[name] is None or not self.has_series[name][row]:
+            return None
+        return self.series[name][row]
+
+    @property
+    def sites(self) -> "SiteRecords":
+        """Read-only ``{site_number: site_dict}`` view of the table."""
+        if self._sites is None:
+            self._sites = SiteRecords(self)
+        return self._sites
+
+    def filter_mask(self, column: str, operator: str, value) -> np.ndarray:
+        """
+        Boolean mask of the sites passing one data filter.
+
+        Missing values only pass '!=', numeric columns compare against
+        float(value), and a value that cannot be converted fails every site.
+
+        Args:
+            column: Metadata column, 'site_number' or 'file_prefix'
+            operator: One of ==, !=, >, >=, <, <=, contains, not contains
+            value: Filter value as entered by the user
+        """
+        n_sites = len(self)
+        if column == "file_prefix":
+            prefix = np.array([self.file_prefix], dtype=object)
+            passed = _compare_strings(prefix, operator, str(value))
+            return np.full(n_sites, bool(passed[0]))
+        if column == "site_number":
+            values = self.site_numbers.astype(float)
+            convert = int
+        elif column in METADATA_FIELDS:
+            values = self.columns[column]
+            convert = METADATA_FIELDS[column]
+        else:
+            return np.zeros(n_sites, dtype=bool)
+
+        missing = np.isnan(values)
+        try:
+            target = float(value)
+        except (TypeError, ValueError):
+            return missing & (operator == "!=")
+
+        if operator in _COMPARISONS:
+            with np.errstate(invalid="ignore"):
+                passed = _COMPARISONS[operator](values, target)
+        elif operator in ("contains", "not contains"):
+            text = np.array([str(v) for v in nan_to_python(values, convert)], dtype=object)
+            passed = _compare_strings(text, operator, str(target))
+        else:
+            logger.warning(f"Unknown operator: {operator}")
+            return ~missing
+
+        return np.where(missing, operator == "!=", passed)
+
+    def interaction_mask(self, interaction_filters: Dict) -> np.ndarray:
+        """
+        Boolean mask of the sites passing the interaction filters.
+
+        A site passes when it has every filtered interaction ID with one of
+        the selected frequencies ("Any" accepts any frequency).  Sites
+        without count-file data fail any non-empty filter.
+
+        Args:
+            interaction_filters: interaction ID -> list of selected frequencies
+        """
+        n_sites = len(self)
+        if not interaction_filters:
+            return np.ones(n_sites, dtype=bool)
+        if self.interactions is None:
+            return np.zeros(n_sites, dtype=bool)
+
+        matrix = self.interactions
+        rows = np.repeat(np.arange(n_sites), np.diff(matrix.indptr))
+        mask = np.asarray(self.has_interactions, dtype=bool).copy()
+        for interaction_id, selected_freqs in interaction_filters.items():
+            hits = matrix.indices == int(interaction_id)
+            if "Any" not in selected_freqs:
+                hits &= np.isin(matrix.data, [int(f) for f in selected_freqs])
+            present = np.zeros(n_sites, dtype=bool)
+            present[rows[hits]] = True
+            mask &= present
+        return mask
+
+    def interaction_max_frequencies(self) -> Dict[int, int]:
+        """Highest frequency of each interaction ID present in the table."""
+        if self.interactions is None or self.interactions.nnz == 0:
+            return {}
+        ids, freqs = self.interactions.indices, self.interactions.data
+        maxima = np.full(self.interactions.shape[1], np.iinfo(np.int64).min)
+        np.maximum.at(maxima, ids, freqs)
+        present = np.flatnonzero(np.bincount(ids, minlength=len(maxima)))
+        return dict(zip(present.tolist(), maxima[present].tolist()))
+
+    def passes_filters(self, data_filters: List[Dict], interaction_filters: Dict) -> np.ndarray:
+        """
+        Boolean mask of the sites passing all data filters and interaction filters.
+
+        Args:
+            data_filters: Filter dicts with 'column', 'operator' and 'value'
+            interaction_filters: interaction ID -> list of selected frequencies
+        """
+        mask = self.interaction_mask(interaction_filters)
+        for filter_config in data_filters or []:
+            mask &= self.filter_mask(
+                filter_config["column"], filter_config["operator"], filter_config["value"]
+            )
+        return mask
+
+    def summary(self) -> Dict:
+        """Summary statistics, in the format returned by get_site_summary."""
+        occupation = self.columns["occupation"]
+        occupied = int(np.count_nonzero(~np.isnan(occupation) & (occupation != 0)))
+        has_events = self.has_series["events"]
+        has_population = self.has_series["population"]
+
+        def value_range(name, convert):
+            values = self.columns[name]
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                return [None, None]
+            return [convert(values.min()), convert(values.max())]
+
+        tile_types = self.columns["tile_type"]
+        tile_types = np.unique(tile_types[~np.isnan(tile_types)]).astype(np.int64)
+
+        return {
+            "total_sites": len(self),
+            "occupied_sites": occupied,
+            "unoccupied_sites": len(self) - occupied,
+            "time_points": len(self.time) if self.time is not None else 0,
+            "iterations": len(self.iterations) if self.iterations is not None else 0,
+            "supersaturation_points": len(self.supersaturation)
+            if self.supersaturation is not None
+            else 0,
+            "tile_types": tile_types.tolist(),
+            "energy_range": value_range("energy", float),
+            "coordination_range": value_range("coordination", int),
+            "sites_with_events": int(has_events.sum()),
+            "sites_with_population": int(has_population.sum()),
+            "sites_with_both": int((has_events & has_population).sum()),
+        }
+
+    def to_result(self) -> Dict:
+        """The merged-result dictionary for this prefix, with ``sites`` as a view."""
+        return {
+            "supersaturation": self.supersaturation,
+            "time": self.time,
+            "iterations": self.iterations,
+            "file_prefix": self.file_prefix,
+            "source_files": self.source_files,
+            "sites": self.sites,
+        }
+
+
+def _optional_array(values) -> Optional[np.ndarray]:
+    return None if values is None else np.asarray(values)
+
+
+def _compact_int(values: np.ndarray) -> np.ndarray:
+    """Integer data in the smallest dtype that holds it, for storage."""
+    if values.size == 0:
+        return values.astype(np.int8)
+    dtype = np.result_type(np.min_scalar_type(values.min()), np.min_scalar_type(values.max()))
+    return values.astype(dtype)
+
+
+def _compare_strings(values: np.ndarray, operator: str, target: str) -> np.ndarray:
+    """Apply a filter operator to an object array of strings."""
+    needle = target.lower()
+    if operator == "contains":
+        return np.array([needle in v.lower() for v in values], dtype=bool)
+    if operator == "not contains":
+        return np.array([needle not in v.lower() for v in values], dtype=bool)
+    if operator in _COMPARISONS:
+        return _COMPARISONS[operator](values, target).astype(bool)
+    logger.warning(f"Unknown operator: {operator}")
+    return np.ones(len(values), dtype=bool)
+
+
+class SiteRecords(Mapping):
+    """
+    Read-only ``{site_number: site_dict}`` view of a SiteTable.
+
+    Site dictionaries have the keys produced by merge_site_results and are
+    built on first access; ``events``/``population`` are row views of the
+    table's series matrices.
+    """
+
+    def __init__(self, table: SiteTable):
+        self.table = table
+        self._columns: Optional[Dict[str, list]] = None
+        self._cache: Dict[int, dict] = {}
+
+    def _python_columns(self) -> Dict[str, list]:
+        if self._columns is None:
+            self._columns = {
+                name: nan_to_python(self.table.columns[name], convert)
+                for name, convert in METADATA_FIELDS.items()
+            }
+        return self._columns
+
+    def __getitem__(self, site_number) -> dict:
+        site_number = int(site_number)
+        site = self._cache.get(site_number)
+        if site is None:
+            row = self.table.row_of(site_number)
+            columns = self._python_columns()
+            site = {name: columns[name][row] for name in METADATA_FIELDS}
+            for name in SERIES_FIELDS:
+                site[name] = self.table.series_of(name, row)
+            site["interactions"] = self.table.interactions_of(row)
+            self._cache[site_number] = site
+        return site
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.table.site_numbers.tolist())
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __contains__(self, site_number) -> bool:
+        try:
+            self.table.row_of(site_number)
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+
+class SitePoints(Sequence):
+    """
+    Plotted sites drawn from one or more SiteTables, in point order.
+
+    Each point is a (table, row) pair; indexing returns the metadata dict
+    used for hover and click handling, built on demand, while
+    :meth:`column` gives whole columns for colouring.
+
+    Args:
+        tables: Tables the points are drawn from
+        table_index: (n_points,) index into *tables* of each point
+        rows: (n_points,) row of each point within its table
+        matches: (n_points,) bool, whether each point passes the active filters
+    """
+
+    def __init__(
+        self,
+        tables: SequenceType[SiteTable],
+        table_index: np.ndarray,
+        rows: np.ndarray,
+        matches: Optional[np.ndarray] = None,
+    ):
+        self.tables = list(tables)
+        self.table_index = np.asarray(table_index, dtype=np.int64)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.matches = (
+            np.ones(len(self.rows), dtype=bool)
+            if matches is None
+            else np.asarray(matches, dtype=bool)
+        )
+
+    @classmethod
+    def empty(cls) -> "SitePoints":
+        """A selection with no points."""
+        return cls([], np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index) -> dict:
+        index = _operator.index(index)
+        if not -len(self) <= index < len(self):
+            raise IndexError("site point index out of range")
+        table = self.tables[self.table_index[index]]
+        row = int(self.rows[index])
+        site_number = int(table.site_numbers[row])
+        site = table.sites[site_number]
+        metadata = {"file_prefix": table.file_prefix, "site_number": site_number}
+        metadata.update((name, site[name]) for name in METADATA_FIELDS)
+        metadata["interactions"] = site["interactions"]
+        return metadata
+
+    def delete(self, index: int) -> "SitePoints":
+        """A copy without the point at *index*."""
+        return SitePoints(
+            self.tables,
+            np.delete(self.table_index, index),
+            np.delete(self.rows, index),
+            np.delete(self.matches, index),
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Values of *name* for every point.
+
+        Metadata columns are float arrays with NaN for missing values,
+        'site_number' is int64, 'file_prefix' an object array of strings,
+        and unknown names give an object array of None.
+        """
+        if name == "file_prefix":
+            prefixes = np.empty(len(self.tables), dtype=object)
+            prefixes[:] = [t.file_prefix for t in self.tables]
+            return prefixes[self.table_index]
+        if name == "site_number":
+            source = [t.site_numbers for t in self.tables]
+            dtype = np.int64
+        elif name in METADATA_FIELDS:
+            source = [t.columns[name] for t in self.tables]
+            dtype = float
+        else:
+            return np.full(len(self), None, dtype=object)
+
+        values = np.empty(len(self), dtype=dtype)
+        for i, table_values in enumerate(source):
+            here = self.table_index == i
+            values[here] = table_values[self.rows[here]]
+        return values
@@ -280,32 +280,40 @@ def summary_compare(summary_csv, aspect_csv=False, aspect_df=""):
     int_cols = summary_cols[1:]
     summary_df = summary_df.set_index(summary_cols[0])
     summary_df.index = summary_df.index.astype(str)
-    compare_array = np.empty((0, len(aspect_cols) + len(int_cols)))
 
-    for _, row in aspect_df.iterrows():
-        sim_num = None
+    # Summary row label for every aspect row, e.g. "<prefix>_<n>"
+    if "Simulation Number" in aspect_cols:
+        sim_nums = aspect_df["Simulation Number"]
         try:
-            sim_num = int(row["Simulation Number"]) - 1 + start_num
-        except TypeError:
-            sim_num = row["Simulation Number"]
-        except KeyError:
-            sim_num = row.iloc[0]
-
-        num_string = f"{search_string}_{sim_num}" if search_string is not None else str(sim_num)
-        aspect_row = row.values
-        aspect_row = np.array([aspect_row])
-        collect_row = summary_df.filter(items=[num_string], axis=0).values
-        if collect_row.shape[0] == 0:
-            raise ValueError(
-                f"Simulation '{num_string}' was not found in the summary file. "
-                "The summary file may not match the current dataset."
-            )
-        collect_row = np.concatenate([aspect_row, collect_row], axis=1)
-        compare_array = np.append(compare_array, collect_row, axis=0)
+            sim_nums = sim_nums.astype(np.int64) - 1 + start_num
+        except (TypeError, ValueError):
+
+            def _offset(value):
+                try:
+                    return int(value) - 1 + start_num
+                except TypeError:
+                    return value
+
+            sim_nums = sim_nums.map(_offset)
+    else:
+        sim_nums = aspect_df.iloc[:, 0]
+    num_strings = sim_nums.map(str)
+    if search_string is not None:
+        num_strings = search_string + "_" + num_strings
+
+    missing = ~num_strings.isin(summary_df.index)
+    if missing.any():
+        raise ValueError(
+            f"Simulation '{num_strings[missing].iloc[0]}' was not found in the summary file. "
+            "The summary file may not match the current dataset."
+        )
 
-    cols = aspect_cols.append(int_cols)
-    compare_df = pd.DataFrame(compare_array, columns=cols)
-    full_df = compare_df.sort_values(by=["Simulation Number"], ignore_index=True)
+    matched = summary_df.reindex(num_strings.to_numpy())
+    compare_df = pd.concat(
+        [aspect_df.reset_index(drop=True), matched.reset_index(drop=True)], axis=1
+    )
+    compare_df.columns = aspect_cols.append(int_cols)
+    full_df = compare_df.sort_values(by=["Simulation Number"], ignore_index=True, kind="stable")
     return full_df
 
 
@@ -350,27 +358,17 @@ def combine_xyz_cda(CDA_df, XYZ_df):
         CDA_df.shape,
         XYZ_df.shape,
     )
-    # Initialize a list to collect rows
-    collected_rows = []
-    combine_array = np.empty((0, len(xyz_cols) + len(cda_cols)))
-
-    for index, row in XYZ_df.iterrows():
-        sim_num = int(row["Simulation Number"]) - 1
-        xyz_row = row.values
-        xyz_row = np.array([xyz_row])
-        cda_row = CDA_df.iloc[sim_num, 1:].values.reshape(1, -1)
-
-        # Concatenate xyz_row with cda_row along axis 1 to form a combined row
-        combined_row = np.concatenate([xyz_row, cda_row], axis=1)
-        collected_rows.append(combined_row[0])
-
-    # Convert the collected rows into a DataFrame
-    combined_array = np.asarray(collected_rows)
-    logger.debug("Combined array shape: %s", combined_array.shape)
+    # "Simulation Number" n pairs with the n-th CDA row
+    positions = XYZ_df["Simulation Number"].astype(np.int64).to_numpy() - 1
+    cda_rows = CDA_df.iloc[positions, 1:]
+
+    compare_df = pd.concat(
+        [XYZ_df.reset_index(drop=True), cda_rows.reset_index(drop=True)], axis=1
+    )
     cols = xyz_cols.tolist() + cda_cols.tolist()
     logger.debug("Combined column titles: %s", cols)
-    compare_df = pd.DataFrame(combined_array, columns=cols)
-    combine_df = compare_df.sort_values(by=["Simulation Number"], ignore_index=True)
+    compare_df.columns = cols
+    combine_df = compare_df.sort_values(by=["Simulation Number"], ignore_index=True, kind="stable")
 
     logger.debug("Combined df:\n%s", combine_df)
 
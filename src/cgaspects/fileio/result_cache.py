@@ -0,0 +1,214 @@
+"""Content-addressed cache of per-file analysis results.
+
+Each result is stored under a key built from the BLAKE2b digest of the
+input file and the options that affect the result, so unchanged files are
+never analysed twice, whichever folder or run they are found in.  Because
+files with the same contents share an entry, results must not hold anything
+derived from the file name or location (such as a simulation number); add
+those after :meth:`ResultCache.get`.  Entries
+live in ``<input folder>/crystalaspects/cache/<analysis>/`` as small
+``.npz`` files holding the JSON-encoded result plus any arrays.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+from .find_data import create_aspects_folder
+from .xyz_file import _file_digest
+
+LOG = logging.getLogger("CA:ResultCache")
+
+RESULT_CACHE_DIR = "cache"
+DIGEST_INDEX_NAME = "digests.json"
+RUN_INDEX_NAME = "runs.json"
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in the result cache")
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        with path.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json(path: Path, data: dict) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh)
+    os.replace(tmp_path, path)
+
+
+class ResultCache:
+    """Per-file results of one analysis, keyed on file content and options.
+
+    File digests are remembered with the file size and modification time,
+    so a file is only re-hashed when it may have changed.  Call
+    :meth:`flush` (or use the cache as a context manager) to persist the
+    digest index after a run.
+
+    Files with identical contents share one entry, so results must not
+    contain fields derived from the file name or path.
+
+    Parameters
+    ----------
+    folder : Path
+        Cache root, usually from :meth:`for_input_folder`.
+    analysis : str
+        Name of the analysis; results of different analyses never mix.
+    options : dict, optional
+        JSON-serialisable options that change the per-file result.
+    version : int
+        Bumped when the stored result format or the analysis changes.
+    """
+
+    def __init__(
+        self, folder: Path, analysis: str, options: Optional[dict] = None, version: int = 1
+    ):
+        self.root = Path(folder)
+        self.folder = self.root / analysis
+        self.analysis = analysis
+        self.options_key = json.dumps(
+            [version, analysis, options or {}], sort_keys=True, default=_json_default
+        )
+        self.hits = 0
+        self.misses = 0
+        self._digests = None
+        self._digests_changed = False
+
+    @classmethod
+    def for_input_folder(
+        cls, input_folder: Path, analysis: str, options: Optional[dict] = None, **kwargs
+    ) -> "ResultCache":
+        """Cache kept next to the analysis outputs of *input_folder*."""
+        folder = Path(input_folder) / "crystalaspects" / RESULT_CACHE_DIR
+        return cls(folder, analysis, options, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    # ---- Keys ----
+    def digest(self, path: Path) -> str:
+        """Content digest of *path*, re-hashed only when its size or mtime changed."""
+        if self._digests is None:
+            self._digests = _read_json(self.root / DIGEST_INDEX_NAME)
+        path = Path(path).resolve()
+        stat = path.stat()
+        entry = self._digests.get(str(path))
+        if entry is not None and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return entry[2]
+        digest = _file_digest(path)
+        self._digests[str(path)] = [stat.st_size, stat.st_mtime_ns, digest]
+        self._digests_changed = True
+        return digest
+
+    def key(self, path: Path) -> str:
+        """Cache key of the result for *path* under this cache's options."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(self.options_key.encode())
+        hasher.update(self.digest(path).encode())
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.folder / key[:2] / f"{key}.npz"
+
+    # ---- Entries ----
+    def get(self, path: Path) -> Optional[Tuple[Any, dict]]:
+        """Return ``(data, arrays)`` stored for *path*, or None on a miss."""
+        try:
+            entry = self._entry_path(self.key(path))
+            with np.load(entry, allow_pickle=False) as stored:
+                data = json.loads(str(stored["data"]))
+                arrays = {
+                    name[2:]: stored[name] for name in stored.files if name.startswith("a_")
+                }
+        except (OSError, KeyError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                LOG.debug("Unreadable cache entry for %s: %s", Path(path).name, e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data, arrays
+
+    def put(self, path: Path, data: Any, arrays: Optional[dict] = None) -> bool:
+        """Store the result for *path*; return True on success.
+
+        *data* must be JSON-serialisable (numpy scalars are converted) and
+        *arrays* maps names to numpy arrays stored alongside it.
+        """
+        try:
+            entry = self._entry_path(self.key(path))
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"data": np.array(json.dumps(data, default=_json_default))}
+            for name, array in (arrays or {}).items():
+                payload[f"a_{name}"] = np.asarray(array)
+            tmp_path = entry.with_name(entry.name + ".tmp.npz")
+            with tmp_path.open("wb") as fh:
+                np.savez(fh, **payload)
+            os.replace(tmp_path, entry)
+        except (OSError, TypeError, ValueError) as e:
+            LOG.debug("Could not cache result for %s: %s", Path(path).name, e)
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Persist the digest index."""
+        if not self._digests_changed:
+            return
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            _write_json(self.root / DIGEST_INDEX_NAME, self._digests)
+            self._digests_changed = False
+        except OSError as e:
+            LOG.debug("Could not write digest index: %s", e)
+
+    # ---- Output folders ----
+    def run_key(self, paths: Iterable[Path], extra: Any = None) -> str:
+        """Key of a whole run: every input's key plus run-level options."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(json.dumps(extra, sort_keys=True, default=_json_default).encode())
+        for path in paths:
+            hasher.update(self.key(path).encode())
+        return hasher.hexdigest()
+
+    def output_folder(self, input_folder: Path, paths: Iterable[Path], extra: Any = None) -> Path:
+        """Output folder of a run over *paths*.
+
+        A run whose inputs and options match an earlier run writes into
+        that run's folder again instead of a fresh timestamped one.
+        """
+        run_key = self.run_key(paths, extra)
+        runs_path = self.folder / RUN_INDEX_NAME
+        runs = _read_json(runs_path)
+        previous = runs.get(run_key)
+        if previous is not None and Path(previous).is_dir():
+            LOG.info("Inputs unchanged since %s; reusing its output folder", Path(previous).name)
+            return Path(previous)
+
+        folder = create_aspects_folder(input_folder)
+        runs[run_key] = str(folder)
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            _write_json(runs_path, runs)
+        except OSError as e:
+            LOG.debug("Could not write run index: %s", e)
+        return folder
@@ -0,0 +1,169 @@
+"""Binary storage for merged site analysis results.
+
+Site analysis results are written to a single ``.npz`` archive instead of an
+indented JSON document.  For every file prefix the archive holds the arrays
+of its :class:`~cgaspects.analysis.site_table.SiteTable`: site metadata
+columns (NaN where a value is missing), the events/population matrices in
+the smallest integer dtype that fits, and the count-file interactions in
+compressed sparse row form.
+
+:func:`load_site_results` opens the archive lazily: arrays are only read
+when a prefix is first accessed, and the per-site dictionaries handed to the
+plotting code are only built for the sites that are actually touched.
+"""
+
+import json
+import logging
+import zipfile
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from ..analysis.site_table import SiteTable
+
+logger = logging.getLogger("CA:SiteResults")
+
+SITE_RESULTS_NAME = "site_analysis_data.npz"
+SITE_RESULTS_JSON_NAME = "site_analysis_data.json"
+
+
+class SiteResultsWriter:
+    """Stream merged site results into an ``.npz`` archive one prefix at a time.
+
+    Each prefix is written as soon as it is added, so callers producing
+    results prefix by prefix only need to hold one merged result in memory.
+    The prefix table is written on :meth:`close`; when *prefixes* is given
+    it sets the order prefixes are listed in, whatever order they arrive in.
+    """
+
+    def __init__(self, output_path: Path, prefixes: Optional[list] = None):
+        self.path = Path(output_path)
+        self._order = list(prefixes) if prefixes is not None else None
+        self._groups: Dict[str, int] = {}
+        self._zip = zipfile.ZipFile(self.path, mode="w", allowZip64=True)
+
+    def _write_array(self, name: str, values: np.ndarray) -> None:
+        with self._zip.open(f"{name}.npy", mode="w", force_zip64=True) as f:
+            np.lib.format.write_array(f, np.asanyarray(values), allow_pickle=False)
+
+    def add(self, prefix: str, result: dict) -> None:
+        """Write the merged result for *prefix*."""
+        group = len(self._groups)
+        for name, values in SiteTable.from_result(result).to_arrays().items():
+            self._write_array(f"{group}/{name}", values)
+        self._groups[prefix] = group
+
+    def close(self) -> Path:
+        """Write the prefix table and finish the archive."""
+        order = self._order if self._order is not None else list(self._groups)
+        prefixes = [p for p in order if p in self._groups]
+        self._write_array("prefixes", np.array(prefixes, dtype=str))
+        self._write_array("groups", np.array([self._groups[p] for p in prefixes], dtype=np.int64))
+        self._zip.close()
+        logger.info("Saved site analysis data to %s", self.path)
+        return self.path
+
+    def discard(self) -> None:
+        """Abandon the archive, removing the partially written file."""
+        self._zip.close()
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def save_site_results(merged_results: Dict[str, dict], output_path: Path) -> Path:
+    """Write merged site results (keyed by file prefix) to an ``.npz`` archive."""
+    with SiteResultsWriter(output_path) as writer:
+        for prefix, result in merged_results.items():
+            writer.add(prefix, result)
+    return writer.path
+
+
+def export_site_results_json(site_results: Mapping, output_path: Path) -> Path:
+    """Write site results (merged dicts or a loaded :class:`SiteResults`) as JSON."""
+
+    def convert_to_serializable(obj):
+        """Convert numpy types to Python native types for JSON serialization."""
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        elif isinstance(obj, (np.integer, np.floating)):
+            return obj.item()
+        elif isinstance(obj, Mapping):
+            return {
+                (k if isinstance(k, (str, int, float, bool)) else str(k)): convert_to_serializable(v)
+                for k, v in obj.items()
+            }
+        elif isinstance(obj, list):
+            return [convert_to_serializable(item) for item in obj]
+        return obj
+
+    output_path = Path(output_path)
+    with open(output_path, "w") as f:
+        json.dump(convert_to_serializable(site_results), f, indent=2)
+    logger.info("Saved site analysis data to %s", output_path)
+    return output_path
+
+
+class SiteResults(Mapping):
+    """Lazily loaded ``{file_prefix: dataset}`` mapping backed by an ``.npz`` archive.
+
+    Each dataset is a merged-result dict (``supersaturation``, ``time``,
+    ``iterations``, ``file_prefix``, ``source_files``) whose ``sites`` entry
+    is the read-only view of a :class:`SiteTable` (``sites.table``).
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._npz = np.load(self.path, allow_pickle=False)
+        self._prefixes = self._npz["prefixes"].tolist()
+        if "groups" in self._npz.files:
+            self._groups = self._npz["groups"].tolist()
+        else:
+            self._groups = list(range(len(self._prefixes)))
+        self._datasets: Dict[str, dict] = {}
+
+    def _load(self, index: int) -> dict:
+        group = f"{self._groups[index]}/"
+        arrays = {
+            name[len(group) :]: self._npz[name]
+            for name in self._npz.files
+            if name.startswith(group)
+        }
+        return SiteTable.from_arrays(arrays, file_prefix=self._prefixes[index]).to_result()
+
+    def __getitem__(self, prefix: str) -> dict:
+        dataset = self._datasets.get(prefix)
+        if dataset is None:
+            dataset = self._load(self._prefixes.index(prefix))
+            self._datasets[prefix] = dataset
+        return dataset
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._prefixes)
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+    def __contains__(self, prefix) -> bool:
+        return prefix in self._prefixes
+
+    def close(self) -> None:
+        self._npz.close()
+
+
+def load_site_results(path: Path) -> Mapping:
+    """Open saved site results: a lazy :class:`SiteResults` for ``.npz``, a dict for JSON."""
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path, "r") as f:
+            return json.load(f)
+    return SiteResults(path)
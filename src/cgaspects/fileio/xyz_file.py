@@ -1,9 +1,15 @@
+import hashlib
+import io
+import mmap
+import os
+import re
 import numpy as np
+import pandas as pd
 from typing import Tuple, List, Optional, Union, Iterable, Callable
 from pathlib import Path
 import trimesh
 import logging
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 
 from dataclasses import dataclass, field
@@ -92,6 +98,215 @@ def read_XYZ(filepath, progress_callback=None):
     return xyz, xyz_movie
 
 
+_NON_SPACE = re.compile(rb"\S")
+
+
+def _skip_lines(buf, start: int, n_lines: int, chunk_hint: int = 1 << 20) -> int:
+    """Return the byte offset just after the *n_lines*-th newline from *start*.
+
+    *buf* may be ``bytes`` or an ``mmap``; newlines are counted in bounded
+    chunks so memory use does not grow with the file size.
+    """
+    if n_lines <= 0:
+        return start
+    size = len(buf)
+    pos = start
+    remaining = n_lines
+    chunk = max(chunk_hint, 1 << 16)
+    while remaining > 0 and pos < size:
+        count = min(chunk, size - pos)
+        view = np.frombuffer(buf, dtype=np.uint8, count=count, offset=pos)
+        newlines = np.flatnonzero(view == ord("\n"))
+        del view
+        if len(newlines) >= remaining:
+            return pos + int(newlines[remaining - 1]) + 1
+        remaining -= len(newlines)
+        pos += count
+        chunk *= 2
+    return size
+
+
+def _index_xyz_frames(buf) -> List[Tuple[int, str, int, int]]:
+    """Locate every frame of a (multi-frame) XYZ file held in *buf*.
+
+    Returns
+    -------
+    list of tuple
+        ``(n_atoms, comment, body_start, body_end)`` for each frame, where the
+        body offsets delimit the particle rows of the frame within *buf*.
+    """
+    size = len(buf)
+    index = []
+    pos = 0
+    avg_line = 64
+    while pos < size:
+        eol = buf.find(b"\n", pos)
+        eol = size if eol == -1 else eol
+        header = buf[pos:eol].strip()
+        if not header:
+            # tolerate trailing blank lines at the end of the file
+            if _NON_SPACE.search(buf, pos) is None:
+                break
+            raise ValueError(f"Invalid XYZ header at frame {len(index)}: empty line")
+        try:
+            n_atoms = int(header)
+        except ValueError as e:
+            raise ValueError(f"Invalid XYZ header at frame {len(index)}: {e}")
+
+        comment_start = min(eol + 1, size)
+        comment_end = buf.find(b"\n", comment_start)
+        comment_end = size if comment_end == -1 else comment_end
+        comment = buf[comment_start:comment_end].decode("utf-8", errors="replace").strip()
+
+        body_start = min(comment_end + 1, size)
+        body_end = _skip_lines(buf, body_start, n_atoms, chunk_hint=int(n_atoms * avg_line * 1.1))
+        if n_atoms > 0 and body_end > body_start:
+            avg_line = max(1, (body_end - body_start) // n_atoms)
+        index.append((n_atoms, comment, body_start, body_end))
+        pos = body_end
+
+    return index
+
+
+def _parse_xyz_bodies(buf: bytes, index: List[Tuple[int, str, int, int]]) -> List[np.ndarray]:
+    """Tokenise all frame bodies of *buf* in one pass and split them per frame."""
+    counts = np.array([n_atoms for n_atoms, _, _, _ in index], dtype=np.int64)
+    empty = np.empty((0, 0), dtype=float)
+    if counts.sum() == 0:
+        return [empty for _ in index]
+
+    block = b"".join(buf[start:end] for n_atoms, _, start, end in index if n_atoms > 0)
+    data = pd.read_csv(
+        io.BytesIO(block),
+        sep=" ",
+        skipinitialspace=True,
+        header=None,
+        dtype=np.float64,
+        na_filter=False,
+    ).to_numpy()
+    if data.shape[0] != counts.sum():
+        raise ValueError(f"Expected {counts.sum()} particle rows, parsed {data.shape[0]}")
+
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    return [
+        data[bounds[i] : bounds[i + 1]] if counts[i] > 0 else empty for i in range(len(index))
+    ]
+
+
+def _parse_xyz_bodies_per_frame(
+    buf: bytes, index: List[Tuple[int, str, int, int]]
+) -> List[np.ndarray]:
+    """Fallback for :func:`_parse_xyz_bodies` parsing each frame on its own."""
+    raws = []
+    for n_atoms, _, start, end in index:
+        if n_atoms == 0:
+            raws.append(np.empty((0, 0), dtype=float))
+            continue
+        raws.append(
+            np.loadtxt(io.BytesIO(buf[start:end]), max_rows=n_atoms, dtype=float, ndmin=2)
+        )
+    return raws
+
+
+def _parse_xyz_block(block: bytes, n_atoms: int) -> np.ndarray:
+    """Parse the particle rows of a single frame read from disk."""
+    entry = [(n_atoms, "", 0, len(block))]
+    try:
+        return _parse_xyz_bodies(block, entry)[0]
+    except ValueError:
+        pass
+    try:
+        return _parse_xyz_bodies_per_frame(block, entry)[0]
+    except ValueError:
+        # same-length substitution, so the frame offsets stay valid
+        return _parse_xyz_bodies_per_frame(block.replace(b"*", b"0"), entry)[0]
+
+
+@dataclass
+class XYZFrameIndex:
+    """Byte offsets, atom counts and comments of every frame in an XYZ file.
+
+    The index is built with a single header scan and stored in a sidecar
+    file next to the XYZ (``<name>.XYZ.index.npz``), which is reused for as
+    long as the size and modification time of the XYZ file are unchanged.
+    """
+
+    counts: np.ndarray
+    starts: np.ndarray
+    ends: np.ndarray
+    comments: List[str]
+
+    SIDECAR_SUFFIX = ".index.npz"
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    @classmethod
+    def from_entries(cls, entries: List[Tuple[int, str, int, int]]) -> "XYZFrameIndex":
+        return cls(
+            counts=np.array([e[0] for e in entries], dtype=np.int64),
+            starts=np.array([e[2] for e in entries], dtype=np.int64),
+            ends=np.array([e[3] for e in entries], dtype=np.int64),
+            comments=[e[1] for e in entries],
+        )
+
+    @classmethod
+    def scan(cls, filepath: Path) -> "XYZFrameIndex":
+        """Build the index with one pass over the file (memory-mapped)."""
+        filepath = Path(filepath)
+        if filepath.stat().st_size == 0:
+            return cls.from_entries([])
+        with filepath.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            entries = _index_xyz_frames(mm)
+        return cls.from_entries(entries)
+
+    @classmethod
+    def sidecar_path(cls, filepath: Path) -> Path:
+        filepath = Path(filepath)
+        return filepath.with_name(filepath.name + cls.SIDECAR_SUFFIX)
+
+    @classmethod
+    def load(cls, filepath: Path, use_sidecar: bool = True) -> "XYZFrameIndex":
+        """Return the frame index of *filepath*, from its sidecar when still valid."""
+        filepath = Path(filepath)
+        stat = filepath.stat()
+        sidecar = cls.sidecar_path(filepath)
+
+        if use_sidecar and sidecar.is_file():
+            try:
+                with np.load(sidecar, allow_pickle=False) as data:
+                    if int(data["size"]) == stat.st_size and int(data["mtime_ns"]) == stat.st_mtime_ns:
+                        return cls(
+                            counts=data["counts"],
+                            starts=data["starts"],
+                            ends=data["ends"],
+                            comments=[str(c) for c in data["comments"]],
+                        )
+                LOG.debug("Stale frame index for %s, rescanning", filepath.name)
+            except (OSError, KeyError, ValueError) as e:
+                LOG.debug("Could not read frame index %s: %s", sidecar, e)
+
+        index = cls.scan(filepath)
+        if use_sidecar:
+            index.save(sidecar, stat)
+        return index
+
+    def save(self, sidecar: Path, stat) -> None:
+        try:
+            with Path(sidecar).open("wb") as fh:
+                np.savez(
+                    fh,
+                    counts=self.counts,
+                    starts=self.starts,
+                    ends=self.ends,
+                    comments=np.array(self.comments, dtype=str),
+                    size=np.int64(stat.st_size),
+                    mtime_ns=np.int64(stat.st_mtime_ns),
+                )
+        except OSError as e:
+            LOG.debug("Could not write frame index %s: %s", sidecar, e)
+
+
 ShapeMetrics = namedtuple(
     "ShapeMetrics",
     [
@@ -172,31 +387,220 @@ class Frames:
     @property
     def coords(self) -> dict[int, np.ndarray]:
         """All frame coordinates as dict {index: coords}."""
-        return {i: f.coords for i, f in enumerate(self._frames)}
+        return {i: f.coords for i, f in enumerate(self)}
 
     @property
     def raw_coords(self) -> dict[int, np.ndarray]:
         """All frame coordinates as dict {index: coords}."""
-        return {i: f.raw for i, f in enumerate(self._frames)}
+        return {i: f.raw for i, f in enumerate(self)}
 
     @property
     def comments(self) -> dict[int, Optional[str]]:
         """All frame comments as dict {index: comment}."""
-        return {i: f.comment for i, f in enumerate(self._frames)}
+        return {i: f.comment for i, f in enumerate(self)}
 
     def get_coords(self, idx: int) -> Optional[np.ndarray]:
         """Convenience: coords for a single frame."""
-        if -len(self._frames) <= idx < len(self._frames):
-            return self._frames[idx].coords
+        if -len(self) <= idx < len(self):
+            return self[idx].coords
         return None
 
     def get_raw_coords(self, idx: int) -> Optional[np.ndarray]:
         """Convenience: coords for a single frame."""
-        if -len(self._frames) <= idx < len(self._frames):
-            return self._frames[idx].raw
+        if -len(self) <= idx < len(self):
+            return self[idx].raw
         return None
 
 
+@dataclass
+class LazyFrames(Frames):
+    """Read-only Frames backed by an XYZ file, parsing each frame on first access.
+
+    Decoded frames are kept in a small LRU so that scrubbing back and forth
+    through a movie stays cheap while memory stays bounded.
+    """
+
+    filepath: Optional[Path] = None
+    index: Optional[XYZFrameIndex] = None
+    max_cached: int = 16
+    _cache: "OrderedDict[int, Frame]" = field(default_factory=OrderedDict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.index) if self.index is not None else 0
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Frame, Frames]:
+        if isinstance(idx, slice):
+            return Frames([self[i] for i in range(len(self))[idx]])
+
+        n_frames = len(self)
+        if not -n_frames <= idx < n_frames:
+            raise IndexError(f"Frame index {idx} out of range for {n_frames} frames")
+        idx = idx % n_frames
+
+        frame = self._cache.get(idx)
+        if frame is not None:
+            self._cache.move_to_end(idx)
+            return frame
+
+        frame = self._read_frame(idx)
+        self._cache[idx] = frame
+        while len(self._cache) > max(1, self.max_cached):
+            self._cache.popitem(last=False)
+        return frame
+
+    def __iter__(self) -> Iterable[Frame]:
+        return (self[i] for i in range(len(self)))
+
+    def append(self, frame: Frame) -> None:
+        raise TypeError("LazyFrames is read-only")
+
+    def extend(self, frames: Iterable[Frame]) -> None:
+        raise TypeError("LazyFrames is read-only")
+
+    @property
+    def comments(self) -> dict[int, Optional[str]]:
+        """All frame comments as dict {index: comment}, without parsing any frame."""
+        return dict(enumerate(self.index.comments)) if self.index is not None else {}
+
+    def _read_frame(self, idx: int) -> Frame:
+        n_atoms = int(self.index.counts[idx])
+        comment = self.index.comments[idx]
+        if n_atoms == 0:
+            return Frame(raw=np.empty((0, 0), dtype=float), comment=comment)
+
+        start, end = int(self.index.starts[idx]), int(self.index.ends[idx])
+        with Path(self.filepath).open("rb") as fh:
+            fh.seek(start)
+            block = fh.read(end - start)
+        return Frame(raw=_parse_xyz_block(block, n_atoms), comment=comment)
+
+
+def _file_digest(filepath: Path, chunk_size: int = 1 << 24) -> str:
+    """BLAKE2b digest of the file contents, read in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with Path(filepath).open("rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class XYZFrameCache:
+    """Binary on-disk cache of the parsed frames of an XYZ file.
+
+    All frames are stored as one concatenated ``float64`` matrix
+    (``<name>.XYZ.cache.npy``) with the per-frame atom counts, comments and
+    the cache key in ``<name>.XYZ.cache.npz``.  The key is the file size and
+    modification time; when those change the contents are re-hashed so a
+    touched or copied file still hits the cache.  Loading memory-maps the
+    matrix copy-on-write, so frames are views that share pages across
+    processes and never require re-tokenising the text.
+    """
+
+    DATA_SUFFIX = ".cache.npy"
+    META_SUFFIX = ".cache.npz"
+
+    @classmethod
+    def paths(cls, filepath: Path) -> Tuple[Path, Path]:
+        filepath = Path(filepath)
+        return (
+            filepath.with_name(filepath.name + cls.DATA_SUFFIX),
+            filepath.with_name(filepath.name + cls.META_SUFFIX),
+        )
+
+    @classmethod
+    def load(cls, filepath: Path) -> Optional[Frames]:
+        """Return memory-mapped Frames for *filepath*, or None on a cache miss."""
+        filepath = Path(filepath)
+        data_path, meta_path = cls.paths(filepath)
+        if not (data_path.is_file() and meta_path.is_file()):
+            return None
+
+        try:
+            stat = filepath.stat()
+            with np.load(meta_path, allow_pickle=False) as meta:
+                counts = meta["counts"]
+                comments = [str(c) for c in meta["comments"]]
+                size, mtime_ns = int(meta["size"]), int(meta["mtime_ns"])
+                digest = str(meta["digest"])
+
+            if (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                if size != stat.st_size or _file_digest(filepath) != digest:
+                    LOG.debug("Stale frame cache for %s", filepath.name)
+                    return None
+                cls._write_meta(meta_path, counts, comments, stat, digest)
+
+            data = np.load(data_path, mmap_mode="c", allow_pickle=False).view(np.ndarray)
+        except (OSError, KeyError, ValueError) as e:
+            LOG.debug("Could not read frame cache for %s: %s", filepath.name, e)
+            return None
+
+        if data.shape[0] != counts.sum():
+            LOG.debug("Corrupt frame cache for %s", filepath.name)
+            return None
+
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        return Frames(
+            [
+                Frame(
+                    raw=data[bounds[i] : bounds[i + 1]]
+                    if counts[i] > 0
+                    else np.empty((0, 0), dtype=float),
+                    comment=comment,
+                )
+                for i, comment in enumerate(comments)
+            ]
+        )
+
+    @classmethod
+    def save(cls, filepath: Path, frames: Frames) -> bool:
+        """Write *frames* parsed from *filepath* to the cache; return True on success."""
+        filepath = Path(filepath)
+        data_path, meta_path = cls.paths(filepath)
+
+        raws = [frame.raw for frame in frames if frame.raw.size > 0]
+        n_cols = {raw.shape[1] for raw in raws}
+        if len(n_cols) != 1:
+            LOG.debug("Not caching %s: frames have differing column counts", filepath.name)
+            return False
+
+        counts = np.array([len(frame.raw) if frame.raw.size else 0 for frame in frames])
+        comments = [frame.comment or "" for frame in frames]
+        tmp_path = data_path.with_name(data_path.name + ".tmp.npy")
+        try:
+            stat = filepath.stat()
+            digest = _file_digest(filepath)
+            out = np.lib.format.open_memmap(
+                tmp_path, mode="w+", dtype=np.float64, shape=(int(counts.sum()), n_cols.pop())
+            )
+            row = 0
+            for raw in raws:
+                out[row : row + len(raw)] = raw
+                row += len(raw)
+            out.flush()
+            del out
+            os.replace(tmp_path, data_path)
+            cls._write_meta(meta_path, counts, comments, stat, digest)
+        except OSError as e:
+            LOG.debug("Could not write frame cache for %s: %s", filepath.name, e)
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    @staticmethod
+    def _write_meta(meta_path: Path, counts, comments, stat, digest: str) -> None:
+        tmp_path = meta_path.with_name(meta_path.name + ".tmp.npz")
+        with tmp_path.open("wb") as fh:
+            np.savez(
+                fh,
+                counts=np.asarray(counts, dtype=np.int64),
+                comments=np.array(comments, dtype=str),
+                size=np.int64(stat.st_size),
+                mtime_ns=np.int64(stat.st_mtime_ns),
+                digest=np.array(digest),
+            )
+        os.replace(tmp_path, meta_path)
+
+
 @dataclass
 class CrystalCloud:
     """Base class for handling crystal point cloud data from various file formats."""
@@ -238,44 +642,42 @@ class CrystalCloud:
         progress_callback: Optional[Callable[[int, int], None]] = None,
         clean: bool = True,
     ) -> Frames:
-        """Parse multi-frame XYZ into Frames container."""
-        frames = Frames()
+        """Parse multi-frame XYZ into Frames container.
+
+        The whole file is read in one pass: frame headers are located from a
+        newline index and every frame body is tokenised in a single call to
+        the pandas C parser, then split back into per-frame views.  If the
+        bulk parse fails (e.g. the column count changes between frames) each
+        frame is parsed on its own with :func:`numpy.loadtxt`, which also
+        covers tab-delimited rows and trailing whitespace.
+        """
+        filepath = Path(filepath)
+        buf = filepath.read_bytes()
+        index = _index_xyz_frames(buf)
+
+        try:
+            try:
+                raws = _parse_xyz_bodies(buf, index)
+            except ValueError as e:
+                LOG.debug("Bulk XYZ parse failed for %s (%s), parsing per frame", filepath.name, e)
+                raws = _parse_xyz_bodies_per_frame(buf, index)
+        except ValueError as e:
+            if clean:
+                raw_text = filepath.read_text(encoding="utf-8").replace("*", "0")
+                filepath.write_text(raw_text, encoding="utf-8")
+                return CrystalCloud.parse_xyz_file(filepath, progress_callback, clean=False)
+            raise e
 
-        with filepath.open("r", encoding="utf-8") as file:
-            frame_idx = 0
-            while True:
-                header = file.readline()
-                if not header:
-                    break
+        frames = Frames()
+        for frame_idx, ((_, comment, _, _), raw) in enumerate(zip(index, raws), start=1):
+            frames.append(Frame(raw=raw, comment=comment))
 
+            if progress_callback:
                 try:
-                    n_atoms = int(header.strip())
-                except ValueError as e:
-                    raise ValueError(f"Invalid XYZ header at frame {frame_idx}: {e}")
-
-                comment = file.readline().strip()
-
-                if n_atoms == 0:
-                    raw = np.empty((0, 0), dtype=float)
-                else:
-                    try:
-                        raw = np.loadtxt(file, max_rows=n_atoms, dtype=float, ndmin=2)
-                    except ValueError as e:
-                        if clean:
-                            raw_text = Path(filepath).read_text(encoding="utf-8").replace("*", "0")
-                            Path(filepath).write_text(raw_text, encoding="utf-8")
-                            return CrystalCloud.parse_xyz_file(filepath, progress_callback, clean=False)
-                        raise e
-
-                frames.append(Frame(raw=raw, comment=comment))
-                frame_idx += 1
-
-                if progress_callback:
-                    try:
-                        total_frames = int(comment.split("//")[1])
-                    except Exception:
-                        total_frames = frame_idx
-                    progress_callback(frame_idx, total_frames)
+                    total_frames = int(comment.split("//")[1])
+                except Exception:
+                    total_frames = frame_idx
+                progress_callback(frame_idx, total_frames)
 
         return frames
 
@@ -298,13 +700,40 @@ class CrystalCloud:
         filepath: Path,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         normalise=True,
+        lazy: bool = False,
+        use_cache: bool = True,
     ) -> "CrystalCloud":
-        """Factory method to create CrystalShape from .XYZ, .txt, .stl, .glb."""
+        """Factory method to create CrystalShape from .XYZ, .txt, .stl, .glb.
+
+        For .XYZ files a valid :class:`XYZFrameCache` is memory-mapped when
+        ``use_cache`` is set; otherwise the text is parsed (and the cache
+        written).  With ``lazy=True`` and no cache the file is only indexed
+        (see :class:`XYZFrameIndex`) and frames are parsed on demand through
+        :class:`LazyFrames`.  Other formats are always read eagerly.
+        """
         filepath = Path(filepath)
 
-        if filepath.suffix == ".XYZ":
+        cached = None
+        if filepath.suffix == ".XYZ" and use_cache:
+            cached = XYZFrameCache.load(filepath)
+
+        if cached is not None:
+            frames = cached
+            xyz = frames.get_coords(0)
+            if progress_callback:
+                progress_callback(len(frames), len(frames))
+
+        elif filepath.suffix == ".XYZ" and lazy:
+            frames = LazyFrames(filepath=filepath, index=XYZFrameIndex.load(filepath))
+            xyz = frames.get_coords(0)
+            if progress_callback:
+                progress_callback(len(frames), len(frames))
+
+        elif filepath.suffix == ".XYZ":
             frames = cls.parse_xyz_file(filepath, progress_callback)
             xyz = frames.get_coords(0)
+            if use_cache:
+                XYZFrameCache.save(filepath, frames)
 
         elif filepath.suffix == ".txt":
             arr = np.genfromtxt(filepath, skip_header=2, dtype=float, invalid_raise=False)
@@ -1,4 +1,5 @@
 import logging
+import os
 from collections import namedtuple
 
 from PySide6.QtCore import Qt
@@ -8,14 +9,17 @@ from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QHBoxLayout,
+    QLabel,
     QListWidget,
     QListWidgetItem,
     QScrollArea,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
 from ...utils.data_structures import ar_selection_tuple
+from ...utils.parallel import default_worker_count
 
 logger = logging.getLogger("CA:AspectDaliog")
 
@@ -72,6 +76,18 @@ class AnalysisOptionsDialog(QDialog):
         layout.addLayout(direction_layout)
         # layout.addWidget(self.plotting_checkbox)
 
+        workers_layout = QHBoxLayout()
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setRange(1, max(1, os.cpu_count() or 1))
+        self.workers_spinbox.setValue(default_worker_count())
+        self.workers_spinbox.setToolTip(
+            "Number of processes used to analyse XYZ files in parallel (1 = no parallelism)."
+        )
+        workers_layout.addWidget(QLabel("Worker processes:"))
+        workers_layout.addWidget(self.workers_spinbox)
+        workers_layout.addStretch()
+        layout.addLayout(workers_layout)
+
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
@@ -148,4 +164,5 @@ class AnalysisOptionsDialog(QDialog):
             checked_directions=checked_directions,
             selected_directions=selected_directions,
             plotting=plotting,
+            n_workers=self.workers_spinbox.value(),
         )
@@ -1,3 +1,5 @@
+import os
+
 from PySide6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -13,6 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 from ...utils.data_structures import cluster_options_tuple
+from ...utils.parallel import default_worker_count
 
 
 class ClusterAnalysisDialog(QDialog):
@@ -106,10 +109,32 @@ class ClusterAnalysisDialog(QDialog):
         )
         params_layout.addRow("Downsample fraction:", self.downsample_spin)
 
+        self.frame_series_checkbox = QCheckBox("Track clusters over all frames")
+        self.frame_series_checkbox.setToolTip(
+            "Cluster every frame of each movie with DBSCAN, inserting only the particles "
+            "added since the previous frame, and follow cluster IDs over time. "
+            "Writes a per-frame time series CSV; downsampling is not applied."
+        )
+        self.frame_series_checkbox.toggled.connect(self._on_frame_series_toggled)
+        params_layout.addRow("", self.frame_series_checkbox)
+
         params_group.setLayout(params_layout)
         layout.addWidget(params_group)
         self._params_group = params_group
 
+        workers_layout = QHBoxLayout()
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setRange(1, max(1, os.cpu_count() or 1))
+        self.workers_spinbox.setValue(default_worker_count())
+        self.workers_spinbox.setToolTip(
+            "Number of processes used to cluster XYZ files in parallel (1 = no parallelism). "
+            "A single file uses this many threads for the OPTICS neighbour search instead."
+        )
+        workers_layout.addWidget(QLabel("Worker processes:"))
+        workers_layout.addWidget(self.workers_spinbox)
+        workers_layout.addStretch()
+        layout.addLayout(workers_layout)
+
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
@@ -122,11 +147,18 @@ class ClusterAnalysisDialog(QDialog):
             self.eps_label.setText("ε (neighbourhood radius):")
 
     def _on_ratios_only_toggled(self, checked: bool):
-        self._algo_group.setEnabled(not checked)
+        self._algo_group.setEnabled(not checked and not self.frame_series_checkbox.isChecked())
         self._params_group.setEnabled(not checked)
         # Frame index is still relevant when ratios_only
         self.frame_spin.setEnabled(True)
 
+    def _on_frame_series_toggled(self, checked: bool):
+        # Frame-series tracking is incremental DBSCAN only
+        if checked:
+            self.algo_combo.setCurrentText("DBSCAN")
+        self._algo_group.setEnabled(not checked)
+        self.downsample_spin.setEnabled(not checked)
+
     def get_options(self) -> cluster_options_tuple:
         return cluster_options_tuple(
             algorithm=self.algo_combo.currentText(),
@@ -136,4 +168,6 @@ class ClusterAnalysisDialog(QDialog):
             scale=self.scale_checkbox.isChecked(),
             downsample=self.downsample_spin.value(),
             ratios_only=self.ratios_only_checkbox.isChecked(),
+            n_workers=self.workers_spinbox.value(),
+            frame_series=self.frame_series_checkbox.isChecked(),
         )
@@ -2,6 +2,7 @@ import logging
 import sys
 from itertools import permutations
 import warnings
+from pathlib import Path
 
 import matplotlib
 import numpy as np
@@ -30,6 +31,13 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from cgaspects.analysis.site_table import SitePoints, SiteTable
+from cgaspects.fileio.site_results import (
+    SITE_RESULTS_JSON_NAME,
+    SITE_RESULTS_NAME,
+    SiteResults,
+    load_site_results,
+)
 from cgaspects.gui.dialogs.axes_customization_dialog import AxesCustomizationDialog
 from cgaspects.gui.dialogs.data_filter_dialog import DataFilterDialog
 from cgaspects.gui.dialogs.plotsavedialog import PlotSaveDialog
@@ -152,18 +160,22 @@ class PlottingDialog(QDialog):
         csv_changed = not hasattr(self, "csv") or self.csv != csv
 
         self.csv = csv
+        if isinstance(getattr(self, "site_analysis_data", None), SiteResults):
+            self.site_analysis_data.close()
         self.site_analysis_data = None
+        # Per-prefix SiteTables and filter masks of the loaded site analysis data
+        self._site_tables = {}
+        self._site_filter_masks = {}
+        self._site_filter_key = None
 
         if isinstance(self.csv, pd.DataFrame):
             self.df_original = self.csv.copy()
             self.df = self.csv
         else:
-            # Check if this is a site analysis JSON file
-            if str(csv).endswith("site_analysis_data.json"):
-                import json
-
-                with open(csv, "r") as f:
-                    self.site_analysis_data = json.load(f)
+            # Check if this is a site analysis results file (npz, or exported JSON)
+            if Path(str(csv)).name in (SITE_RESULTS_NAME, SITE_RESULTS_JSON_NAME):
+                # npz archives are opened lazily; arrays are read per prefix on demand
+                self.site_analysis_data = load_site_results(csv)
 
                 # For site analysis, we DON'T convert to DataFrame
                 # Data will be extracted directly from the dictionary in _set_data()
@@ -1139,65 +1151,6 @@ class PlottingDialog(QDialog):
         """Get the original unfiltered dataframe."""
         return self.df_original if hasattr(self, "df_original") else self.df
 
-    def _check_site_data_filter(self, site_data: dict, filter_config: dict) -> bool:
-        """Check if a site passes a data filter.
-
-        Args:
-            site_data: Dictionary containing site data
-            filter_config: Filter configuration dict with 'column', 'operator', 'value'
-
-        Returns:
-            True if the site passes the filter, False otherwise
-        """
-        column = filter_config["column"]
-        operator = filter_config["operator"]
-        value_str = filter_config["value"]
-
-        # Get the site's value for this column
-        if column not in site_data:
-            return False
-
-        site_value = site_data[column]
-
-        # Handle None values - exclude sites with None unless using != operator
-        if site_value is None:
-            if operator == "!=":
-                return True  # None != any value is True
-            else:
-                return False  # None fails all other comparisons
-
-        try:
-            # Try to convert to numeric if both are numeric
-            if isinstance(site_value, (int, float)):
-                value = float(value_str)
-            else:
-                value = value_str
-
-            # Apply the filter based on operator
-            if operator == "==":
-                return site_value == value
-            elif operator == "!=":
-                return site_value != value
-            elif operator == ">":
-                return site_value > value
-            elif operator == ">=":
-                return site_value >= value
-            elif operator == "<":
-                return site_value < value
-            elif operator == "<=":
-                return site_value <= value
-            elif operator == "contains":
-                return str(value).lower() in str(site_value).lower()
-            elif operator == "not contains":
-                return str(value).lower() not in str(site_value).lower()
-            else:
-                logger.warning(f"Unknown operator: {operator}")
-                return True
-
-        except Exception as e:
-            logger.error(f"Error applying filter {filter_config} to site data: {e}")
-            return False  # Changed from True to False - if filter fails, exclude the site
-
     def _apply_data_filters(self):
         """Apply data filters to the dataframe."""
         # Skip for site analysis - filters are applied in _extract_site_analysis_data()
@@ -1350,55 +1303,50 @@ class PlottingDialog(QDialog):
             except Exception as exc:
                 logger.warning("Unit conversion failed for %s: %s", attr, exc)
 
-    def _check_interaction_filter(self, site_interactions: dict, interaction_filters: dict) -> bool:
-        """Check if a site passes the interaction filter.
+    def _site_table(self, file_prefix):
+        """Columnar SiteTable for *file_prefix*, built once per loaded results file."""
+        table = self._site_tables.get(file_prefix)
+        if table is None:
+            table = SiteTable.from_result(self.site_analysis_data[file_prefix])
+            self._site_tables[file_prefix] = table
+        return table
 
-        Args:
-            site_interactions: Dictionary mapping interaction_id to frequency for this site
-            interaction_filters: Dictionary mapping interaction_id to list of selected frequencies
+    def _site_filter_mask(self, file_prefix, table):
+        """Mask of the sites of *file_prefix* passing the current data and interaction filters.
 
-        Returns:
-            True if the site passes the filter (should be shown), False otherwise
+        Masks are cached until the filters change, so moving through time
+        points or switching permutations does not re-evaluate them.
         """
-        if not interaction_filters:
-            # No filters active, show all sites
-            return True
-
-        # Convert site_interactions keys and values to integers for comparison
-        site_interactions_int = {int(k): int(v) for k, v in site_interactions.items()}
-
-        # Site must match ALL selected interaction filters (AND logic)
-        for interaction_id, selected_freqs in interaction_filters.items():
-            # Convert interaction_id to integer for consistent comparison
-            interaction_id_int = int(interaction_id)
-
-            # Check if site has this interaction
-            if interaction_id_int not in site_interactions_int:
-                # Site doesn't have this interaction at all
-                return False
-
-            site_freq = site_interactions_int[interaction_id_int]
-
-            # Check if the site's frequency matches any of the selected frequencies
-            if "Any" in selected_freqs:
-                # "Any" is selected, so any frequency for this interaction is acceptable
-                continue
-            else:
-                # Convert selected frequencies to integers for comparison (except "Any")
-                selected_freqs_int = [int(f) if f != "Any" else f for f in selected_freqs]
-                if site_freq not in selected_freqs_int:
-                    # Site's frequency doesn't match any selected frequency
-                    return False
-
-        # Site passed all filters
-        return True
+        key = repr((self.data_filters, self.interaction_filters))
+        if key != self._site_filter_key:
+            self._site_filter_key = key
+            self._site_filter_masks = {}
+        mask = self._site_filter_masks.get(file_prefix)
+        if mask is None:
+            mask = table.passes_filters(self.data_filters, self.interaction_filters)
+            self._site_filter_masks[file_prefix] = mask
+        return mask
+
+    @staticmethod
+    def _site_values(table, name, time_index=None):
+        """Per-site values of the 'events' or 'population' series (NaN where missing).
+
+        Totals, or the values at *time_index* for sites with a time series
+        (falling back to the total for sites without one).
+        """
+        values = table.columns[f"total_{name}"]
+        series = table.series[name]
+        if time_index is not None and series is not None and time_index < series.shape[1]:
+            values = np.where(table.has_series[name], series[:, time_index], values)
+        return values
 
     def _extract_site_analysis_data(self):
-        """Extract site analysis data directly from dictionary based on current mode and filters.
+        """Extract site analysis data from the site tables based on current mode and filters.
 
         Returns:
-            tuple: (x_data_array, y_data_array, site_metadata_list)
-                  where site_metadata_list contains dicts with site info for hover/click handling
+            tuple: (x_data_array, y_data_array, site_points)
+                  where site_points is a SitePoints sequence giving the site info
+                  for each point for hover/click handling
         """
         # Get the selected file prefix
         selected_prefix = self.time_series_widget.get_selected_file_prefix()
@@ -1410,9 +1358,6 @@ class PlottingDialog(QDialog):
         # Get current permutation (0, 1, or 2)
         permutation = self.permutation
 
-        # Get interaction filters if active
-        interaction_filters = self.interaction_filters
-
         # Determine which prefixes to include
         if selected_prefix == "All Data":
             prefixes_to_process = list(self.site_analysis_data.keys())
@@ -1421,246 +1366,89 @@ class PlottingDialog(QDialog):
                 [selected_prefix] if selected_prefix in self.site_analysis_data else []
             )
 
-        x_values = []
-        y_values = []
-        site_metadata = []
+        per_step = plotting_mode in ("Events per Step", "Population per Step")
+        step_index = time_index if per_step else None
+
+        tables = []
+        x_parts, y_parts, row_parts, match_parts = [], [], [], []
 
         # Extract data from each file prefix
         for file_prefix in prefixes_to_process:
-            dataset = self.site_analysis_data[file_prefix]
-            sites_dict = dataset.get("sites", {})
-
-            for site_num, site_data in sites_dict.items():
-                # Apply data filters if any
-                # If variable is "filter", we want to show ALL sites and color them (filtered vs unfiltered)
-                # If variable is NOT "filter", we want to HIDE sites that don't pass the filter
-                if self.data_filters and self.variable != "filter":
-                    # Check if this site passes all data filters
-                    passes_filters = True
-                    for filter_config in self.data_filters:
-                        column = filter_config["column"]
-
-                        # Handle special fields that aren't in site_data dict
-                        if column == "site_number":
-                            # Check site_number filter directly
-                            site_data_temp = {"site_number": int(site_num)}
-                            if not self._check_site_data_filter(site_data_temp, filter_config):
-                                passes_filters = False
-                                break
-                        elif column == "file_prefix":
-                            # Check file_prefix filter directly
-                            site_data_temp = {"file_prefix": file_prefix}
-                            if not self._check_site_data_filter(site_data_temp, filter_config):
-                                passes_filters = False
-                                break
-                        else:
-                            # Check normal site_data fields
-                            if not self._check_site_data_filter(site_data, filter_config):
-                                passes_filters = False
-                                break
-                    if not passes_filters:
-                        continue
-
-                # Apply interaction filters if active
-                # If variable is "filter", we want to show ALL sites and color them (filtered vs unfiltered)
-                # If variable is NOT "filter", we want to HIDE sites that don't pass the filter
-                if interaction_filters and self.variable != "filter":
-                    site_interactions = site_data.get("interactions", {})
-                    passes_interaction_filter = self._check_interaction_filter(
-                        site_interactions, interaction_filters
-                    )
-                    if not passes_interaction_filter:
-                        continue
-
-                # Skip sites without energy data
-                if site_data.get("energy") is None:
-                    continue
-
-                # Extract x and y values based on permutation
-                x_value = None
-                y_value = None
-
-                # Permutation 0: Events/Population vs Energy (current behavior)
-                if permutation == 0:
-                    # Extract x value based on plotting mode
-                    if plotting_mode == "Total Events":
-                        if site_data.get("total_events") is not None:
-                            # For events-based plotting: flip the sign
-                            # Ungrown sites (growth) are positive, grown sites (dissolution) are negative
-                            sign = -1 if site_data.get("occupation") else 1
-                            x_value = sign * site_data["total_events"]
-
-                    elif plotting_mode == "Total Population":
-                        if site_data.get("total_population") is not None:
-                            sign = 1 if site_data.get("occupation") else -1
-                            x_value = sign * site_data["total_population"]
-
-                    elif plotting_mode == "Events per Step":
-                        events_series = site_data.get("events")
-                        if (
-                            events_series
-                            and isinstance(events_series, list)
-                            and time_index < len(events_series)
-                        ):
-                            # For events-based plotting: flip the sign
-                            # Ungrown sites (growth) are positive, grown sites (dissolution) are negative
-                            sign = -1 if site_data.get("occupation") else 1
-                            x_value = sign * events_series[time_index]
-                        elif site_data.get("total_events") is not None:
-                            # Fallback to total events
-                            sign = -1 if site_data.get("occupation") else 1
-                            x_value = sign * site_data["total_events"]
-
-                    elif plotting_mode == "Population per Step":
-                        population_series = site_data.get("population")
-                        if (
-                            population_series
-                            and isinstance(population_series, list)
-                            and time_index < len(population_series)
-                        ):
-                            sign = 1 if site_data.get("occupation") else -1
-                            x_value = sign * population_series[time_index]
-                        elif site_data.get("total_population") is not None:
-                            # Fallback to total population
-                            sign = 1 if site_data.get("occupation") else -1
-                            x_value = sign * site_data["total_population"]
-
-                    # Y value is always energy
-                    y_value = site_data["energy"]
-
-                # Permutation 1: Sites vs Events/Population
-                elif permutation == 1:
-                    # X value is the site number
-                    x_value = int(site_num)
-
-                    # Y value based on plotting mode
-                    if plotting_mode == "Total Events":
-                        if site_data.get("total_events") is not None:
-                            sign = -1 if site_data.get("occupation") else 1
-                            y_value = sign * site_data["total_events"]
-
-                    elif plotting_mode == "Total Population":
-                        if site_data.get("total_population") is not None:
-                            sign = 1 if site_data.get("occupation") else -1
-                            y_value = sign * site_data["total_population"]
-
-                    elif plotting_mode == "Events per Step":
-                        events_series = site_data.get("events")
-                        if (
-                            events_series
-                            and isinstance(events_series, list)
-                            and time_index < len(events_series)
-                        ):
-                            sign = -1 if site_data.get("occupation") else 1
-                            y_value = sign * events_series[time_index]
-                        elif site_data.get("total_events") is not None:
-                            sign = -1 if site_data.get("occupation") else 1
-                            y_value = sign * site_data["total_events"]
+            table = self._site_table(file_prefix)
+            passes_filters = self._site_filter_mask(file_prefix, table)
+
+            # Skip sites without energy data
+            keep = ~np.isnan(table.columns["energy"])
+            # If variable is "filter", we want to show ALL sites and color them (filtered vs unfiltered)
+            # If variable is NOT "filter", we want to HIDE sites that don't pass the filter
+            if self.variable != "filter":
+                keep &= passes_filters
+
+            # For events-based plotting: flip the sign
+            # Ungrown sites (growth) are positive, grown sites (dissolution) are negative
+            occupation = table.columns["occupation"]
+            events_sign = np.where(~np.isnan(occupation) & (occupation != 0), -1.0, 1.0)
+            events = events_sign * self._site_values(table, "events", step_index)
+            population = -events_sign * self._site_values(table, "population", step_index)
+
+            plotted = {
+                "Total Events": events,
+                "Events per Step": events,
+                "Total Population": population,
+                "Population per Step": population,
+            }.get(plotting_mode)
+            if plotted is None:
+                continue
 
-                    elif plotting_mode == "Population per Step":
-                        population_series = site_data.get("population")
-                        if (
-                            population_series
-                            and isinstance(population_series, list)
-                            and time_index < len(population_series)
-                        ):
-                            sign = 1 if site_data.get("occupation") else -1
-                            y_value = sign * population_series[time_index]
-                        elif site_data.get("total_population") is not None:
-                            sign = 1 if site_data.get("occupation") else -1
-                            y_value = sign * site_data["total_population"]
-
-                # Permutation 2: Events vs Population
-                elif permutation == 2:
-                    # X value is events, Y value is population
-                    if plotting_mode == "Total Events" or plotting_mode == "Total Population":
-                        # Use total values
-                        if site_data.get("total_events") is not None:
-                            sign = -1 if site_data.get("occupation") else 1
-                            x_value = sign * site_data["total_events"]
-                        if site_data.get("total_population") is not None:
-                            sign = 1 if site_data.get("occupation") else -1
-                            y_value = sign * site_data["total_population"]
-
-                    elif plotting_mode == "Events per Step" or plotting_mode == "Population per Step":
-                        # Use per-step values
-                        events_series = site_data.get("events")
-                        population_series = site_data.get("population")
-
-                        if (
-                            events_series
-                            and isinstance(events_series, list)
-                            and time_index < len(events_series)
-                        ):
-                            sign = -1 if site_data.get("occupation") else 1
-                            x_value = sign * events_series[time_index]
-                        elif site_data.get("total_events") is not None:
-                            sign = -1 if site_data.get("occupation") else 1
-                            x_value = sign * site_data["total_events"]
-
-                        if (
-                            population_series
-                            and isinstance(population_series, list)
-                            and time_index < len(population_series)
-                        ):
-                            sign = 1 if site_data.get("occupation") else -1
-                            y_value = sign * population_series[time_index]
-                        elif site_data.get("total_population") is not None:
-                            sign = 1 if site_data.get("occupation") else -1
-                            y_value = sign * site_data["total_population"]
-
-                # Skip if we couldn't get x or y values
-                if x_value is None or y_value is None:
-                    continue
+            # Permutation 0: Events/Population vs Energy
+            if permutation == 0:
+                x_values, y_values = plotted, table.columns["energy"]
+            # Permutation 1: Sites vs Events/Population
+            elif permutation == 1:
+                x_values, y_values = table.site_numbers.astype(float), plotted
+            # Permutation 2: Events vs Population
+            elif permutation == 2:
+                x_values, y_values = events, population
+            else:
+                continue
 
-                # Store the data
-                x_values.append(x_value)
-                y_values.append(y_value)
-
-                # Store metadata for this site (for hover/click handling)
-                metadata = {
-                    "file_prefix": file_prefix,
-                    "site_number": int(site_num),
-                    "tile_type": site_data.get("tile_type"),
-                    "energy": site_data.get("energy"),
-                    "occupation": site_data.get("occupation"),
-                    "coordination": site_data.get("coordination"),
-                    "total_events": site_data.get("total_events"),
-                    "total_population": site_data.get("total_population"),
-                    "interactions": site_data.get("interactions", {}),
-                }
-                site_metadata.append(metadata)
+            # Skip sites where we couldn't get x or y values
+            keep &= ~np.isnan(x_values) & ~np.isnan(y_values)
+            rows = np.flatnonzero(keep)
+
+            tables.append(table)
+            x_parts.append(x_values[rows])
+            y_parts.append(y_values[rows])
+            row_parts.append(rows)
+            match_parts.append(passes_filters[rows])
+
+        if not tables:
+            return np.array([]), np.array([]), SitePoints.empty()
+
+        x_array = np.concatenate(x_parts)
+        y_array = np.concatenate(y_parts)
+        site_points = SitePoints(
+            tables,
+            np.repeat(np.arange(len(tables)), [len(rows) for rows in row_parts]),
+            np.concatenate(row_parts),
+            np.concatenate(match_parts),
+        )
 
         # Filter out bulk site if checkbox is checked and we're in population mode
-        # For permutation 0 and 2, check x_values; for permutation 1, check y_values
-        if self.checkbox_hide_bulk.isChecked() and plotting_mode in ["Total Population", "Population per Step"]:
-            if x_values:
-
-                # Determine which axis contains population data
-                if permutation == 0:
-                    # Population is on x-axis
-                    abs_values = [abs(x) for x in x_values]
-                elif permutation == 1:
-                    # Population is on y-axis
-                    abs_values = [abs(y) for y in y_values]
-                elif permutation == 2:
-                    # Population is on y-axis
-                    abs_values = [abs(y) for y in y_values]
-                else:
-                    abs_values = []
-
-                if abs_values:
-                    max_idx = np.argmax(abs_values)
-                    # Remove the bulk site from all lists
-                    x_values.pop(max_idx)
-                    y_values.pop(max_idx)
-                    site_metadata.pop(max_idx)
-
-        # Convert to numpy arrays
-        x_array = np.array(x_values)
-        y_array = np.array(y_values)
-
-        return x_array, y_array, site_metadata
+        # For permutation 0, population is on the x-axis; for permutations 1 and 2, on the y-axis
+        if (
+            self.checkbox_hide_bulk.isChecked()
+            and plotting_mode in ["Total Population", "Population per Step"]
+            and len(x_array)
+        ):
+            population_axis = x_array if permutation == 0 else y_array
+            max_idx = int(np.argmax(np.abs(population_axis)))
+            # Remove the bulk site from all arrays
+            x_array = np.delete(x_array, max_idx)
+            y_array = np.delete(y_array, max_idx)
+            site_points = site_points.delete(max_idx)
+
+        return x_array, y_array, site_points
 
     def _set_data(self):
         if self.plot_type == "Zingg":
@@ -1686,13 +1474,13 @@ class PlottingDialog(QDialog):
                 self.gr_y_err = None
         if self.plot_type == "Site Analysis":
             # Extract data directly from dictionary
-            x_array, y_array, site_metadata = self._extract_site_analysis_data()
+            x_array, y_array, site_points = self._extract_site_analysis_data()
 
             self.x_data = x_array
             self.y_data = y_array
 
-            # Store site metadata for hover/click handling
-            self._site_metadata = site_metadata
+            # Store site points for hover/click handling
+            self._site_metadata = site_points
         if self.plot_type == "Heatmap":
             # For heatmap: X and Y are axes, C (color) is the value to display
             self.x_data = None
@@ -1889,30 +1677,9 @@ class PlottingDialog(QDialog):
 
                 # Special handling for "filter" - binary color based on filter match
                 if self.variable == "filter":
-                    interaction_filters = self.interaction_filters
-                    data_filters = self.data_filters
-
-                    if interaction_filters or data_filters:
+                    if self.interaction_filters or self.data_filters:
                         # Color sites based on whether they match ALL filters (interaction AND data)
-                        c_values = []
-                        for site_meta in self._site_metadata:
-                            matches = True
-
-                            # Check interaction filters if present
-                            if interaction_filters:
-                                site_interactions = site_meta.get("interactions", {})
-                                matches = matches and self._check_interaction_filter(site_interactions, interaction_filters)
-
-                            # Check data filters if present
-                            # Note: site_meta already contains "site_number" from metadata creation
-                            if data_filters and matches:
-                                for filter_config in data_filters:
-                                    if not self._check_site_data_filter(site_meta, filter_config):
-                                        matches = False
-                                        break
-
-                            c_values.append(1 if matches else 0)
-                        self.c_data = np.array(c_values)
+                        self.c_data = self._site_metadata.matches.astype(int)
                         self.c_name = self.variable
                     else:
                         # No filters selected, cannot color by filter
@@ -1920,19 +1687,14 @@ class PlottingDialog(QDialog):
                         self.c_name = None
                     return
 
-                # Extract coloring data from site metadata
-                c_values = []
-                for site_meta in self._site_metadata:
-                    if self.variable in site_meta:
-                        c_values.append(site_meta[self.variable])
-                    else:
-                        c_values.append(None)
+                # Extract coloring data from the site columns
+                c_values = self._site_metadata.column(self.variable)
 
                 # Special handling for file_prefix when we have a summary file
                 if self.variable == "file_prefix" and self.summary_df is not None:
                     # Map file prefixes to summary file values
-                    mapped_values = []
-                    if hasattr(self.parent(), "xyz_files"):
+                    mapped_values = None
+                    if hasattr(self.parent(), "xyz_files") and len(c_values):
                         xyz_files = self.parent().xyz_files
                         # Create mapping from file_prefix to index
                         prefix_to_index = {
@@ -1951,26 +1713,26 @@ class PlottingDialog(QDialog):
                             varying_col = varying_cols[0]
                             self.c_mapped_name = varying_col
 
-                            for site_meta in self._site_metadata:
-                                file_prefix = site_meta.get("file_prefix")
-                                if file_prefix in prefix_to_index:
-                                    idx = prefix_to_index[file_prefix]
-                                    if idx < len(self.summary_df):
-                                        mapped_values.append(self.summary_df.iloc[idx][varying_col])
-                                    else:
-                                        mapped_values.append(0)
+                            # Look up each distinct prefix once, then broadcast to the points
+                            codes, prefixes = pd.factorize(c_values)
+                            prefix_values = []
+                            for file_prefix in prefixes:
+                                idx = prefix_to_index.get(file_prefix)
+                                if idx is not None and idx < len(self.summary_df):
+                                    prefix_values.append(self.summary_df.iloc[idx][varying_col])
                                 else:
-                                    mapped_values.append(0)
+                                    prefix_values.append(0)
+                            mapped_values = np.asarray(prefix_values)[codes]
 
-                    if mapped_values:
-                        self.c_data = np.array(mapped_values)
+                    if mapped_values is not None:
+                        self.c_data = mapped_values
                     else:
                         # Fallback to factorized file_prefix
                         self.c_data = pd.factorize(c_values)[0]
                     self.c_name = self.variable
                 else:
                     # Regular variable
-                    self.c_data = np.array(c_values)
+                    self.c_data = c_values
                     self.c_name = self.variable
         elif self.plot_type == "Heatmap":
             # For heatmap, use custom_c as the value, default to Frame Index
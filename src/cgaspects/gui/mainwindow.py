@@ -1,5 +1,4 @@
 import logging
-import os
 import sys
 from collections import defaultdict
 from pathlib import Path
@@ -26,7 +25,6 @@ from ..analysis.growth_rates import GrowthRate
 from ..analysis.site_analysis import SiteAnalysis
 from ..analysis.gui_threads import WorkerXYZ
 from ..fileio.find_data import find_info, locate_xyz_files, parse_structure_file
-from ..fileio.xyz_file import CrystalCloud
 from ..fileio.logging import setup_logging, get_log_file_path
 from ..fileio.opendir import open_directory
 from .crystal_info import CrystalInfo
@@ -181,6 +179,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
         self.xyzFilenameListWidget.currentRowChanged.connect(self.setCurrentXYZIndex)
         self.xyz_spinBox.valueChanged.connect(self.setCurrentXYZIndex)
+        self.openglwidget.crystalLoaded.connect(self.on_crystal_loaded)
 
         self.saveframe_pushButton.hide()
 
@@ -339,6 +338,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.actionShowLegend.triggered.connect(self.show_colour_legend)
         self.menuView.addAction(self.actionShowLegend)
 
+        # Add Undo Point Deletion action to View menu
+        self.actionUndoDeletion = QAction("Undo Point Deletion", self)
+        self.actionUndoDeletion.setObjectName("actionUndoDeletion")
+        self.actionUndoDeletion.setShortcut("Ctrl+Z")
+        self.actionUndoDeletion.setToolTip("Undo the last delete or restore of points")
+        self.actionUndoDeletion.triggered.connect(self.undo_point_deletion)
+        self.menuView.addAction(self.actionUndoDeletion)
+
         # ── Viewport shortcuts (configurable via ShortcutsManager) ────────────
         from PySide6.QtWidgets import QMenu
 
@@ -750,6 +757,12 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             if count > 0:
                 self.log_message(f"Deleted {count} point(s)", "info")
 
+    def undo_point_deletion(self):
+        """Undo the last delete or restore of points in the visualization."""
+        if hasattr(self, "openglwidget") and self.openglwidget is not None:
+            if self.openglwidget.undo_deletion():
+                self.log_message("Undid point deletion", "info")
+
     def clear_point_selection(self):
         """Clear the current point selection."""
         if hasattr(self, "openglwidget") and self.openglwidget is not None:
@@ -869,7 +882,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         xyz = self.openglwidget.xyz
         if xyz is None:
             return
-        coords = xyz[list(selected_indices), 3:6]  # columns 3,4,5 are x,y,z
+        coords = xyz[selected_indices.indices(), 3:6]  # columns 3,4,5 are x,y,z
         centroid = coords.mean(axis=0)
         _, _, Vt = np.linalg.svd(coords - centroid)
         normal = Vt[-1]  # eigenvector for smallest singular value = plane normal
@@ -1041,7 +1054,6 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.openglwidget.pass_XYZ_list([str(path) for path in self.xyz_files])
         self.sim_num = 0
         self.openglwidget.sim_num = -1  # Force fresh load for new folder
-        self.openglwidget.get_XYZ_from_list(0)
         self.xyzFilenameListWidget.clear()
         self.xyzFilenameListWidget.addItems([x.name for x in self.xyz_files])
 
@@ -1084,17 +1096,14 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             logger.warning("Initialising XYZ: No Crystal Data Found! %s", e)
 
     def get_crystal(self, index):
-        folder = self.input_folder
         if 0 <= index < len(self.xyz_files):
-            file_name = self.xyz_files[index]
-            full_file_path = os.path.join(folder, file_name)
-
             self.set_progressbar()
 
             def prog(val, tot):
                 self.update_progressbar(100.0 * val / tot)
 
-            self.crystal = CrystalCloud.from_file(full_file_path, progress_callback=prog)
+            # Loaded through the visualiser's loader so it is cached for display
+            self.crystal = self.openglwidget.loader.load(index, progress_callback=prog)
             self.clear_progressbar()
 
             return self.crystal
@@ -1298,7 +1307,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
                 self,
                 "Select CSV File",
                 "./",
-                "CSV Files (*.csv);;JSON Files (*.json);;All Files (*)",
+                "CSV Files (*.csv);;Site Results (*.npz *.json);;All Files (*)",
             )[0]
 
             # Check if the folder selection was canceled or empty and handle appropriately
@@ -1400,6 +1409,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         else:
             self.summ_df = self.summ_df.iloc[:, 1:]
         self.log_message(f"Summary data succesfully read! [SHAPE {self.summ_df.shape}]", "info")
+        self.openglwidget.loader.set_summary(self.summ_df)
 
         column_names = list(self.summ_df)
         self.log_message(f"Summary Column Name: {column_names}", "debug")
@@ -1455,13 +1465,33 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def setCurrentXYZIndex(self, value):
         self.sim_num = value
-        self.openglwidget.get_XYZ_from_list(value=value)
+        # block to prevent double updates
+        with QSignalBlocker(self.xyzFilenameListWidget):
+            self.xyzFilenameListWidget.setCurrentRow(value)
+        with QSignalBlocker(self.xyz_spinBox):
+            self.xyz_spinBox.setValue(value)
+
+        if not self.openglwidget.get_XYZ_from_list(value=value):
+            # Read in the background; finished by on_crystal_loaded
+            self.playingState = False
+            self.frame_timer.stop()
+            self.movie_controls_frame.hide()
+            self.update_statusbar(f"Loading {Path(self.openglwidget.xyz_path_list[value]).name}…")
+            return
+        self.show_current_crystal()
+
+    def on_crystal_loaded(self, value):
+        if value == self.sim_num:
+            self.show_current_crystal()
+
+    def show_current_crystal(self):
+        value = self.sim_num
         if self.visualizationSettings.widgets["Color By"].value == "Cluster Membership":
             self._apply_cluster_colours()
         self.crystal = self.openglwidget.crystal
         self.movie_controls_frame.hide()
 
-        if self.crystal is not None and self.crystal.empty:
+        if self.crystal is None or self.crystal.empty:
             self.update_XYZ_info(None)
             return
 
@@ -1475,12 +1505,6 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.frame_spinBox.setMaximum(num_frames - 1)
             self.frameMaxLabel.setText(f"{num_frames - 1}")
 
-        # block to prevent double updates
-        with QSignalBlocker(self.xyzFilenameListWidget):
-            self.xyzFilenameListWidget.setCurrentRow(value)
-        with QSignalBlocker(self.xyz_spinBox):
-            self.xyz_spinBox.setValue(value)
-
         self.update_XYZ_info(self.openglwidget.xyz)
 
         self.updateVisualizationSettings()
@@ -1663,6 +1687,10 @@ def set_default_opengl_version(major, minor):
 
 def main():
     import argparse
+    import multiprocessing
+
+    # Needed for the analysis process pools in frozen (bundled) builds
+    multiprocessing.freeze_support()
 
     parser = argparse.ArgumentParser()
     parser.add_argument(
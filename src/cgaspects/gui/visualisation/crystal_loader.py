@@ -0,0 +1,289 @@
+"""Background loading and prefetching of simulation files for the visualiser."""
+
+import logging
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+from ...fileio.xyz_file import CrystalCloud, LazyFrames
+
+logger = logging.getLogger("CA:CrystalLoader")
+
+# Thread pool priorities: the simulation on screen jumps ahead of prefetches
+REQUEST_PRIORITY = 1
+PREFETCH_PRIORITY = 0
+
+
+def default_cache_bytes() -> int:
+    """An eighth of physical memory, kept between 256 MiB and 2 GiB."""
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        total = 8 << 30
+    return int(min(max(total // 8, 256 << 20), 2 << 30))
+
+
+def crystal_nbytes(crystal: CrystalCloud) -> int:
+    """Estimate the memory held by *crystal*.
+
+    Frames that are views of one parsed array are counted once, and
+    memory-mapped frame caches are not counted at all.
+    """
+    arrays = [crystal.xyz]
+    if isinstance(crystal.frames, LazyFrames):
+        arrays.extend(frame.raw for frame in crystal.frames._cache.values())
+    else:
+        arrays.extend(frame.raw for frame in crystal.frames)
+
+    roots = {}
+    for array in arrays:
+        if array is None:
+            continue
+        root = array
+        while isinstance(root, np.ndarray) and root.base is not None:
+            root = root.base
+        if isinstance(root, mmap.mmap):
+            continue
+        if isinstance(root, np.ndarray):
+            roots[id(root)] = root.nbytes
+        elif isinstance(root, (bytes, bytearray)):
+            roots[id(root)] = len(root)
+        else:
+            roots[id(array)] = array.nbytes
+    return sum(roots.values())
+
+
+def summary_neighbours(summary_df: Optional[pd.DataFrame], index: int) -> list[int]:
+    """Simulations one step away from *index* in a single summary variable.
+
+    For each column of *summary_df* (one row per simulation), the rows that
+    match row *index* in every other column are candidates; the nearest
+    value before and after the current one, in the order the values first
+    appear (as listed by the simulation variables widget), are returned.
+    """
+    if summary_df is None or not 0 <= index < len(summary_df):
+        return []
+    values = summary_df.to_numpy()
+    same = values == values[index]
+    one_off = (~same).sum(axis=1) == 1
+
+    neighbours = []
+    for col in range(values.shape[1]):
+        candidates = np.flatnonzero(one_off & ~same[:, col])
+        if len(candidates) == 0:
+            continue
+        order = {value: k for k, value in enumerate(pd.unique(values[:, col]))}
+        here = order[values[index, col]]
+        steps = np.array([order[values[i, col]] - here for i in candidates])
+        if (steps < 0).any():
+            neighbours.append(int(candidates[steps == steps[steps < 0].max()][0]))
+        if (steps > 0).any():
+            neighbours.append(int(candidates[steps == steps[steps > 0].min()][0]))
+    return neighbours
+
+
+def load_crystal(path, progress_callback=None) -> CrystalCloud:
+    """Read a simulation the way the visualiser displays it."""
+    return CrystalCloud.from_file(path, progress_callback=progress_callback, lazy=True)
+
+
+class _LoadSignals(QObject):
+    finished = Signal(object)  # the _LoadJob
+
+
+class _LoadJob(QRunnable):
+    def __init__(self, generation: int, index: int, path, signals: _LoadSignals):
+        super().__init__()
+        # Queued jobs are taken back from the pool to drop or re-prioritise them
+        self.setAutoDelete(False)
+        self.generation = generation
+        self.index = index
+        self.path = path
+        self.signals = signals
+        self.crystal = None
+        self.error = None
+        self.done = threading.Event()
+
+    @Slot()
+    def run(self):
+        try:
+            self.crystal = load_crystal(self.path)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done.set()
+            self.signals.finished.emit(self)
+
+
+class CrystalLoader(QObject):
+    """Load simulations on worker threads and keep recent ones in memory.
+
+    :meth:`request` returns a loaded simulation straight away, or starts
+    reading it and emits ``loaded`` once it is ready.  Each request also
+    prefetches, at lower priority, the previous and next simulations and
+    the neighbours of the current one in the summary file (see
+    :func:`summary_neighbours`), so stepping through simulations seldom
+    waits on the disk.  Loaded simulations are kept in an LRU bounded by
+    their estimated size in memory.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget of the cache; see :func:`default_cache_bytes`.
+    max_threads : int
+        Files read at the same time.
+    max_prefetch : int
+        Most simulations prefetched around each request.
+    """
+
+    loaded = Signal(int, object)  # (index, CrystalCloud) of the requested simulation
+    failed = Signal(int, str)  # (index, error message)
+
+    def __init__(
+        self,
+        parent=None,
+        max_bytes: Optional[int] = None,
+        max_threads: int = 2,
+        max_prefetch: int = 6,
+    ):
+        super().__init__(parent)
+        self.threadpool = QThreadPool(self)
+        self.threadpool.setMaxThreadCount(max_threads)
+        self.max_bytes = default_cache_bytes() if max_bytes is None else max_bytes
+        self.max_prefetch = max_prefetch
+        self.paths = []
+        self.summary_df = None
+        self.current = None
+
+        self._generation = 0
+        self._cache = OrderedDict()  # index -> (crystal, nbytes)
+        self._cache_bytes = 0
+        self._jobs = {}  # index -> queued or running _LoadJob
+        self._signals = _LoadSignals()
+        self._signals.finished.connect(self._job_finished)
+
+    # ---- Inputs ----
+    def set_paths(self, paths):
+        """Replace the simulation list; drops the cache and pending loads."""
+        self._generation += 1
+        for job in self._jobs.values():
+            self.threadpool.tryTake(job)
+        self._jobs.clear()
+        self._cache.clear()
+        self._cache_bytes = 0
+        self.paths = list(paths)
+        self.summary_df = None
+        self.current = None
+
+    def set_summary(self, summary_df: Optional[pd.DataFrame]):
+        """Summary table (one row per simulation) used to pick prefetch neighbours."""
+        self.summary_df = summary_df
+
+    # ---- Cache ----
+    @property
+    def cache_bytes(self) -> int:
+        return self._cache_bytes
+
+    def get(self, index: int) -> Optional[CrystalCloud]:
+        """Cached simulation *index*, or None."""
+        entry = self._cache.get(index)
+        if entry is None:
+            return None
+        self._cache.move_to_end(index)
+        return entry[0]
+
+    def put(self, index: int, crystal: CrystalCloud):
+        """Cache *crystal* as simulation *index*, evicting the least recently used."""
+        old = self._cache.pop(index, None)
+        if old is not None:
+            self._cache_bytes -= old[1]
+        nbytes = crystal_nbytes(crystal)
+        self._cache[index] = (crystal, nbytes)
+        self._cache_bytes += nbytes
+        for cached in list(self._cache):
+            if self._cache_bytes <= self.max_bytes:
+                break
+            if cached == self.current:
+                continue
+            self._cache_bytes -= self._cache.pop(cached)[1]
+
+    # ---- Loading ----
+    def neighbours(self, index: int) -> list[int]:
+        """Simulations prefetched around *index*, most likely next first."""
+        candidates = [index + 1, index - 1, *summary_neighbours(self.summary_df, index)]
+        out = []
+        for i in candidates:
+            if 0 <= i < len(self.paths) and i != index and i not in out:
+                out.append(i)
+        return out[: self.max_prefetch]
+
+    def request(self, index: int) -> Optional[CrystalCloud]:
+        """Make *index* the current simulation.
+
+        Returns it if already loaded; otherwise it is read in the background
+        and ``loaded`` (or ``failed``) is emitted when done.
+        """
+        self.current = index
+        crystal = self.get(index)
+        if crystal is None:
+            self._submit(index, REQUEST_PRIORITY)
+
+        prefetch = self.neighbours(index)
+        for i, job in list(self._jobs.items()):
+            if i != index and i not in prefetch and self.threadpool.tryTake(job):
+                del self._jobs[i]
+        for i in prefetch:
+            if i not in self._cache:
+                self._submit(i, PREFETCH_PRIORITY)
+        return crystal
+
+    def load(self, index: int, progress_callback=None) -> CrystalCloud:
+        """Load *index* on the calling thread (or wait for its running load) and cache it."""
+        crystal = self.get(index)
+        if crystal is not None:
+            return crystal
+        job = self._jobs.pop(index, None)
+        if job is not None and not self.threadpool.tryTake(job):
+            job.done.wait()
+            crystal = job.crystal
+        if crystal is None:
+            crystal = load_crystal(self.paths[index], progress_callback)
+        self.put(index, crystal)
+        return crystal
+
+    def _submit(self, index: int, priority: int):
+        job = self._jobs.get(index)
+        if job is not None:
+            # Promote a queued prefetch that is now wanted on screen
+            if priority > PREFETCH_PRIORITY and self.threadpool.tryTake(job):
+                self.threadpool.start(job, priority)
+            return
+        job = _LoadJob(self._generation, index, self.paths[index], self._signals)
+        self._jobs[index] = job
+        self.threadpool.start(job, priority)
+
+    def _job_finished(self, job: _LoadJob):
+        if job.generation != self._generation or self._jobs.get(job.index) is not job:
+            return
+        del self._jobs[job.index]
+        if job.error is not None:
+            logger.error("Could not load %s: %s", job.path, job.error)
+            if job.index == self.current:
+                self.failed.emit(job.index, str(job.error))
+            return
+
+        self.put(job.index, job.crystal)
+        if job.index == self.current:
+            self.loaded.emit(job.index, job.crystal)
+        else:
+            logger.debug("Prefetched simulation %d", job.index)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Block until all loads have finished (queued results still need the event loop)."""
+        return self.threadpool.waitForDone(msecs)
@@ -11,12 +11,23 @@ from PySide6.QtOpenGL import QOpenGLDebugLogger, QOpenGLFramebufferObject
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from PySide6.QtWidgets import QFileDialog, QInputDialog, QMessageBox
 
-from ...fileio.xyz_file import CrystalCloud
+from ...analysis.shape_analysis import hull_candidates
 from .axes_renderer import AxesRenderer
 from .camera import Camera
+from .crystal_loader import CrystalLoader
 from .direction_renderer import DirectionRenderer
 from .plane_renderer import PlaneRenderer
-from .point_cloud_renderer import SimplePointRenderer
+from .point_index import PointIndex
+from .point_mask import PointMask
+from .point_cloud_renderer import (
+    FLAG_HIDDEN,
+    FLAG_NORMAL,
+    FLAG_SELECTED,
+    MAX_SLICE_PLANES,
+    SLICE_UNBOUNDED,
+    PointCloudBuffers,
+    SimplePointRenderer,
+)
 from .sphere_renderer import SphereRenderer
 from .sphere_selection_renderer import SphereSelectionRenderer
 from .mesh_renderer import MeshRenderer
@@ -28,6 +39,9 @@ from scipy.spatial import ConvexHull
 
 logger = logging.getLogger("CA:OpenGL")
 
+# Deletes (and restores) that can be undone
+MAX_DELETION_HISTORY = 20
+
 
 class VisualisationWidget(QOpenGLWidget):
     style = "Spheres"
@@ -53,10 +67,11 @@ class VisualisationWidget(QOpenGLWidget):
 
     # Signals for point interaction
     pointHovered = Signal(object, object)  # (point_index, point_data) or (None, None)
-    selectionChanged = Signal(set, object)  # (selected_indices, last_selected_index)
+    selectionChanged = Signal(object, object)  # (PointMask of selected points, last_selected_index)
     pointsDeleted = Signal(int)  # Number of points deleted
     pointSizeChanged = Signal(int)  # Emitted when point size changes (integer value)
     legendChanged = Signal(dict)  # Emitted when the colour legend data changes
+    crystalLoaded = Signal(int)  # Simulation index shown after a background load
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -74,13 +89,17 @@ class VisualisationWidget(QOpenGLWidget):
         # Point picking and selection
         self.setMouseTracking(True)  # Enable hover detection
         self._hovered_point_index = None
-        self._selected_points = set()  # Set of selected point indices
+        self._selected_points = PointMask()  # Selected point indices
         self._last_selected_index = None  # For shift-click range selection
         self._pick_radius = 0.1  # Picking radius in normalized coordinates
-        self._deleted_points = set()  # Set of deleted point indices
+        self._deleted_points = PointMask()  # Deleted point indices
+        self._deletion_history = []  # (deleted, selected) snapshots before each change
+        self._point_index = None  # PointIndex of self.xyz, built on first pick
+        self._point_index_source = None  # self.xyz the index was built from
 
         self._raw_planes = []
         self._planes_crystallography = None
+        self._slice_planes = np.empty((0, 6), dtype=np.float32)  # rows drawn by the shaders
         self._raw_directions = []
         self._directions_crystallography = None
         self._directions_max_extent = 1.0
@@ -94,6 +113,13 @@ class VisualisationWidget(QOpenGLWidget):
 
         self.xyz_path_list = []
         self.sim_num = 0
+        self.point_buffers = None
+        self._point_positions = None  # float32 positions currently uploaded
+        self._point_visible = None  # Boolean mask of the points passed to the renderers
+        self.loading = False
+        self.loader = CrystalLoader(self)
+        self.loader.loaded.connect(self._on_crystal_loaded)
+        self.loader.failed.connect(self._on_crystal_failed)
         self.point_cloud_renderer = None
         self.sphere_renderer = None
         self.sphere_selection_renderer = None
@@ -101,6 +127,7 @@ class VisualisationWidget(QOpenGLWidget):
         self.axes_renderer = None
 
         self.xyz = None
+        self._xyz_shared = False  # self.xyz belongs to a (cached) crystal; copy before editing
         self.crystal = None
         # self.object = 0
 
@@ -147,22 +174,58 @@ class VisualisationWidget(QOpenGLWidget):
 
     def pass_XYZ(self, xyz):
         self.xyz = xyz
+        self._xyz_shared = True
+        self._resizePointMasks()
         logger.debug("XYZ coordinates passed on OpenGL widget")
 
     def pass_XYZ_list(self, xyz_path_list):
         self.xyz_path_list = xyz_path_list
+        self.loader.set_paths(xyz_path_list)
+        self.loading = False
         logger.info("XYZ file paths (list) passed to OpenGL widget")
 
     def get_XYZ_from_list(self, value):
+        """Show simulation *value*; returns False while it is still loading.
+
+        Simulations not yet loaded are read on a worker thread and shown
+        (emitting ``crystalLoaded``) when ready; neighbouring simulations
+        are prefetched in the background.
+        """
         if self.sim_num != value:
             self.sim_num = value
-            self.crystal = CrystalCloud.from_file(self.xyz_path_list[value])
-            if self.crystal.empty:
-                self.showNoDataOverlay()
-                return
-            self.xyz = self.crystal.get_raw_frame_coords(0)
-            self.initGeometry()
-            self.update()
+            crystal = self.loader.request(value)
+            self.loading = crystal is None
+            if crystal is not None:
+                self._show_crystal(crystal)
+        return not self.loading
+
+    def _show_crystal(self, crystal):
+        self.crystal = crystal
+        if self.crystal.empty:
+            self.showNoDataOverlay()
+            return
+        self.xyz = self.crystal.get_raw_frame_coords(0)
+        self._xyz_shared = True
+        self._resizePointMasks()
+        self.initGeometry()
+        self.update()
+
+    def _on_crystal_loaded(self, index, crystal):
+        if index != self.sim_num:
+            return
+        self.loading = False
+        self._show_crystal(crystal)
+        self.crystalLoaded.emit(index)
+
+    def _on_crystal_failed(self, index, message):
+        if index != self.sim_num:
+            return
+        self.loading = False
+        self.crystal = None
+        self.overlay.setText("Could not load this simulation")
+        self.overlay.setVisible(True)
+        self.update()
+        self.crystalLoaded.emit(index)
 
     def showNoDataOverlay(self):
         """Show an overlay message when there are no points to display."""
@@ -210,8 +273,14 @@ class VisualisationWidget(QOpenGLWidget):
             return
         visible = [p for p in self._raw_planes if p.visible]
         self.plane_renderer.set_planes(visible, self._planes_crystallography)
-        if self.xyz is not None:
-            self.initGeometry()
+
+        # Slice planes are clipped in the shaders, so moving one only changes
+        # their uniforms; the CPU mask is needed for the hull and for planes
+        # past the shaders' limit
+        previous, self._slice_planes = self._slice_planes, self._slicePlaneRows()
+        overflow = max(len(previous), len(self._slice_planes)) > MAX_SLICE_PLANES
+        if self.xyz is not None and (overflow or self.style == "Convex Hull"):
+            self.updateVisibility()
         else:
             self.update()
 
@@ -251,8 +320,8 @@ class VisualisationWidget(QOpenGLWidget):
             f"Highlighting {len(self.highlight_groups)} groups with {total_sites} total sites"
         )
 
-        # Re-initialize geometry to apply the highlighting
-        self.initGeometry()
+        # Re-colour the points to apply the highlighting
+        self.updateColors()
         self.update()
 
     def clear_highlighted_sites(self):
@@ -260,7 +329,7 @@ class VisualisationWidget(QOpenGLWidget):
         self.highlight_groups.clear()
         self.background_color_override = None
         logger.info("Cleared all highlighted sites")
-        self.initGeometry()
+        self.updateColors()
         self.update()
 
     def saveRenderDialog(self):
@@ -597,9 +666,10 @@ class VisualisationWidget(QOpenGLWidget):
             return (key in kwargs) and (prev_val != kwargs[key])
 
         needs_reinit = False
+        needs_recolor = False
         if present_and_changed("Color Map", self.colormap):
             self.colormap = kwargs["Color Map"]
-            needs_reinit = True
+            needs_recolor = True
 
         if present_and_changed("Style", self.style):
             self.style = kwargs["Style"]
@@ -615,11 +685,11 @@ class VisualisationWidget(QOpenGLWidget):
 
         if present_and_changed("Color By", self.color_by):
             self.color_by = kwargs.get("Color By", self.color_by)
-            needs_reinit = True
+            needs_recolor = True
 
         if present_and_changed("Single Color", self.single_color):
             self.single_color = kwargs.get("Single Color", self.single_color)
-            needs_reinit = True
+            needs_recolor = True
 
         if present_and_changed("Point Size", self.point_size):
             self.point_size = float(kwargs["Point Size"])
@@ -630,6 +700,8 @@ class VisualisationWidget(QOpenGLWidget):
 
         if needs_reinit:
             self.initGeometry()
+        elif needs_recolor:
+            self.updateColors()
 
         self.update()
 
@@ -852,47 +924,31 @@ class VisualisationWidget(QOpenGLWidget):
 
         ray_origin, ray_direction = self._screen_to_ray(screen_x, screen_y)
 
-        # Get point positions (columns 3:6 contain x, y, z)
-        points = self.xyz[:, 3:6]
-
-        # Calculate distance from each point to the ray
-        # Using point-to-line distance formula
-        # d = ||(p - o) - ((p - o) · d) * d|| where p=point, o=origin, d=direction
-
-        # Vector from ray origin to each point
-        to_points = points - ray_origin
-
-        # Project onto ray direction
-        projections = np.dot(to_points, ray_direction)
-
-        # Only consider points in front of the camera
-        valid_mask = projections > 0
-
-        # Exclude deleted points
-        for idx in self._deleted_points:
-            if idx < len(valid_mask):
-                valid_mask[idx] = False
-
-        if not np.any(valid_mask):
-            return None, None
-
-        # Calculate perpendicular distance to ray
-        closest_on_ray = ray_origin + np.outer(projections, ray_direction)
-        distances = np.linalg.norm(points - closest_on_ray, axis=1)
-
-        # Apply mask for valid points
-        distances[~valid_mask] = np.inf
+        # Nearest non-deleted point in front of the camera, within the
+        # picking radius (scaled by point size) of the ray
+        pick_threshold = self._pick_radius * self.point_size
+        return self._pointIndex().pick(
+            ray_origin, ray_direction, pick_threshold, mask=self._pickableMask()
+        )
 
-        # Find minimum distance
-        min_idx = np.argmin(distances)
-        min_dist = distances[min_idx]
+    def _pointIndex(self):
+        """Spatial index of the current positions, rebuilt only when they change."""
+        if self._point_index is None or self._point_index_source is not self.xyz:
+            self._point_index = PointIndex(self.xyz[:, 3:6])
+            self._point_index_source = self.xyz
+        return self._point_index
 
-        # Check if within picking radius (scale by point size)
-        pick_threshold = self._pick_radius * self.point_size
-        if min_dist < pick_threshold:
-            return min_idx, min_dist
+    def _pickableMask(self):
+        """Boolean mask of the points that can be picked, or None if all can."""
+        if not self._deleted_points:
+            return None
+        return ~self._deleted_points.span(0, len(self.xyz))
 
-        return None, None
+    def _resizePointMasks(self):
+        """Size the selection and deletion masks to the points of ``self.xyz``."""
+        n_points = 0 if self.xyz is None else len(self.xyz)
+        self._selected_points.resize(n_points)
+        self._deleted_points.resize(n_points)
 
     # ------------------------------------------------------------------
     # Sphere selection helpers
@@ -933,16 +989,11 @@ class VisualisationWidget(QOpenGLWidget):
         if self.xyz is None or self._sphere_sel_center_world is None:
             return
 
-        points = self.xyz[:, 3:6]
-        diffs = points - self._sphere_sel_center_world
-        distances = np.linalg.norm(diffs, axis=1)
-
-        within = set(np.where(distances <= self._sphere_sel_radius)[0].tolist())
-        # Remove deleted points from the candidate set
-        within -= self._deleted_points
-
-        self._selected_points = within
-        self.initGeometry()
+        within = self._pointIndex().ball(
+            self._sphere_sel_center_world, self._sphere_sel_radius, mask=self._pickableMask()
+        )
+        self._selected_points.assign(within)
+        self.updateSelection()
 
     def _draw_sphere_selection(self, gl, uniforms):
         """Draw the transparent selection sphere with alpha blending."""
@@ -994,7 +1045,7 @@ class VisualisationWidget(QOpenGLWidget):
         return data
 
     def get_selected_points(self):
-        """Get the set of currently selected point indices."""
+        """Get a copy of the currently selected point indices (a :class:`PointMask`)."""
         return self._selected_points.copy()
 
     def clear_selection(self):
@@ -1002,7 +1053,7 @@ class VisualisationWidget(QOpenGLWidget):
         self._selected_points.clear()
         self._last_selected_index = None
         self.selectionChanged.emit(self._selected_points.copy(), None)
-        self.initGeometry()
+        self.updateSelection()
         self.update()
 
     def select_point(self, index, add_to_selection=False, toggle=False):
@@ -1017,18 +1068,15 @@ class VisualisationWidget(QOpenGLWidget):
             return
 
         if toggle:
-            if index in self._selected_points:
-                self._selected_points.discard(index)
-            else:
-                self._selected_points.add(index)
+            self._selected_points.toggle(index)
         elif add_to_selection:
             self._selected_points.add(index)
         else:
-            self._selected_points = {index}
+            self._selected_points.assign([index])
 
         self._last_selected_index = index
         self.selectionChanged.emit(self._selected_points.copy(), index)
-        self.initGeometry()
+        self.updateSelection()
         self.update()
 
     def select_range(self, end_index):
@@ -1039,12 +1087,10 @@ class VisualisationWidget(QOpenGLWidget):
         start = min(self._last_selected_index, end_index)
         end = max(self._last_selected_index, end_index)
 
-        for i in range(start, end + 1):
-            if i not in self._deleted_points:
-                self._selected_points.add(i)
+        self._selected_points.add_range(start, end + 1, exclude=self._deleted_points)
 
         self.selectionChanged.emit(self._selected_points.copy(), end_index)
-        self.initGeometry()
+        self.updateSelection()
         self.update()
 
     def delete_selected_points(self):
@@ -1057,13 +1103,14 @@ class VisualisationWidget(QOpenGLWidget):
             return 0
 
         count = len(self._selected_points)
+        self._pushDeletionHistory()
         self._deleted_points.update(self._selected_points)
         self._selected_points.clear()
         self._last_selected_index = None
 
         self.selectionChanged.emit(self._selected_points.copy(), None)
         self.pointsDeleted.emit(count)
-        self.initGeometry()
+        self.updateVisibility()
         self.update()
 
         logger.info(f"Deleted {count} points, total deleted: {len(self._deleted_points)}")
@@ -1072,12 +1119,39 @@ class VisualisationWidget(QOpenGLWidget):
     def restore_deleted_points(self):
         """Restore all deleted points."""
         count = len(self._deleted_points)
+        if count:
+            self._pushDeletionHistory()
         self._deleted_points.clear()
-        self.initGeometry()
+        self.updateVisibility()
         self.update()
         logger.info(f"Restored {count} deleted points")
         return count
 
+    def undo_deletion(self):
+        """Undo the last delete (reselecting its points) or restore.
+
+        Returns:
+            bool: False if there was nothing to undo
+        """
+        if not self._deletion_history:
+            return False
+        deleted, selected = self._deletion_history.pop()
+        self._deleted_points.restore(deleted)
+        self._selected_points.restore(selected)
+        self._last_selected_index = None
+
+        self.selectionChanged.emit(self._selected_points.copy(), None)
+        self.updateVisibility()
+        self.update()
+        logger.info(f"Undid deletion, total deleted: {len(self._deleted_points)}")
+        return True
+
+    def _pushDeletionHistory(self):
+        self._deletion_history.append(
+            (self._deleted_points.snapshot(), self._selected_points.snapshot())
+        )
+        del self._deletion_history[:-MAX_DELETION_HISTORY]
+
     def get_legend_info(self):
         """Return the most recently computed legend info dict, or None if not yet available."""
         return self._legend_info
@@ -1086,21 +1160,18 @@ class VisualisationWidget(QOpenGLWidget):
         """Get XYZ data excluding deleted points.
 
         Returns:
-            np.ndarray: XYZ data with deleted points removed
+            np.ndarray: XYZ data with deleted points removed; a read-only
+            view of ``self.xyz`` (not a copy) when no points are deleted
         """
         if self.xyz is None:
             return None
 
         if not self._deleted_points:
-            return self.xyz.copy()
+            view = self.xyz.view()
+            view.flags.writeable = False
+            return view
 
-        # Create mask for non-deleted points
-        mask = np.ones(len(self.xyz), dtype=bool)
-        for idx in self._deleted_points:
-            if idx < len(mask):
-                mask[idx] = False
-
-        return self.xyz[mask].copy()
+        return self.xyz[~self._deleted_points.span(0, len(self.xyz))]
 
     def mouseMoveEvent(self, event):
         dx = event.pos().x() - self.lastMousePosition.x()
@@ -1176,40 +1247,121 @@ class VisualisationWidget(QOpenGLWidget):
         points = self.xyz[:, 3:6]
         rotated_points = points @ rotation_matrix.T
 
-        # Update the point cloud with rotated points
+        # Update the point cloud with rotated points, leaving the loaded
+        # crystal (shared with the loader cache and analysis) untouched
+        if self._xyz_shared:
+            self.xyz = self.xyz.copy()
+            self._xyz_shared = False
         self.xyz[:, 3:6] = rotated_points
+        self._point_index = None
         self.initGeometry()
 
     def initGeometry(self):
-        # self.update()
-        if self.point_cloud_renderer is None:
+        """Rebuild and upload every point attribute (new data, frame or style)."""
+        if self.point_cloud_renderer is None or self.xyz is None:
             return
 
-        varray = self.updatePointCloudVertices()
-        self.point_cloud_renderer.setPoints(varray)
-        self.sphere_renderer.setPoints(varray)
+        points, colors, selected = self._pointAttributes()
+        self._point_positions = points
+        self.makeCurrent()
+        self.point_buffers.setPositions(points)
+        self.point_buffers.setColors(colors)
+        self._uploadVisibility(self._drawnMask(points), selected)
+        self._updateHull()
+        self.doneCurrent()
+        self.update()
 
-        if self.style == "Convex Hull":
-            hull = ConvexHull(varray[:, :3])
-            mesh = trimesh.Trimesh(vertices=varray[:, :3], faces=hull.simplices)
-            # can pass vertex colors here, but I wouldn't
-            self.mesh_renderer.setMesh(mesh)
+    def updateColors(self):
+        """Re-upload only the colours (colour map, colour-by or highlight changes)."""
+        if self.point_cloud_renderer is None or self.xyz is None:
+            return
+        if self._point_positions is None or len(self._point_positions) != len(self.xyz):
+            self.initGeometry()
+            return
+        self.makeCurrent()
+        self.point_buffers.setColors(self._pointColors())
+        self.doneCurrent()
+        self.update()
 
-            if self.show_mesh_edges:
-                self.line_renderer.setLines(self.mesh_renderer.getLines())
+    def updateSelection(self):
+        """Patch only the selection flags of the points whose selection changed."""
+        if self.point_cloud_renderer is None or self._point_visible is None:
+            return
+        selected = self._selectionFlags(len(self._point_visible))
+        self.makeCurrent()
+        self.point_buffers.setFlags(np.where(self._point_visible, selected, FLAG_HIDDEN))
+        self.doneCurrent()
+        self.update()
 
+    def updateVisibility(self):
+        """Re-upload which points are drawn (deleted points and CPU-side slice planes)."""
+        if self.point_cloud_renderer is None or self._point_positions is None:
+            return
+        points = self._point_positions
+        self.makeCurrent()
+        self._uploadVisibility(self._drawnMask(points), self._selectionFlags(len(points)))
+        self._updateHull()
+        self.doneCurrent()
         self.update()
 
+    def _uploadVisibility(self, visible, selected):
+        self._point_visible = visible
+        self.point_buffers.setFlags(np.where(visible, selected, FLAG_HIDDEN))
+        self.point_cloud_renderer.setVisible(visible)
+        self.sphere_renderer.setVisible(visible)
+
+    def _updateHull(self):
+        if self.style != "Convex Hull":
+            return
+        varray = self._point_positions[self._visibleMask(self._point_positions)]
+        candidates = hull_candidates(varray)
+        hull = ConvexHull(varray[candidates])
+        mesh = trimesh.Trimesh(vertices=varray, faces=candidates[hull.simplices])
+        # can pass vertex colors here, but I wouldn't
+        self.mesh_renderer.setMesh(mesh)
+
+        if self.show_mesh_edges:
+            self.line_renderer.setLines(self.mesh_renderer.getLines())
+
     def updatePointCloudVertices(self):
+        """Visible points as an ``(n, 7)`` array of position, colour and selection flag."""
+        points, colors, selected = self._pointAttributes()
+        try:
+            # Concatenate: position (3) + color (3) + selection (1) = 7 floats
+            attributes = np.column_stack((points, colors, selected))
+            return attributes[self._visibleMask(points)]
+        except ValueError as exc:
+            logger.error(
+                "%s\n XYZ %s POINTS %s COLORS %s TYPE %s",
+                exc,
+                self.xyz.shape,
+                points.shape,
+                colors.shape,
+                self.color_by,
+            )
+            return
+
+    def _pointAttributes(self):
+        """Positions, colours and selection flags of every point."""
         self.overlay.setVisible(False)
         logger.debug("Loading Vertices")
         logger.debug(".XYZ shape: %s", self.xyz.shape[0])
+
+        points = np.asarray(self.xyz[:, 3:6]).astype("float32")
+        if not self.viewInitialized:
+            self.camera.fitToObject(points)
+            self.viewInitialized = True
+
+        colors = self._pointColors()
+        return points, colors, self._selectionFlags(len(points))
+
+    def _pointColors(self):
+        """Per-point RGB colours with site highlights applied; also refreshes the legend."""
         layers = self.xyz[:, 2]
         max_layers = int(np.nanmax(layers[layers < 99]))
 
         # Loading the point cloud from file
         def vis_pc(xyz, color_axis):
-            pcd_points = xyz[:, 3:6]
             pcd_colors = None
 
             if xyz.shape[1] <= 6 and color_axis >= 6:
@@ -1270,15 +1422,9 @@ class VisualisationWidget(QOpenGLWidget):
             }
             self.legendChanged.emit(self._legend_info)
 
-            return (pcd_points, pcd_colors)
-
-        points, colors = vis_pc(self.xyz, self.columnLabelToIndex[self.color_by])
-
-        if not self.viewInitialized:
-            self.camera.fitToObject(points)
-            self.viewInitialized = True
+            return pcd_colors
 
-        points = np.asarray(points).astype("float32")
+        colors = vis_pc(self.xyz, self.columnLabelToIndex[self.color_by])
         colors = np.asarray(colors).astype("float32")
 
         # Apply site highlighting if any groups are defined
@@ -1296,23 +1442,43 @@ class VisualisationWidget(QOpenGLWidget):
                 mask = np.isin(site_numbers, list(site_set))
                 colors[mask] = highlight_color
 
-        # Create selection flags array (1.0 for selected, 0.0 for not selected)
-        selection_flags = np.zeros((len(points), 1), dtype=np.float32)
-        if self._selected_points:
-            for idx in self._selected_points:
-                if idx < len(selection_flags):
-                    selection_flags[idx] = 1.0
+        return colors
+
+    def _selectionFlags(self, n_pts):
+        """``FLAG_SELECTED`` for selected points, ``FLAG_NORMAL`` otherwise."""
+        return np.where(self._selected_points.span(0, n_pts), FLAG_SELECTED, FLAG_NORMAL).astype(
+            np.float32
+        )
 
-        # Build combined mask: exclude deleted points and apply active slice planes
-        n_pts = len(points)
-        combined_mask = np.ones(n_pts, dtype=bool)
+    def _visibleMask(self, points):
+        """Points that are neither deleted nor cut away by an active slice plane."""
+        return ~self._deleted_points.span(0, len(points)) & self._sliceMask(
+            points, self._slicePlaneRows()
+        )
 
-        # Deleted-points mask
-        for idx in self._deleted_points:
-            if idx < n_pts:
-                combined_mask[idx] = False
+    def _drawnMask(self, points):
+        """Points passed to the renderers: not deleted nor cut by a plane the shaders skip."""
+        return ~self._deleted_points.span(0, len(points)) & self._sliceMask(
+            points, self._slicePlaneRows()[MAX_SLICE_PLANES:]
+        )
 
-        # Slice-plane masks (applied in translated coordinate space)
+    @staticmethod
+    def _sliceMask(points, planes):
+        """Points kept by every slice plane row of *planes* (see ``_slicePlaneRows``)."""
+        keep = np.ones(len(points), dtype=bool)
+        for nx, ny, nz, offset, lo, hi in planes:
+            d = points @ np.array([nx, ny, nz], dtype=np.float32) + offset
+            keep &= (d >= lo) & (d <= hi)
+        return keep
+
+    def _slicePlaneRows(self):
+        """Active slice planes as ``(n, 6)`` rows of unit normal, offset and kept range.
+
+        A point ``p`` is kept by a row when ``lo <= normal . p + offset <= hi``;
+        the point and sphere shaders evaluate the same test (in translated
+        coordinate space, like the planes).
+        """
+        rows = []
         for plane in self._raw_planes:
             if not plane.slice_enabled:
                 continue
@@ -1323,33 +1489,13 @@ class VisualisationWidget(QOpenGLWidget):
             if n_len < 1e-10:
                 continue
             normal /= n_len
-            origin = np.array(plane.origin, dtype=np.float64)
-            d = (points - origin.astype(np.float32)) @ normal.astype(np.float32)
+            offset = -float(normal @ np.array(plane.origin, dtype=np.float64))
             if plane.slice_two_sided:
-                combined_mask &= np.abs(d) <= plane.slice_thickness / 2.0
+                lo, hi = -plane.slice_thickness / 2.0, plane.slice_thickness / 2.0
             else:
-                combined_mask &= d >= -plane.slice_thickness
-
-        if not np.all(combined_mask):
-            points = points[combined_mask]
-            colors = colors[combined_mask]
-            selection_flags = selection_flags[combined_mask]
-
-        try:
-            # Concatenate: position (3) + color (3) + selection (1) = 7 floats
-            attributes = np.concatenate((points, colors, selection_flags), axis=1)
-
-            return attributes
-        except ValueError as exc:
-            logger.error(
-                "%s\n XYZ %s POINTS %s COLORS %s TYPE %s",
-                exc,
-                self.xyz.shape,
-                points.shape,
-                colors.shape,
-                self.color_by,
-            )
-            return
+                lo, hi = -plane.slice_thickness, SLICE_UNBOUNDED
+            rows.append([*normal, offset, lo, hi])
+        return np.array(rows, dtype=np.float32).reshape(-1, 6)
 
     def initializeGL(self):
         logger.debug("Initialized OpenGL, version info: %s", self.context().format().version())
@@ -1364,8 +1510,9 @@ class VisualisationWidget(QOpenGLWidget):
 
         color = self.backgroundColor
         gl = self.context().extraFunctions()
-        self.point_cloud_renderer = SimplePointRenderer()
-        self.sphere_renderer = SphereRenderer(gl)
+        self.point_buffers = PointCloudBuffers()
+        self.point_cloud_renderer = SimplePointRenderer(self.point_buffers)
+        self.sphere_renderer = SphereRenderer(gl, self.point_buffers)
         self.sphere_selection_renderer = SphereSelectionRenderer()
         self.mesh_renderer = MeshRenderer(gl)
         self.line_renderer = LineRenderer(gl)
@@ -1388,6 +1535,7 @@ class VisualisationWidget(QOpenGLWidget):
             return
         self.point_cloud_renderer.bind()
         self.point_cloud_renderer.setUniforms(**uniforms)
+        self.point_cloud_renderer.setSlicePlanes(self._slice_planes)
 
         self.point_cloud_renderer.draw(gl)
         self.point_cloud_renderer.release()
@@ -1397,6 +1545,7 @@ class VisualisationWidget(QOpenGLWidget):
             return
         self.sphere_renderer.bind(gl)
         self.sphere_renderer.setUniforms(**uniforms)
+        self.sphere_renderer.setSlicePlanes(self._slice_planes)
 
         self.sphere_renderer.draw(gl)
         self.sphere_renderer.release()
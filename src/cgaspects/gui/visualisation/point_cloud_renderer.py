@@ -1,13 +1,127 @@
 import numpy as np
-from OpenGL.GL import GL_FLOAT, GL_POINTS, GL_PROGRAM_POINT_SIZE
+from OpenGL.GL import GL_FLOAT, GL_POINTS, GL_PROGRAM_POINT_SIZE, GL_UNSIGNED_INT
+from PySide6.QtGui import QVector2D, QVector4D
 from PySide6.QtOpenGL import (QOpenGLBuffer, QOpenGLShader,
                               QOpenGLShaderProgram, QOpenGLVertexArrayObject)
 
+# Per-point flag values in PointCloudBuffers.flag_buffer
+FLAG_HIDDEN = -1.0
+FLAG_NORMAL = 0.0
+FLAG_SELECTED = 1.0
+
+# Slice planes clipped in the vertex shaders; any further planes are
+# applied on the CPU through the visibility mask
+MAX_SLICE_PLANES = 8
+# Upper bound of the kept range of a one-sided slice plane
+SLICE_UNBOUNDED = float(np.finfo(np.float32).max)
+
+# Shared by the point and sphere vertex shaders.  Each plane is a row of
+# (unit normal, offset, lo, hi) and keeps the points p with
+# lo <= dot(normal, p) + offset <= hi.
+SLICE_PLANES_GLSL = f"""
+        #define MAX_SLICE_PLANES {MAX_SLICE_PLANES}
+        uniform int u_slicePlaneCount;
+        uniform vec4 u_slicePlanes[MAX_SLICE_PLANES];
+        uniform vec2 u_sliceRanges[MAX_SLICE_PLANES];
+
+        bool slicedAway(vec3 p) {{
+            for (int i = 0; i < u_slicePlaneCount; ++i) {{
+                float d = dot(u_slicePlanes[i].xyz, p) + u_slicePlanes[i].w;
+                if (d < u_sliceRanges[i].x || d > u_sliceRanges[i].y) {{
+                    return true;
+                }}
+            }}
+            return false;
+        }}
+"""
+
+
+def setSlicePlaneUniforms(program, planes):
+    """Load the first ``MAX_SLICE_PLANES`` rows of *planes* into the bound *program*.
+
+    *planes* is an ``(n, 6)`` array of (normal, offset, lo, hi) rows, as
+    described for ``SLICE_PLANES_GLSL``.
+    """
+    planes = planes[:MAX_SLICE_PLANES]
+    program.setUniformValue1i("u_slicePlaneCount", len(planes))
+    for i, (nx, ny, nz, offset, lo, hi) in enumerate(planes.tolist()):
+        program.setUniformValue(f"u_slicePlanes[{i}]", QVector4D(nx, ny, nz, offset))
+        program.setUniformValue(f"u_sliceRanges[{i}]", QVector2D(lo, hi))
+
+
+def _upload(buffer, data):
+    """Write *data* into the bound *buffer*, reallocating only if the size changed."""
+    if buffer.size() == data.nbytes:
+        buffer.write(0, data.ctypes.data, data.nbytes)
+    else:
+        buffer.allocate(data.tobytes(), data.nbytes)
+
+
+class PointCloudBuffers:
+    """GPU buffers of the displayed point cloud, shared by the point and sphere renderers.
+
+    Positions and colours are separate static buffers that are only
+    re-uploaded when they change.  Selection and visibility live in a small
+    per-point flag buffer (``FLAG_SELECTED``, ``FLAG_NORMAL`` or
+    ``FLAG_HIDDEN``) that is patched in place with ``glBufferSubData``, so
+    an interactive selection uploads 4 bytes per changed point instead of
+    the whole cloud.  A CPU copy of the flags finds the span to patch.
+    """
+
+    def __init__(self):
+        self.position_buffer = self._create(QOpenGLBuffer.StaticDraw)
+        self.color_buffer = self._create(QOpenGLBuffer.StaticDraw)
+        self.flag_buffer = self._create(QOpenGLBuffer.DynamicDraw)
+        self.n_points = 0
+        self.flags = None
+
+    @staticmethod
+    def _create(usage):
+        buffer = QOpenGLBuffer(QOpenGLBuffer.VertexBuffer)
+        buffer.create()
+        buffer.setUsagePattern(usage)
+        return buffer
+
+    def setPositions(self, positions):
+        positions = np.ascontiguousarray(positions, dtype=np.float32)
+        self.position_buffer.bind()
+        _upload(self.position_buffer, positions)
+        self.position_buffer.release()
+        self.n_points = len(positions)
+
+    def setColors(self, colors):
+        colors = np.ascontiguousarray(colors, dtype=np.float32)
+        self.color_buffer.bind()
+        _upload(self.color_buffer, colors)
+        self.color_buffer.release()
+
+    def setFlags(self, flags) -> int:
+        """Upload per-point flags, writing only the span that changed.
+
+        Returns the number of flags written.
+        """
+        flags = np.ascontiguousarray(flags, dtype=np.float32)
+        self.flag_buffer.bind()
+        if self.flags is None or len(self.flags) != len(flags):
+            _upload(self.flag_buffer, flags)
+            written = len(flags)
+        else:
+            changed = np.flatnonzero(flags != self.flags)
+            written = 0
+            if len(changed):
+                lo, hi = int(changed[0]), int(changed[-1]) + 1
+                span = flags[lo:hi]
+                self.flag_buffer.write(lo * 4, span.ctypes.data, span.nbytes)
+                written = hi - lo
+        self.flag_buffer.release()
+        self.flags = flags.copy()
+        return written
+
 
 class SimplePointRenderer:
     point_size = 200.0
 
-    def __init__(self):
+    def __init__(self, buffers: PointCloudBuffers):
         self.vertex_shader_source = """
         #version 330 core
         layout(location = 0) in vec3 position;
@@ -19,8 +133,13 @@ class SimplePointRenderer:
 
         uniform mat4 u_modelViewProjectionMat;
         uniform float u_pointSize;
-
+        """ + SLICE_PLANES_GLSL + """
         void main() {
+            // Sliced-away points are moved outside the clip volume and culled
+            if (slicedAway(position)) {
+                gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+                return;
+            }
             gl_Position = u_modelViewProjectionMat * vec4(position, 1.0);
             // Make selected points slightly larger
             gl_PointSize = u_pointSize * (1.0 + selected * 0.3);
@@ -60,7 +179,8 @@ class SimplePointRenderer:
         }
         """
 
-        self.points = None
+        self.buffers = buffers
+        self.indices = None
         self.program = QOpenGLShaderProgram()
         self.program.addShaderFromSourceCode(
             QOpenGLShader.Vertex, self.vertex_shader_source
@@ -70,27 +190,30 @@ class SimplePointRenderer:
         )
         self.program.link()
 
-        self.vertex_buffer = QOpenGLBuffer(QOpenGLBuffer.VertexBuffer)
-        self.vertex_buffer.create()
-        self.vertex_buffer.bind()
-
         self.vao = QOpenGLVertexArrayObject()
         self.vao.create()
         self.vao.bind()
+        self.program.bind()
 
-        # Stride: 3 (position) + 3 (color) + 1 (selected) = 7 floats = 28 bytes
-        stride = 7 * 4
+        for location, buffer, size in (
+            (0, buffers.position_buffer, 3),
+            (1, buffers.color_buffer, 3),
+            (2, buffers.flag_buffer, 1),
+        ):
+            buffer.bind()
+            self.program.enableAttributeArray(location)
+            self.program.setAttributeBuffer(location, GL_FLOAT, 0, size, size * 4)
+            buffer.release()
 
-        self.program.bind()
-        self.program.enableAttributeArray(0)
-        self.program.setAttributeBuffer(0, GL_FLOAT, 0, 3, stride)
-        self.program.enableAttributeArray(1)
-        self.program.setAttributeBuffer(1, GL_FLOAT, 3 * 4, 3, stride)
-        self.program.enableAttributeArray(2)
-        self.program.setAttributeBuffer(2, GL_FLOAT, 6 * 4, 1, stride)
+        # Only the visible points are drawn, through an element buffer that
+        # stays bound to the VAO
+        self.index_buffer = QOpenGLBuffer(QOpenGLBuffer.IndexBuffer)
+        self.index_buffer.create()
+        self.index_buffer.setUsagePattern(QOpenGLBuffer.DynamicDraw)
+        self.index_buffer.bind()
 
         self.vao.release()
-        self.vertex_buffer.release()
+        self.index_buffer.release()
         self.program.release()
 
     def setUniforms(self, **kwargs):
@@ -102,6 +225,9 @@ class SimplePointRenderer:
             else:
                 self.program.setUniformValue(k, v)
 
+    def setSlicePlanes(self, planes):
+        setSlicePlaneUniforms(self.program, planes)
+
     def bind(self):
         self.program.bind()
         self.vao.bind()
@@ -113,18 +239,19 @@ class SimplePointRenderer:
     def draw(self, gl):
         n = self.numberOfPoints()
         gl.glEnable(GL_PROGRAM_POINT_SIZE)
-        gl.glDrawArrays(GL_POINTS, 0, n)
+        gl.glDrawElements(GL_POINTS, n, GL_UNSIGNED_INT, 0)
 
     def numberOfPoints(self):
-        if self.points is None:
+        if self.indices is None:
             return 0
-        return self.points.size // 7  # 3 (position) + 3 (color) + 1 (selected)
+        return len(self.indices)
 
-    def setPoints(self, points):
-        self.points = np.array(points, dtype=np.float32).flatten()
-        self._updateBuffers()
-
-    def _updateBuffers(self):
-        self.vertex_buffer.bind()
-        self.vertex_buffer.allocate(self.points.tobytes(), self.points.nbytes)
-        self.vertex_buffer.release()
+    def setVisible(self, visible):
+        """Draw only the points where the boolean mask *visible* is set."""
+        self.indices = np.flatnonzero(visible).astype(np.uint32)
+        # The element buffer binding is VAO state, so upload through the VAO
+        self.vao.bind()
+        self.index_buffer.bind()
+        _upload(self.index_buffer, self.indices)
+        self.vao.release()
+        self.index_buffer.release()
@@ -0,0 +1,109 @@
+"""Spatial index of the displayed points for picking and sphere selection."""
+
+from itertools import chain
+from typing import Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Most tree queries issued along one picking ray; long rays through a
+# dense cloud use fewer, wider queries instead
+MAX_RAY_SAMPLES = 512
+
+
+class PointIndex:
+    """KD-tree over the point positions of one frame.
+
+    Built once per frame and reused by every hover, click and sphere
+    selection until the positions change.  Ray picks only look at the
+    points in a cylinder around the ray: the ray is clipped to the bounds
+    of the cloud and covered by a row of ball queries.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        ``(n, 3)`` point positions.
+    """
+
+    def __init__(self, points: np.ndarray):
+        self.points = np.ascontiguousarray(points, dtype=np.float64)
+        # Rebuilt for every new frame, so built quickly rather than balanced
+        self.tree = cKDTree(self.points, balanced_tree=False, compact_nodes=False)
+        if len(self.points):
+            self.lower = self.points.min(axis=0)
+            self.upper = self.points.max(axis=0)
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def ball(self, center, radius: float, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sorted indices of the points within *radius* of *center* (and set in *mask*)."""
+        if len(self.points) == 0 or radius < 0:
+            return np.empty(0, dtype=np.intp)
+        idx = np.asarray(self.tree.query_ball_point(center, radius), dtype=np.intp)
+        idx.sort()
+        if mask is not None:
+            idx = idx[mask[idx]]
+        return idx
+
+    def pick(self, origin, direction, radius: float, mask: Optional[np.ndarray] = None):
+        """Point closest to a ray, in front of *origin* and nearer than *radius* to it.
+
+        Only points set in the boolean *mask* (if given) are considered;
+        ties go to the lowest index.
+
+        Returns
+        -------
+        tuple
+            ``(index, distance)``, or ``(None, None)`` if no point is close enough.
+        """
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        direction = direction / np.linalg.norm(direction)
+
+        candidates = self._near_ray(origin, direction, radius)
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        if len(candidates) == 0:
+            return None, None
+
+        to_points = self.points[candidates] - origin
+        projections = to_points @ direction
+        distances = np.linalg.norm(to_points - np.outer(projections, direction), axis=1)
+        hit = (projections > 0) & (distances < radius)
+        if not hit.any():
+            return None, None
+        candidates, distances = candidates[hit], distances[hit]
+        best = np.lexsort((candidates, distances))[0]
+        return int(candidates[best]), float(distances[best])
+
+    def _near_ray(self, origin, direction, radius: float) -> np.ndarray:
+        """Indices of a superset of the points within *radius* of the ray."""
+        if len(self.points) == 0 or radius <= 0:
+            return np.empty(0, dtype=np.intp)
+
+        # Clip the ray (t > 0) to the bounds of the cloud grown by the radius
+        t_near, t_far = 0.0, np.inf
+        for axis in range(3):
+            lo = self.lower[axis] - radius - origin[axis]
+            hi = self.upper[axis] + radius - origin[axis]
+            if abs(direction[axis]) < 1e-12:
+                if lo > 0 or hi < 0:
+                    return np.empty(0, dtype=np.intp)
+                continue
+            t0, t1 = sorted((lo / direction[axis], hi / direction[axis]))
+            t_near, t_far = max(t_near, t0), min(t_far, t1)
+        if t_near > t_far:
+            return np.empty(0, dtype=np.intp)
+
+        # Balls spaced *step* apart along the clipped ray cover the cylinder
+        # when their radius reaches half a step past it
+        length = t_far - t_near
+        step = max(2.0 * radius, length / MAX_RAY_SAMPLES)
+        n_samples = int(np.ceil(length / step)) + 1
+        centres = origin + np.outer(np.linspace(t_near, t_far, n_samples), direction)
+        found = self.tree.query_ball_point(centres, np.hypot(radius, step / 2))
+
+        idx = np.fromiter(chain.from_iterable(found), dtype=np.intp)
+        idx.sort()
+        return idx[np.concatenate(([True], idx[1:] != idx[:-1]))] if len(idx) else idx
@@ -0,0 +1,144 @@
+"""Boolean-array sets of point indices for the visualiser's selection state."""
+
+from typing import Iterable, Union
+
+import numpy as np
+
+IndicesLike = Union["PointMask", np.ndarray, Iterable[int]]
+
+
+class PointMask:
+    """Set of point indices stored as one boolean per point.
+
+    Behaves like a ``set`` of ints for ``len``, ``in`` and iteration (in
+    ascending order), while unions, differences and exports are single
+    vectorised operations on :attr:`mask`.
+
+    The array only ever grows: :meth:`resize` to fewer points hides the
+    indices past the end rather than dropping them, so stepping back and
+    forth through the frames of a growth movie keeps the points picked in
+    a later frame.  Indices outside the current size are ignored, as are
+    negative ones.
+
+    Parameters
+    ----------
+    n_points : int
+        Number of points the indices refer to.
+    indices : optional
+        Initial members; anything accepted by :meth:`update`.
+    """
+
+    def __init__(self, n_points: int = 0, indices: IndicesLike = ()):
+        self._bits = np.zeros(n_points, dtype=bool)
+        self.size = n_points
+        self.update(indices)
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Boolean view over the current points (writes go to the set)."""
+        return self._bits[: self.size]
+
+    def resize(self, n_points: int):
+        """Refer to *n_points* points, keeping the members of every earlier size."""
+        if n_points > len(self._bits):
+            bits = np.zeros(n_points, dtype=bool)
+            bits[: len(self._bits)] = self._bits
+            self._bits = bits
+        self.size = n_points
+
+    # ---- Set protocol ----
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.mask))
+
+    def __bool__(self) -> bool:
+        return bool(self.mask.any())
+
+    def __contains__(self, index) -> bool:
+        return 0 <= index < self.size and bool(self._bits[index])
+
+    def __iter__(self):
+        return iter(self.indices().tolist())
+
+    def __repr__(self) -> str:
+        return f"PointMask({len(self)} of {self.size} points)"
+
+    def indices(self) -> np.ndarray:
+        """Member indices in ascending order."""
+        return np.flatnonzero(self.mask)
+
+    def copy(self) -> "PointMask":
+        out = PointMask.__new__(PointMask)
+        out._bits = self.mask.copy()
+        out.size = self.size
+        return out
+
+    # ---- Updates ----
+    def add(self, index: int):
+        if 0 <= index < self.size:
+            self._bits[index] = True
+
+    def discard(self, index: int):
+        if 0 <= index < self.size:
+            self._bits[index] = False
+
+    def toggle(self, index: int):
+        if 0 <= index < self.size:
+            self._bits[index] = not self._bits[index]
+
+    def clear(self):
+        self._bits[:] = False
+
+    def assign(self, other: IndicesLike):
+        """Make *other* the only members (in the current size)."""
+        self.clear()
+        self.update(other)
+
+    def update(self, other: IndicesLike):
+        """Add every member of *other*."""
+        self.mask[self._as_mask(other)] = True
+
+    def difference_update(self, other: IndicesLike):
+        """Remove every member of *other*."""
+        self.mask[self._as_mask(other)] = False
+
+    def add_range(self, start: int, stop: int, exclude: "PointMask" = None):
+        """Add the indices ``start <= i < stop``, except members of *exclude*."""
+        start, stop = max(start, 0), min(stop, self.size)
+        if start >= stop:
+            return
+        span = self.mask[start:stop]
+        if exclude is None:
+            span[:] = True
+        else:
+            span |= ~exclude.span(start, stop)
+
+    def span(self, start: int, stop: int) -> np.ndarray:
+        """Copy of the membership of ``start <= i < stop``, False past the current size."""
+        out = np.zeros(stop - start, dtype=bool)
+        have = self._bits[start : min(stop, self.size)]
+        out[: len(have)] = have
+        return out
+
+    def _as_mask(self, other: IndicesLike) -> np.ndarray:
+        if isinstance(other, PointMask):
+            return other.span(0, self.size)
+        if isinstance(other, np.ndarray) and other.dtype == bool:
+            out = np.zeros(self.size, dtype=bool)
+            out[: min(len(other), self.size)] = other[: self.size]
+            return out
+        if not isinstance(other, np.ndarray):
+            other = np.fromiter(other, dtype=np.int64)
+        idx = other.astype(np.int64, copy=False)
+        return idx[(idx >= 0) & (idx < self.size)]
+
+    # ---- Undo ----
+    def snapshot(self) -> tuple:
+        """Compact copy (one bit per point) for :meth:`restore`."""
+        return len(self._bits), np.packbits(self._bits)
+
+    def restore(self, snapshot: tuple):
+        """Return to the members saved by :meth:`snapshot`."""
+        n_bits, packed = snapshot
+        bits = np.zeros(max(n_bits, self.size), dtype=bool)
+        bits[:n_bits] = np.unpackbits(packed, count=n_bits).astype(bool)
+        self._bits = bits
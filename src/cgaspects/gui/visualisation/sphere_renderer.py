@@ -8,13 +8,15 @@ from PySide6.QtOpenGL import (
 )
 from PySide6.QtGui import QOpenGLExtraFunctions
 
+from .point_cloud_renderer import SLICE_PLANES_GLSL, setSlicePlaneUniforms
+
 
 class SphereRenderer(QOpenGLExtraFunctions):
     faces = None
     vertices = None
-    instances = None
+    visible_count = 0
 
-    def __init__(self, gl):
+    def __init__(self, gl, buffers):
         super().__init__()
         self.initializeOpenGLFunctions()
         self.vertex_shader_source = """
@@ -32,8 +34,14 @@ class SphereRenderer(QOpenGLExtraFunctions):
         uniform float u_pointSize;
         uniform mat4 u_viewMat;
         uniform mat4 u_modelViewProjectionMat;
-
+        """ + SLICE_PLANES_GLSL + """
         void main() {
+          // Hidden and sliced-away points collapse to a single vertex
+          // outside the clip volume
+          if (selected < -0.5 || slicedAway(position)) {
+            gl_Position = vec4(2.0, 2.0, 2.0, 1.0);
+            return;
+          }
           v_spherePosition = vertexPosition;
           v_selected = selected;
 
@@ -100,7 +108,7 @@ class SphereRenderer(QOpenGLExtraFunctions):
             fragColor = vec4(color, v_color.a);
         }
         """
-        self.points = None
+        self.buffers = buffers
         self.program = QOpenGLShaderProgram()
         self.program.addShaderFromSourceCode(QOpenGLShader.Vertex, self.vertex_shader_source)
         self.program.addShaderFromSourceCode(QOpenGLShader.Fragment, self.fragment_shader_source)
@@ -121,30 +129,18 @@ class SphereRenderer(QOpenGLExtraFunctions):
         self.program.setAttributeBuffer(0, GL_FLOAT, 0, 3, 3 * 4)
         self.vertex_buffer.release()
 
-        self.instance_buffer = QOpenGLBuffer()
-        self.instance_buffer.create()
-        self.instance_buffer.bind()
-        self.instance_buffer.setUsagePattern(QOpenGLBuffer.DynamicDraw)
-
-        # Stride: 3 floats (position) + 3 floats (color) + 1 float (selected) = 7 floats = 28 bytes
-        stride = 28
-
-        offset = 0
-        self.program.enableAttributeArray(1)
-        self.program.setAttributeBuffer(1, GL_FLOAT, offset, 3, stride)
-        gl.glVertexAttribDivisor(1, 1)
+        # Per-instance attributes come from the shared point cloud buffers
+        for location, buffer, size in (
+            (1, buffers.position_buffer, 3),
+            (2, buffers.color_buffer, 3),
+            (3, buffers.flag_buffer, 1),
+        ):
+            buffer.bind()
+            self.program.enableAttributeArray(location)
+            self.program.setAttributeBuffer(location, GL_FLOAT, 0, size, size * 4)
+            gl.glVertexAttribDivisor(location, 1)
+            buffer.release()
 
-        offset = 12  # 3 floats * 4 bytes
-        self.program.enableAttributeArray(2)
-        self.program.setAttributeBuffer(2, GL_FLOAT, offset, 3, stride)
-        gl.glVertexAttribDivisor(2, 1)
-
-        offset = 24  # 6 floats * 4 bytes
-        self.program.enableAttributeArray(3)
-        self.program.setAttributeBuffer(3, GL_FLOAT, offset, 1, stride)
-        gl.glVertexAttribDivisor(3, 1)
-
-        self.instance_buffer.release()
         self.vao.release()
         self.program.release()
 
@@ -157,6 +153,9 @@ class SphereRenderer(QOpenGLExtraFunctions):
             else:
                 self.program.setUniformValue(k, v)
 
+    def setSlicePlanes(self, planes):
+        setSlicePlaneUniforms(self.program, planes)
+
     def bind(self, gl):
         self.program.bind()
         self.vao.bind()
@@ -171,9 +170,9 @@ class SphereRenderer(QOpenGLExtraFunctions):
         )
 
     def numberOfInstances(self):
-        if self.instances is None:
+        if self.visible_count == 0:
             return 0
-        return self.instances.size // 7  # 3 (position) + 3 (color) + 1 (selected)
+        return self.buffers.n_points
 
     def numberOfFaces(self):
         if self.mesh is None:
@@ -185,14 +184,9 @@ class SphereRenderer(QOpenGLExtraFunctions):
             return 0
         return self.vertices_flattened.size // 3
 
-    def setPoints(self, points):
-        self.instances = np.array(points, dtype=np.float32).flatten()
-        self._updateBuffers()
-
-    def _updateBuffers(self):
-        self.instance_buffer.bind()
-        self.instance_buffer.allocate(self.instances.tobytes(), self.instances.nbytes)
-        self.instance_buffer.release()
+    def setVisible(self, visible):
+        """Record how many instances are visible; hidden ones are flagged in the shared buffers."""
+        self.visible_count = int(np.count_nonzero(visible))
 
     def loadBaseMesh(self, gl, **kwargs):
         from trimesh.creation import icosphere
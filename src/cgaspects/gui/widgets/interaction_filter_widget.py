@@ -21,6 +21,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from cgaspects.analysis.site_table import SiteTable
+
 logger = logging.getLogger("CA:InteractionFilterWidget")
 
 
@@ -98,19 +100,12 @@ class InteractionFilterWidget(QWidget):
         interaction_freqs = {}  # {interaction_id: max_frequency}
 
         for _, dataset in site_analysis_data.items():
-            sites_dict = dataset.get("sites", {})
-
-            for _, site_data in sites_dict.items():
-                interactions = site_data.get("interactions", {})
-
-                for interaction_id, frequency in interactions.items():
-                    interaction_id = int(interaction_id)
-                    if interaction_id not in interaction_freqs:
-                        interaction_freqs[interaction_id] = frequency
-                    else:
-                        interaction_freqs[interaction_id] = max(
-                            interaction_freqs[interaction_id], frequency
-                        )
+            # Maxima are read off the sparse interaction matrix of each prefix
+            table = SiteTable.from_result(dataset)
+            for interaction_id, frequency in table.interaction_max_frequencies().items():
+                interaction_freqs[interaction_id] = max(
+                    interaction_freqs.get(interaction_id, frequency), frequency
+                )
 
         if not interaction_freqs:
             logger.info("No interaction data found in site analysis")
@@ -420,19 +420,19 @@ class Plotting(QDialog):
 
         Args:
             site_data: Dict of site analysis dictionaries (from merged_results), keyed by file prefix
-            json_path: Path to site_analysis_data.json file
+            json_path: Path to saved site results (site_analysis_data.npz, or an
+                exported site_analysis_data.json)
             savepath: Directory to save plots
             show: Whether to show the plot interactively
             cmap: Colormap to use for the plot (default: "viridis")
             vmin: Minimum value for color scale (default: None, auto)
             vmax: Maximum value for color scale (default: None, auto)
         """
-        import json
+        from ..fileio.site_results import load_site_results
 
-        # Load data from JSON if provided
+        # Load saved results if provided
         if json_path is not None:
-            with open(json_path, 'r') as f:
-                site_data = json.load(f)
+            site_data = load_site_results(json_path)
 
         if site_data is None:
             logger.error("No site data provided for plotting")
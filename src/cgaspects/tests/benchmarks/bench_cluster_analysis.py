@@ -0,0 +1,145 @@
+"""Benchmark the cluster analysis backends against the original implementations.
+
+Compares the neighbour-graph DBSCAN with ``sklearn.cluster.DBSCAN``, the
+contingency-table cluster statistics with per-cluster mask loops, and
+incremental frame-series tracking with clustering every frame from scratch.
+
+Usage::
+
+    python -m cgaspects.tests.benchmarks.bench_cluster_analysis [--points 200000] [--clusters 20000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.cluster import DBSCAN
+
+from cgaspects.analysis.cluster_analysis import _neighbour_graph_dbscan, _type_stats
+from cgaspects.analysis.cluster_tracking import track_frames
+from cgaspects.fileio.xyz_file import Frame
+
+
+def lattice_frame(n_points: int, fill: float = 0.35, seed: int = 0) -> np.ndarray:
+    """Coordinates of *n_points* randomly occupied sites of a cubic lattice."""
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil((n_points / fill) ** (1 / 3)))
+    sites = rng.choice(side**3, size=n_points, replace=False)
+    return np.column_stack(np.unravel_index(sites, (side, side, side))).astype(float)
+
+
+def type_stats_loops(labels: np.ndarray, types: np.ndarray, unique_types: np.ndarray) -> dict:
+    """Reference implementation: one boolean mask per cluster ID."""
+    out = {}
+    for t in unique_types:
+        t_mask = types == t
+        cl_ids = np.unique(labels[t_mask & (labels >= 0)])
+        key = f"type{t}"
+        if len(cl_ids) == 0:
+            out.update(
+                {
+                    f"{key}_n_clusters": 0,
+                    f"{key}_avg_size": 0.0,
+                    f"{key}_max_size": 0,
+                    f"{key}_noise_frac": 1.0,
+                    f"{key}_size_std": 0.0,
+                }
+            )
+        else:
+            sizes = np.array([(t_mask & (labels == c)).sum() for c in cl_ids])
+            n_noise = int((t_mask & (labels == -1)).sum())
+            out.update(
+                {
+                    f"{key}_n_clusters": int(len(cl_ids)),
+                    f"{key}_avg_size": float(sizes.mean()),
+                    f"{key}_max_size": int(sizes.max()),
+                    f"{key}_noise_frac": n_noise / int(t_mask.sum()),
+                    f"{key}_size_std": float(sizes.std()),
+                }
+            )
+
+    all_cl = np.unique(labels[labels >= 0])
+    if len(all_cl):
+        n_types_per_cl = [len(np.unique(types[labels == c])) for c in all_cl]
+        out["mixed_cluster_frac"] = sum(n > 1 for n in n_types_per_cl) / len(all_cl)
+        out["avg_types_per_cluster"] = float(np.mean(n_types_per_cl))
+    else:
+        out["mixed_cluster_frac"] = 0.0
+        out["avg_types_per_cluster"] = 0.0
+    return out
+
+
+def growth_movie(coords: np.ndarray, n_frames: int, seed: int = 0) -> list[Frame]:
+    """Frames that add the particles of *coords* in *n_frames* growth steps."""
+    rng = np.random.default_rng(seed)
+    n = len(coords)
+    sites = rng.permutation(n)
+    frames = []
+    for k in range(1, n_frames + 1):
+        m = n * k // n_frames
+        raw = np.column_stack([np.ones(m), np.arange(m), np.zeros(m), coords[:m], sites[:m]])
+        frames.append(Frame(raw=raw, comment=f"Frame {k - 1} // {n_frames}"))
+    return frames
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=200_000)
+    parser.add_argument("--eps", type=float, default=1.5)
+    parser.add_argument("--min-samples", type=int, default=5)
+    parser.add_argument("--clusters", type=int, default=20_000)
+    parser.add_argument("--stats-points", type=int, default=100_000)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    coords = lattice_frame(args.points)
+    dbscan = DBSCAN(eps=args.eps, min_samples=args.min_samples)
+    reference, t_ref = timed(dbscan.fit_predict, coords)
+    labels, t_graph = timed(_neighbour_graph_dbscan, coords, args.eps, args.min_samples)
+    np.testing.assert_array_equal(labels, reference)
+
+    print(
+        f"{args.points} lattice particles, eps={args.eps}, min_samples={args.min_samples}: "
+        f"{labels.max() + 1} clusters"
+    )
+    print(f"  DBSCAN {t_ref:8.3f}s -> {t_graph:8.3f}s")
+
+    # Many small clusters: the per-cluster loops scale with clusters x particles
+    rng = np.random.default_rng(1)
+    labels = rng.integers(-1, args.clusters, size=args.stats_points)
+    types = rng.integers(1, 4, size=args.stats_points)
+    unique_types = np.unique(types)
+    reference, t_ref = timed(type_stats_loops, labels, types, unique_types)
+    stats, t_stats = timed(_type_stats, labels, types, unique_types)
+    assert stats == reference, {k: (stats[k], reference[k]) for k in stats}
+
+    print(f"{args.stats_points} particles in {args.clusters} clusters, {len(unique_types)} types")
+    print(f"  stats  {t_ref:8.3f}s -> {t_stats:8.4f}s")
+
+    frames = growth_movie(coords, args.frames)
+
+    def per_frame():
+        return [
+            _neighbour_graph_dbscan(f.coords, args.eps, args.min_samples) for f in frames
+        ]
+
+    def tracked():
+        return [labels for _, labels, _ in track_frames(frames, args.eps, args.min_samples)]
+
+    reference, t_ref = timed(per_frame)
+    series, t_series = timed(tracked)
+    for expected, labels in zip(reference, series):
+        np.testing.assert_array_equal(labels == -1, expected == -1)
+
+    print(f"{args.frames} growth frames up to {args.points} particles")
+    print(f"  series {t_ref:8.3f}s -> {t_series:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark the bulk count-file parser against the per-token dict parser.
+
+Usage::
+
+    python -m cgaspects.tests.benchmarks.bench_count_parser [--sites 500000] [--ids 12]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+from cgaspects.analysis.site_parser import parse_count_matrix
+from cgaspects.analysis.site_table import SiteTable
+
+
+def write_count_file(path: Path, n_sites: int, n_ids: int, seed: int = 0):
+    """Write a synthetic count file with a few interactions per site."""
+    rng = np.random.default_rng(seed)
+    with open(path, "w") as fh:
+        fh.write("header line that is not a site\n")
+        for site in range(2, n_sites + 2):
+            ids = rng.choice(n_ids, size=rng.integers(0, 6), replace=False) + 1
+            pairs = " ".join(f"{rng.integers(1, 5)}({i})" for i in ids)
+            state = "grown" if site % 3 else "empty"
+            fh.write(f"{state} tile 1 {site} {pairs} coord {len(ids)}\n")
+
+
+def parse_count_dicts(f: Path) -> dict:
+    """Reference implementation: tokenise every line into a dict per site."""
+    count_info = dict()
+    with open(f, encoding="utf-8") as fh:
+        for line in fh:
+            if not line.startswith(("empty", "grown")):
+                continue
+            tokens = line.split("coord")[0].split()
+            site = int(tokens[3])
+            interactions = dict()
+            for tok in tokens:
+                if "(" in tok and ")" in tok:
+                    freq, rest = tok.split("(")
+                    interactions[int(rest.rstrip(")"))] = int(freq)
+            count_info[site] = interactions
+    return count_info
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def retained_bytes(func, *args):
+    """Bytes still allocated by func's result after it returns."""
+    tracemalloc.start()
+    result = func(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=500_000)
+    parser.add_argument("--ids", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "run1_count.txt"
+        write_count_file(path, args.sites, args.ids)
+
+        reference, t_ref = timed(parse_count_dicts, path)
+        interactions, t_new = timed(parse_count_matrix, path)
+        assert interactions.to_dict() == reference
+
+        _, ref_bytes = retained_bytes(parse_count_dicts, path)
+        _, new_bytes = retained_bytes(parse_count_matrix, path)
+
+    table = SiteTable.from_parsed({"site_numbers": interactions.site_numbers[::-1].copy()})
+    _, t_ref_attach = timed(table.set_interactions, reference)
+    _, t_attach = timed(table.set_interactions, interactions)
+
+    print(f"{args.sites} sites, {interactions.matrix.nnz} interactions")
+    print(f"  parse   {t_ref:8.3f}s -> {t_new:8.3f}s")
+    print(f"  attach  {t_ref_attach:8.3f}s -> {t_attach:8.3f}s")
+    print(f"  memory  {ref_bytes / 1e6:8.1f}MB -> {new_bytes / 1e6:8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
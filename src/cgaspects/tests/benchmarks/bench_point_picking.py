@@ -0,0 +1,99 @@
+"""Benchmark point picking and sphere selection against the full-scan originals.
+
+Compares :class:`~cgaspects.gui.visualisation.point_index.PointIndex` ray
+picks and radius queries with computing the distance to every point, as
+the visualiser did on each click and mouse move.
+
+Usage::
+
+    python -m cgaspects.tests.benchmarks.bench_point_picking [--points 1000000] [--queries 50]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from cgaspects.gui.visualisation.point_index import PointIndex
+
+
+def lattice_cloud(n_points: int, fill: float = 0.35, seed: int = 0) -> np.ndarray:
+    """Coordinates of *n_points* randomly occupied sites of a cubic lattice."""
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil((n_points / fill) ** (1 / 3)))
+    sites = rng.choice(side**3, size=n_points, replace=False)
+    coords = np.column_stack(np.unravel_index(sites, (side, side, side))).astype(float)
+    return coords - side / 2
+
+
+def pick_scan(points, origin, direction, radius, deleted):
+    """Reference implementation: distance from every point to the ray."""
+    to_points = points - origin
+    projections = np.dot(to_points, direction)
+    valid_mask = projections > 0
+    for idx in deleted:
+        valid_mask[idx] = False
+    closest_on_ray = origin + np.outer(projections, direction)
+    distances = np.linalg.norm(points - closest_on_ray, axis=1)
+    distances[~valid_mask] = np.inf
+    min_idx = np.argmin(distances)
+    if distances[min_idx] < radius:
+        return int(min_idx), float(distances[min_idx])
+    return None, None
+
+
+def ball_scan(points, center, radius, deleted):
+    """Reference implementation: distance from every point to the centre."""
+    distances = np.linalg.norm(points - center, axis=1)
+    return set(np.where(distances <= radius)[0].tolist()) - deleted
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--pick-radius", type=float, default=0.6)
+    parser.add_argument("--sphere-radius", type=float, default=5.0)
+    args = parser.parse_args()
+
+    points = lattice_cloud(args.points)
+    rng = np.random.default_rng(1)
+    deleted = set(rng.choice(args.points, args.points // 100, replace=False).tolist())
+    mask = np.ones(args.points, dtype=bool)
+    mask[list(deleted)] = False
+
+    index, t_build = timed(PointIndex, points)
+    print(f"{args.points} lattice points: index built in {t_build:.3f}s")
+
+    extent = np.abs(points).max()
+    origins = rng.normal(size=(args.queries, 3))
+    origins *= 3 * extent / np.linalg.norm(origins, axis=1, keepdims=True)
+    targets = rng.uniform(-extent / 2, extent / 2, (args.queries, 3))
+    t_ref = t_new = 0.0
+    for origin, target in zip(origins, targets):
+        direction = (target - origin) / np.linalg.norm(target - origin)
+        reference, t = timed(pick_scan, points, origin, direction, args.pick_radius, deleted)
+        t_ref += t
+        result, t = timed(index.pick, origin, direction, args.pick_radius, mask)
+        t_new += t
+        assert result[0] == reference[0], (result, reference)
+    print(f"  pick   {1e3 * t_ref / args.queries:8.3f}ms -> {1e3 * t_new / args.queries:8.3f}ms")
+
+    t_ref = t_new = 0.0
+    for center in targets:
+        reference, t = timed(ball_scan, points, center, args.sphere_radius, deleted)
+        t_ref += t
+        result, t = timed(index.ball, center, args.sphere_radius, mask)
+        t_new += t
+        assert set(result.tolist()) == reference
+    print(f"  sphere {1e3 * t_ref / args.queries:8.3f}ms -> {1e3 * t_new / args.queries:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
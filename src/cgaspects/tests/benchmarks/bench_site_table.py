@@ -0,0 +1,177 @@
+"""Benchmark the columnar SiteTable merge/summary/filter against per-site dict loops.
+
+Usage::
+
+    python -m cgaspects.tests.benchmarks.bench_site_table [--sites 100000] [--times 20]
+"""
+
+import argparse
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from cgaspects.analysis.site_parser import (
+    extract_file_prefix,
+    get_site_summary,
+    merge_site_results,
+    parse_site_csv,
+)
+
+
+def write_site_csv(path: Path, n_sites: int, n_times: int, kind: str, seed: int = 0):
+    """Write a synthetic crystallisation events or populations CSV."""
+    rng = np.random.default_rng(seed)
+    sites = np.arange(2, n_sites + 2)
+
+    def row(label, values, lead=("", "", "")):
+        return ",".join([*lead, label, *map(str, values)]) + "\n"
+
+    series = rng.integers(0, 5, size=(n_times, n_sites))
+    total_label = "TOTAL EVENTS" if kind == "events" else "TOTAL POPULATION"
+    with open(path, "w") as fh:
+        fh.write(row("sitenumbers", sites))
+        fh.write(row("tile type", rng.integers(1, 4, n_sites)))
+        fh.write(row("energies", np.round(rng.normal(-2, 0.5, n_sites), 4)))
+        fh.write(row("grown(1) ungrown(0)", rng.integers(0, 2, n_sites)))
+        fh.write(row("coordination", rng.integers(0, 7, n_sites)))
+        fh.write(row("", [""] * n_sites, lead=("supersaturation", "time", "iterations")))
+        fh.write(row(total_label, series.sum(axis=0)))
+        for t in range(n_times):
+            lead = (f"{0.5 + t * 0.01:.3f}", f"{t * 0.1:.2f}", str(100 * t))
+            fh.write(row("", series[t], lead=lead))
+
+
+def merge_site_results_dicts(results_with_paths):
+    """Reference implementation: one Python dict per site."""
+    prefix_groups = defaultdict(list)
+    for result, file_path in results_with_paths:
+        prefix_groups[extract_file_prefix(file_path)].append((result, file_path))
+
+    merged_results = {}
+    for prefix, group in prefix_groups.items():
+        first_result, _ = group[0]
+        merged = {
+            "supersaturation": first_result["supersaturation"],
+            "time": first_result["time"],
+            "iterations": first_result["iterations"],
+            "file_prefix": prefix,
+            "source_files": [fp.name for _, fp in group],
+            "sites": {},
+        }
+        all_site_numbers = set()
+        for result, _ in group:
+            all_site_numbers.update(result["sites"].keys())
+
+        for site_num in all_site_numbers:
+            merged_site = dict.fromkeys(
+                [
+                    "tile_type",
+                    "energy",
+                    "occupation",
+                    "coordination",
+                    "total_events",
+                    "total_population",
+                    "events",
+                    "population",
+                    "interactions",
+                ]
+            )
+            first_metadata = None
+            for result, _ in group:
+                if site_num not in result["sites"]:
+                    continue
+                site_data = result["sites"][site_num]
+                if first_metadata is None:
+                    first_metadata = {
+                        key: site_data[key]
+                        for key in ("tile_type", "energy", "occupation", "coordination")
+                    }
+                    merged_site.update(first_metadata)
+                if result["file_type"] == "events":
+                    if site_data["total_events"] is not None:
+                        merged_site["total_events"] = site_data["total_events"]
+                    if site_data["events"] is not None:
+                        merged_site["events"] = site_data["events"]
+                elif result["file_type"] == "population":
+                    if site_data["total_population"] is not None:
+                        merged_site["total_population"] = site_data["total_population"]
+                    if site_data["population"] is not None:
+                        merged_site["population"] = site_data["population"]
+            merged["sites"][site_num] = merged_site
+        merged_results[prefix] = merged
+    return merged_results
+
+
+def site_summary_dicts(parsed_data):
+    """Reference implementation: summary statistics from the site dicts."""
+    sites = parsed_data["sites"].values()
+    energies = [s["energy"] for s in sites if s.get("energy") is not None]
+    coordinations = [s["coordination"] for s in sites if s.get("coordination") is not None]
+    occupied = sum(1 for s in sites if s.get("occupation"))
+    with_events = sum(1 for s in sites if s.get("events") is not None)
+    with_population = sum(1 for s in sites if s.get("population") is not None)
+    return {
+        "total_sites": len(parsed_data["sites"]),
+        "occupied_sites": occupied,
+        "unoccupied_sites": len(parsed_data["sites"]) - occupied,
+        "tile_types": sorted({s["tile_type"] for s in sites if s.get("tile_type") is not None}),
+        "energy_range": [min(energies), max(energies)] if energies else [None, None],
+        "coordination_range": [min(coordinations), max(coordinations)]
+        if coordinations
+        else [None, None],
+        "sites_with_events": with_events,
+        "sites_with_population": with_population,
+    }
+
+
+def filter_dicts(sites, column, value):
+    """Reference implementation: per-site '>=' data filter."""
+    return [n for n, s in sites.items() if s[column] is not None and s[column] >= value]
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=100_000)
+    parser.add_argument("--times", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [
+            Path(tmp) / "run1_crystallisation_events.csv",
+            Path(tmp) / "run1_populations.csv",
+        ]
+        write_site_csv(paths[0], args.sites, args.times, "events", seed=0)
+        write_site_csv(paths[1], args.sites, args.times, "population", seed=0)
+        results_with_paths = [(parse_site_csv(path), path) for path in paths]
+
+    reference, t_ref_merge = timed(merge_site_results_dicts, results_with_paths)
+    merged, t_merge = timed(merge_site_results, results_with_paths)
+    reference, merged = reference["run1"], merged["run1"]
+
+    ref_summary, t_ref_summary = timed(site_summary_dicts, reference)
+    summary, t_summary = timed(get_site_summary, merged)
+    for key, value in ref_summary.items():
+        assert summary[key] == value, (key, summary[key], value)
+
+    table = merged["sites"].table
+    ref_sites, t_ref_filter = timed(filter_dicts, reference["sites"], "energy", -2.0)
+    mask, t_filter = timed(table.filter_mask, "energy", ">=", "-2.0")
+    assert sorted(ref_sites) == sorted(table.site_numbers[mask].tolist())
+
+    print(f"{args.sites} sites x {args.times} time points (events + population files)")
+    print(f"  merge   {t_ref_merge:8.3f}s -> {t_merge:8.4f}s")
+    print(f"  summary {t_ref_summary:8.3f}s -> {t_summary:8.4f}s")
+    print(f"  filter  {t_ref_filter:8.3f}s -> {t_filter:8.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark the vectorized summary/CDA joins against the original ``iterrows`` loops.
+
+Usage::
+
+    python -m cgaspects.tests.benchmarks.bench_summary_compare [--sims 500] [--frames 100]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cgaspects.fileio.find_data import combine_xyz_cda, summary_compare
+
+
+def make_frames(n_sims: int, n_frames: int, seed: int = 0):
+    """Multi-frame aspect ratio rows, a matching summary table and a CDA table."""
+    rng = np.random.default_rng(seed)
+    n_rows = n_sims * n_frames
+    aspect_df = pd.DataFrame(
+        {
+            "Simulation Number": np.repeat(np.arange(1, n_sims + 1), n_frames),
+            "Frame": np.tile(np.arange(n_frames), n_sims),
+            "S:M": rng.random(n_rows),
+            "M:L": rng.random(n_rows),
+            "Volume": rng.random(n_rows) * 1e4,
+        }
+    )
+    # Shuffle the simulations, keeping frames in order within each one
+    order = rng.permutation(n_sims)
+    aspect_df = pd.concat(
+        [aspect_df.iloc[i * n_frames : (i + 1) * n_frames] for i in order], ignore_index=True
+    )
+    summary_df = pd.DataFrame(
+        {
+            "Simulation Name": [f"growth_sim_{i}" for i in range(1, n_sims + 1)],
+            "starting_delmu": rng.random(n_sims),
+            "temperature": rng.random(n_sims) * 300,
+        }
+    )
+    cda_df = pd.DataFrame(
+        {
+            "Simulation Number": np.arange(1, n_sims + 1),
+            "AspectRatio_S/M": rng.random(n_sims),
+            "AspectRatio_M/L": rng.random(n_sims),
+        }
+    )
+    return aspect_df, summary_df, cda_df
+
+
+def summary_compare_iterrows(summary_csv, aspect_df):
+    """Reference implementation: row-by-row lookup and ``np.append``."""
+    summary_df = pd.read_csv(summary_csv)
+    summary_cols = summary_df.columns
+    aspect_cols = aspect_df.columns
+    search = str(summary_df.iloc[0, 0]).split("_")
+    start_num = int(search[-1])
+    search_string = "_".join(search[:-1]) if len(search) > 1 else None
+
+    int_cols = summary_cols[1:]
+    summary_df = summary_df.set_index(summary_cols[0])
+    summary_df.index = summary_df.index.astype(str)
+    compare_array = np.empty((0, len(aspect_cols) + len(int_cols)))
+    for _, row in aspect_df.iterrows():
+        sim_num = int(row["Simulation Number"]) - 1 + start_num
+        num_string = f"{search_string}_{sim_num}" if search_string is not None else str(sim_num)
+        collect_row = summary_df.filter(items=[num_string], axis=0).values
+        collect_row = np.concatenate([np.array([row.values]), collect_row], axis=1)
+        compare_array = np.append(compare_array, collect_row, axis=0)
+
+    compare_df = pd.DataFrame(compare_array, columns=aspect_cols.append(int_cols))
+    return compare_df.sort_values(by=["Simulation Number"], ignore_index=True, kind="stable")
+
+
+def combine_xyz_cda_iterrows(CDA_df, XYZ_df):
+    """Reference implementation: one ``iloc`` lookup per XYZ row."""
+    rows = []
+    for _, row in XYZ_df.iterrows():
+        cda_row = CDA_df.iloc[int(row["Simulation Number"]) - 1, 1:].values
+        rows.append(np.concatenate([row.values, cda_row]))
+    cols = XYZ_df.columns.tolist() + CDA_df.columns[1:].tolist()
+    compare_df = pd.DataFrame(np.asarray(rows), columns=cols)
+    return compare_df.sort_values(by=["Simulation Number"], ignore_index=True, kind="stable")
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sims", type=int, default=500)
+    parser.add_argument("--frames", type=int, nargs="+", default=[1, 10, 100])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_frames in args.frames:
+            aspect_df, summary_df, cda_df = make_frames(args.sims, n_frames)
+            summary_csv = Path(tmp) / "summary.csv"
+            summary_df.to_csv(summary_csv, index=False)
+
+            reference, t_ref = timed(summary_compare_iterrows, summary_csv, aspect_df)
+            joined, t_new = timed(summary_compare, summary_csv=summary_csv, aspect_df=aspect_df)
+            np.testing.assert_allclose(
+                reference.to_numpy(dtype=float), joined.to_numpy(dtype=float)
+            )
+
+            ref_cda, t_ref_cda = timed(combine_xyz_cda_iterrows, cda_df, aspect_df)
+            new_cda, t_new_cda = timed(combine_xyz_cda, CDA_df=cda_df, XYZ_df=aspect_df)
+            np.testing.assert_allclose(ref_cda.to_numpy(dtype=float), new_cda.to_numpy(dtype=float))
+
+            print(
+                f"{len(aspect_df):>7d} rows ({n_frames:>3d} frames/sim): "
+                f"summary_compare {t_ref:7.3f}s -> {t_new:6.3f}s  "
+                f"combine_xyz_cda {t_ref_cda:7.3f}s -> {t_new_cda:6.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
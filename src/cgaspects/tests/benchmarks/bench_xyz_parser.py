@@ -0,0 +1,90 @@
+"""Benchmark the bulk XYZ parser against the original per-frame ``np.loadtxt`` loop.
+
+Usage::
+
+    python -m cgaspects.tests.benchmarks.bench_xyz_parser [--points 1000000] [--frames 10]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cgaspects.fileio.xyz_file import CrystalCloud, Frame, Frames
+
+
+def write_synthetic_xyz(path: Path, n_points: int, n_frames: int, seed: int = 0) -> None:
+    """Write a CrystalGrower-style movie with *n_points* particle rows in total."""
+    rng = np.random.default_rng(seed)
+    per_frame = max(1, n_points // n_frames)
+    with path.open("w", encoding="utf-8") as fh:
+        for frame in range(n_frames):
+            fh.write(f"{per_frame}\nFrame {frame} // {n_frames}\n")
+            rows = np.column_stack(
+                [
+                    rng.integers(1, 3, per_frame),
+                    np.arange(per_frame),
+                    rng.integers(0, 50, per_frame),
+                    rng.normal(size=(per_frame, 3)) * 10,
+                    rng.integers(0, 1_000_000, per_frame),
+                    rng.normal(size=per_frame),
+                ]
+            )
+            np.savetxt(fh, rows, fmt=["%d", "%d", "%d", "%.4f", "%.4f", "%.4f", "%d", "%.4f"])
+
+
+def parse_per_frame_loadtxt(filepath: Path) -> Frames:
+    """Reference implementation: one ``np.loadtxt`` call per frame."""
+    frames = Frames()
+    with filepath.open("r", encoding="utf-8") as file:
+        while True:
+            header = file.readline()
+            if not header:
+                break
+            n_atoms = int(header.strip())
+            comment = file.readline().strip()
+            raw = np.loadtxt(file, max_rows=n_atoms, dtype=float, ndmin=2)
+            frames.append(Frame(raw=raw, comment=comment))
+    return frames
+
+
+def best_of(func, *args, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=1_000_000)
+    parser.add_argument("--frames", type=int, nargs="+", default=[1, 10, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_frames in args.frames:
+            path = Path(tmp) / f"synthetic_{n_frames}.XYZ"
+            write_synthetic_xyz(path, args.points, n_frames)
+
+            reference = parse_per_frame_loadtxt(path)
+            bulk = CrystalCloud.parse_xyz_file(path)
+            assert len(reference) == len(bulk)
+            for ref, new in zip(reference, bulk):
+                np.testing.assert_array_equal(ref.raw, new.raw)
+                assert ref.comment == new.comment
+
+            t_ref = best_of(parse_per_frame_loadtxt, path, repeat=args.repeat)
+            t_new = best_of(CrystalCloud.parse_xyz_file, path, repeat=args.repeat)
+            print(
+                f"{args.points:>9d} points / {n_frames:>4d} frames: "
+                f"loadtxt {t_ref:7.3f}s  bulk {t_new:7.3f}s  speed-up {t_ref / t_new:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@ import unittest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 import os
+import tempfile
+import numpy as np
 import pandas as pd
 from cgaspects.analysis import ar_dataframes
+from cgaspects.fileio.result_cache import ResultCache
 from cgaspects.analysis.ar_dataframes import (
     build_cda,
+    collect_all,
     populate_aspect_ratios_for_selected_columns,
     get_cda_shape_percentage,
     build_ratio_equations,
@@ -88,6 +92,60 @@ class TestBuildRatioEquations(unittest.TestCase):
     # Needs more tests for different scenarios and edge cases.
 
 
+class TestCollectAll(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.xyz_files = []
+        for sim in range(1, 5):
+            path = Path(self.temp_dir.name) / f"sim_{sim}.XYZ"
+            lines = []
+            for frame in range(2):
+                coords = rng.normal(size=(20, 3)) * [1.0, 2.0, 3.0 + sim]
+                lines.append(f"20\nFrame {frame} // 2")
+                lines.extend(f"1 {i} 1 {x:.4f} {y:.4f} {z:.4f}" for i, (x, y, z) in enumerate(coords))
+            path.write_text("\n".join(lines) + "\n")
+            self.xyz_files.append(path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_parallel_matches_serial(self):
+        serial = collect_all(xyz_files=self.xyz_files)
+        parallel = collect_all(xyz_files=self.xyz_files, n_workers=2, chunk_size=1)
+
+        self.assertEqual(len(serial), 8)
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_cached_results_match(self):
+        cache = ResultCache.for_input_folder(self.temp_dir.name, "aspect_ratios")
+        fresh = collect_all(xyz_files=self.xyz_files, cache=cache)
+        self.assertEqual(cache.misses, 4)
+
+        with patch.object(ar_dataframes, "analyse_xyz_file") as analyse:
+            cached = collect_all(xyz_files=self.xyz_files, cache=cache)
+            analyse.assert_not_called()
+        self.assertEqual(cache.hits, 4)
+        pd.testing.assert_frame_equal(fresh, cached)
+
+    def test_cached_copies_keep_their_sim_number(self):
+        copy = Path(self.temp_dir.name) / "sim_9.XYZ"
+        copy.write_bytes(self.xyz_files[0].read_bytes())
+        cache = ResultCache.for_input_folder(self.temp_dir.name, "aspect_ratios")
+
+        collect_all(xyz_files=[self.xyz_files[0]], cache=cache)
+        df = collect_all(xyz_files=[self.xyz_files[0], copy], cache=cache)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(sorted(df["Simulation Number"].unique()), ["1", "9"])
+
+    def test_cancelled_before_start(self):
+        signals = MagicMock()
+        signals.cancel_flag.is_set.return_value = True
+
+        self.assertIsNone(collect_all(xyz_files=self.xyz_files, signals=signals))
+        signals.cancelled.emit.assert_called_once()
+
+
 if __name__ == "__main__":
     import pytest
 
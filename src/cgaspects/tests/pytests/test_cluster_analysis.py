@@ -0,0 +1,278 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import DBSCAN
+
+from cgaspects.analysis import cluster_analysis
+from cgaspects.analysis.gui_threads import WorkerClusters
+from cgaspects.analysis.cluster_analysis import (
+    _global_stats,
+    _neighbour_graph_dbscan,
+    _type_stats,
+    cluster_cache,
+    run_cluster_analysis,
+)
+from cgaspects.analysis.cluster_tracking import ClusterTracker, track_frames
+from cgaspects.fileio.xyz_file import Frame
+from cgaspects.utils.data_structures import cluster_options_tuple
+
+
+def write_xyz(path: Path, rng, n_frames: int = 2, n_blobs: int = 3):
+    """Write a movie XYZ file of two particle types in a few separated blobs."""
+    centres = rng.uniform(-40, 40, size=(n_blobs, 3))
+    lines = []
+    for frame in range(n_frames):
+        coords = np.concatenate([c + rng.normal(size=(15, 3)) for c in centres])
+        types = rng.integers(1, 3, size=len(coords))
+        lines.append(f"{len(coords)}\nFrame {frame} // {n_frames}")
+        lines.extend(
+            f"{t} {i} 1 {x:.4f} {y:.4f} {z:.4f}"
+            for i, (t, (x, y, z)) in enumerate(zip(types, coords))
+        )
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestNeighbourGraphDBSCAN(unittest.TestCase):
+    def test_matches_sklearn(self):
+        rng = np.random.default_rng(1)
+        # Integer lattice coordinates put many neighbours exactly on eps
+        lattice = np.round(rng.uniform(0, 12, size=(1500, 3)))
+        scattered = rng.uniform(0, 25, size=(1500, 3))
+        for coords in (lattice, scattered):
+            for eps, min_samples in [(1.0, 1), (1.5, 4), (2.0, 9), (3.0, 30)]:
+                expected = DBSCAN(eps=eps, min_samples=min_samples).fit_predict(coords)
+                labels = _neighbour_graph_dbscan(coords, eps, min_samples)
+                np.testing.assert_array_equal(labels, expected)
+
+    def test_threaded_search_matches(self):
+        rng = np.random.default_rng(2)
+        coords = np.round(rng.uniform(0, 12, size=(1500, 3)))
+        for eps, min_samples in [(1.0, 1), (1.5, 4), (2.0, 9)]:
+            expected = _neighbour_graph_dbscan(coords, eps, min_samples)
+            labels = _neighbour_graph_dbscan(coords, eps, min_samples, n_jobs=2)
+            np.testing.assert_array_equal(labels, expected)
+
+    def test_no_core_points(self):
+        coords = np.array([[0.0, 0, 0], [10, 0, 0], [20, 0, 0]])
+        np.testing.assert_array_equal(_neighbour_graph_dbscan(coords, 1.0, 2), [-1, -1, -1])
+        self.assertEqual(len(_neighbour_graph_dbscan(np.empty((0, 3)), 1.0, 2)), 0)
+        np.testing.assert_array_equal(
+            _neighbour_graph_dbscan(coords, 1.0, 2, n_jobs=2), [-1, -1, -1]
+        )
+
+
+class TestClusterStats(unittest.TestCase):
+    def test_type_and_mixed_stats(self):
+        # Cluster 1 is empty; type 3 only appears as noise
+        labels = np.array([0, 0, 0, 2, 2, -1, 3, -1, -1])
+        types = np.array([1, 1, 2, 2, 2, 1, 1, 3, 2])
+        stats = _type_stats(labels, types, np.array([1, 2, 3]))
+
+        self.assertEqual(stats["type1_n_clusters"], 2)
+        self.assertEqual(stats["type1_avg_size"], 1.5)
+        self.assertEqual(stats["type1_max_size"], 2)
+        self.assertEqual(stats["type1_noise_frac"], 0.25)
+        self.assertEqual(stats["type1_size_std"], 0.5)
+        self.assertEqual(stats["type2_n_clusters"], 2)
+        self.assertEqual(stats["type2_noise_frac"], 0.25)
+        self.assertEqual(stats["type3_n_clusters"], 0)
+        self.assertEqual(stats["type3_noise_frac"], 1.0)
+        self.assertAlmostEqual(stats["mixed_cluster_frac"], 1 / 3)
+        self.assertAlmostEqual(stats["avg_types_per_cluster"], 4 / 3)
+
+        self.assertDictEqual(
+            _global_stats(labels),
+            dict(
+                n_clusters=3,
+                avg_size=2.0,
+                max_size=3,
+                noise_frac=1 / 3,
+                size_std=float(np.std([3, 2, 1])),
+            ),
+        )
+
+    def test_all_noise(self):
+        labels = np.full(4, -1)
+        stats = _type_stats(labels, np.array([1, 1, 2, 2]), np.array([1, 2]))
+        self.assertEqual(stats["type1_n_clusters"], 0)
+        self.assertEqual(stats["mixed_cluster_frac"], 0.0)
+        self.assertEqual(_global_stats(labels)["noise_frac"], 1.0)
+
+
+def growth_frame(coords, sites):
+    """A Frame with CrystalGrower columns: type, index, layer, x, y, z, site number."""
+    n = len(coords)
+    raw = np.column_stack([np.ones(n), np.arange(n), np.zeros(n), coords, sites])
+    return Frame(raw=raw, comment="")
+
+
+class TestClusterTracking(unittest.TestCase):
+    def test_ids_are_stable_and_merges_keep_oldest(self):
+        tracker = ClusterTracker(eps=1.0, min_samples=2)
+        tracker.add([[0, 0, 0], [1, 0, 0], [10, 0, 0], [11, 0, 0]], [1, 2, 3, 4])
+        np.testing.assert_array_equal(tracker.labels(), [0, 0, 1, 1])
+
+        # A new cluster, then a bridge joining the first two
+        update = tracker.add([[20, 0, 0], [21, 0, 0]], [5, 6])
+        self.assertDictEqual(update, dict(n_new_clusters=1, n_merged_clusters=0))
+        np.testing.assert_array_equal(tracker.labels(), [0, 0, 1, 1, 2, 2])
+
+        bridge = [[x, 0, 0] for x in range(2, 10)]
+        update = tracker.add(bridge, np.arange(10, 18))
+        self.assertDictEqual(update, dict(n_new_clusters=0, n_merged_clusters=1))
+        np.testing.assert_array_equal(tracker.labels(), [0] * 4 + [2, 2] + [0] * 8)
+
+    def test_matches_dbscan_on_every_frame(self):
+        rng = np.random.default_rng(3)
+        coords = np.round(rng.uniform(0, 10, size=(600, 3)))
+        sites = rng.permutation(5000)[:600]
+        frames = []
+        for n in (100, 250, 400, 600):
+            order = rng.permutation(n)
+            frames.append(growth_frame(coords[order], sites[order]))
+
+        for i, labels, update in track_frames(frames, eps=1.5, min_samples=4):
+            expected = DBSCAN(eps=1.5, min_samples=4).fit_predict(frames[i].coords)
+            self.assertFalse(update["restarted"])
+            np.testing.assert_array_equal(labels == -1, expected == -1)
+            # Same partition of the clustered particles, up to relabelling
+            clustered = expected >= 0
+            pairs = set(zip(labels[clustered].tolist(), expected[clustered].tolist()))
+            self.assertEqual(len(pairs), len(set(expected[clustered].tolist())))
+            self.assertEqual(len(pairs), len(set(labels[clustered].tolist())))
+
+    def test_restart_when_particles_disappear(self):
+        coords = np.array([[0.0, 0, 0], [1, 0, 0], [5, 0, 0], [6, 0, 0]])
+        frames = [growth_frame(coords, [1, 2, 3, 4]), growth_frame(coords[2:], [3, 4])]
+
+        results = list(track_frames(frames, eps=1.0, min_samples=2))
+        np.testing.assert_array_equal(results[0][1], [0, 0, 1, 1])
+        self.assertTrue(results[1][2]["restarted"])
+        # IDs issued before the restart are not reused
+        np.testing.assert_array_equal(results[1][1], [2, 2])
+
+    def test_repeated_site_numbers_fall_back_with_one_warning(self):
+        coords = np.array([[0.0, 0, 0], [1, 0, 0], [5, 0, 0], [6, 0, 0]])
+        frames = [
+            growth_frame(coords[:2], [1, 2]),
+            growth_frame(coords, [1, 2, 2, 3]),
+            growth_frame(coords, [1, 1, 2, 3]),
+        ]
+
+        with self.assertLogs("CA:ClusterTracking", level="WARNING") as logs:
+            results = list(track_frames(frames, eps=1.0, min_samples=2, name="sim_1.XYZ"))
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("sim_1.XYZ", logs.output[0])
+        self.assertListEqual([update["tracked"] for _, _, update in results], [True, False, False])
+
+
+class TestRunClusterAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        rng = np.random.default_rng(0)
+        self.xyz_files = []
+        for sim in range(1, 4):
+            path = self.folder / f"sim_{sim}.XYZ"
+            write_xyz(path, rng)
+            self.xyz_files.append(path)
+        self.options = cluster_options_tuple(
+            algorithm="DBSCAN",
+            eps=3.0,
+            min_samples=3,
+            frame_index=-1,
+            scale=False,
+            downsample=1.0,
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_analysis(self, n_workers, signals=None, cache=None):
+        output = self.folder / f"out_{n_workers}"
+        output.mkdir(exist_ok=True)
+        return run_cluster_analysis(
+            self.xyz_files,
+            None,
+            self.options._replace(n_workers=n_workers),
+            output,
+            signals=signals,
+            cache=cache,
+        )
+
+    def test_parallel_matches_serial(self):
+        serial_csv, serial_labels = self.run_analysis(1)
+        parallel_csv, parallel_labels = self.run_analysis(2)
+
+        serial = pd.read_csv(serial_csv)
+        self.assertListEqual(serial["Simulation Number"].tolist(), [1, 2, 3])
+        self.assertTrue((serial["global_n_clusters"] == 3).all())
+        pd.testing.assert_frame_equal(serial, pd.read_csv(parallel_csv))
+
+        self.assertListEqual(list(parallel_labels), [str(p) for p in self.xyz_files])
+        for key, labels in serial_labels.items():
+            np.testing.assert_array_equal(parallel_labels[key], labels)
+
+    def test_frame_series(self):
+        csv_path, labels = run_cluster_analysis(
+            self.xyz_files,
+            None,
+            self.options._replace(frame_series=True, n_workers=2),
+            self.folder,
+        )
+
+        self.assertEqual(csv_path.name, "cluster_time_series.csv")
+        series = pd.read_csv(csv_path)
+        self.assertListEqual(series["Simulation Number"].tolist(), [1, 1, 2, 2, 3, 3])
+        self.assertListEqual(series["Frame"].tolist(), [0, 1] * 3)
+        # The test movies have no site-number column to track particles by
+        self.assertFalse(series["tracked"].any())
+        self.assertTrue((series["global_n_clusters"] == 3).all())
+        self.assertEqual(len(labels[str(self.xyz_files[0])]), 45)
+
+    def test_cached_results_match(self):
+        fresh_csv, fresh_labels = self.run_analysis(1)
+        with cluster_cache(self.folder, self.options) as cache:
+            self.run_analysis(1, cache=cache)
+        with cluster_cache(self.folder, self.options._replace(n_workers=2)) as cache:
+            with patch.object(cluster_analysis, "analyse_xyz_clusters") as analyse:
+                cached_csv, cached_labels = self.run_analysis(2, cache=cache)
+                analyse.assert_not_called()
+        self.assertEqual(cache.hits, 3)
+
+        pd.testing.assert_frame_equal(pd.read_csv(fresh_csv), pd.read_csv(cached_csv))
+        for key, labels in fresh_labels.items():
+            np.testing.assert_array_equal(cached_labels[key], labels)
+
+    def test_cancelled_before_start(self):
+        signals = MagicMock()
+        signals.cancel_flag.is_set.return_value = True
+
+        self.assertEqual(self.run_analysis(1, signals), (None, {}))
+        self.assertEqual(self.run_analysis(2, signals), (None, {}))
+        self.assertEqual(signals.cancelled.emit.call_count, 2)
+
+    def test_worker_reuses_output_folder(self):
+        def run(options):
+            worker = WorkerClusters(None, options, self.folder, None, self.xyz_files)
+            locations = []
+            worker.signals.location.connect(locations.append)
+            worker.run()
+            return locations
+
+        options = self.options._replace(n_workers=1)
+        first = run(options)
+        self.assertEqual(len(first), 1)
+        self.assertTrue((first[0] / "cluster_analysis.csv").is_file())
+        self.assertListEqual(run(options), first)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,137 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from PySide6.QtWidgets import QApplication
+
+from cgaspects.gui.visualisation.crystal_loader import (
+    CrystalLoader,
+    crystal_nbytes,
+    summary_neighbours,
+)
+from cgaspects.gui.visualisation.openGL import VisualisationWidget
+
+
+class TestSummaryNeighbours(unittest.TestCase):
+    def test_one_step_in_each_variable(self):
+        # 3 x 2 grid of simulations plus one off-grid row
+        summary = pd.DataFrame(
+            {
+                "supersat": [0.1, 0.2, 0.3, 0.1, 0.2, 0.3, 0.2],
+                "energy": [1.0, 1.0, 1.0, 2.0, 2.0, 2.0, 3.0],
+                "seed": [0, 0, 0, 0, 0, 0, 1],
+            }
+        )
+
+        self.assertListEqual(summary_neighbours(summary, 1), [0, 2, 4])
+        self.assertListEqual(summary_neighbours(summary, 3), [4, 0])
+        self.assertListEqual(summary_neighbours(summary, 6), [])
+        self.assertListEqual(summary_neighbours(None, 0), [])
+
+
+class TestCrystalLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.created_app = QApplication.instance() is None
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.created_app:
+            cls.app.shutdown()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.paths = []
+        for sim in range(5):
+            path = Path(self.temp_dir.name) / f"sim_{sim}.XYZ"
+            coords = rng.normal(size=(50 + sim, 3))
+            lines = [f"{len(coords)}", "Frame 0 // 1"]
+            lines.extend(f"1 {i} 1 {x:.4f} {y:.4f} {z:.4f}" for i, (x, y, z) in enumerate(coords))
+            path.write_text("\n".join(lines) + "\n")
+            self.paths.append(path)
+        self.loaded = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def loader(self, **kwargs):
+        loader = CrystalLoader(**kwargs)
+        loader.set_paths(self.paths)
+        loader.loaded.connect(lambda index, crystal: self.loaded.append((index, crystal)))
+        return loader
+
+    def settle(self, loader):
+        loader.wait()
+        self.app.processEvents()
+
+    def test_request_loads_in_background_and_prefetches(self):
+        loader = self.loader()
+
+        self.assertIsNone(loader.request(2))
+        self.settle(loader)
+
+        self.assertEqual(len(self.loaded), 1)
+        index, crystal = self.loaded[0]
+        self.assertEqual(index, 2)
+        self.assertEqual(len(crystal.get_raw_frame_coords(0)), 52)
+        # Neighbours are ready without another load
+        self.assertIs(loader.request(2), crystal)
+        next_crystal = loader.request(3)
+        self.assertIsNotNone(next_crystal)
+        self.assertEqual(len(next_crystal.get_raw_frame_coords(0)), 53)
+        self.assertEqual(len(self.loaded), 1)
+
+    def test_summary_neighbours_are_prefetched(self):
+        loader = self.loader(max_prefetch=3)
+        loader.set_summary(pd.DataFrame({"supersat": [0.1, 0.2, 0.3, 0.1, 0.2], "seed": [0, 0, 0, 1, 1]}))
+
+        self.assertListEqual(loader.neighbours(0), [1, 3])
+        loader.request(0)
+        self.settle(loader)
+        self.assertTrue(all(loader.get(i) is not None for i in (0, 1, 3)))
+        self.assertIsNone(loader.get(2))
+
+    def test_cache_stays_within_budget(self):
+        loader = self.loader(max_bytes=1)
+        crystal = loader.load(0)
+        self.assertGreater(crystal_nbytes(crystal), 1)
+
+        loader.request(4)
+        self.settle(loader)
+        # Only the simulation on screen is kept past the budget
+        self.assertListEqual(list(loader._cache), [4])
+        self.assertEqual(loader.cache_bytes, crystal_nbytes(loader.get(4)))
+
+    def test_new_paths_drop_stale_loads(self):
+        loader = self.loader()
+        loader.request(0)
+        loader.set_paths(self.paths[::-1])
+        self.settle(loader)
+
+        self.assertListEqual(self.loaded, [])
+        self.assertIsNone(loader.get(0))
+
+    def test_widget_edits_leave_cached_crystal_unchanged(self):
+        loader = self.loader()
+        crystal = loader.load(0)
+        before = crystal.get_raw_frame_coords(0).copy()
+        widget = VisualisationWidget()
+        widget._show_crystal(crystal)
+
+        widget.rotatePointCloud(90, "z")
+
+        self.assertFalse(np.allclose(widget.xyz, before))
+        self.assertIs(loader.load(0), crystal)
+        np.testing.assert_array_equal(loader.get(0).get_raw_frame_coords(0), before)
+        widget.deleteLater()
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
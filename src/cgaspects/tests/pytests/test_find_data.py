@@ -0,0 +1,77 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cgaspects.fileio.find_data import combine_xyz_cda, summary_compare
+
+
+class TestSummaryJoins(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.summary_csv = Path(self.temp_dir.name) / "summary.csv"
+        pd.DataFrame(
+            {
+                "Simulation Name": ["growth_1", "growth_2", "growth_3"],
+                "starting_delmu": [0.5, 1.0, 1.5],
+                "temperature": [290.0, 300.0, 310.0],
+            }
+        ).to_csv(self.summary_csv, index=False)
+        # Multi-frame aspect rows, simulations out of order
+        self.aspect_df = pd.DataFrame(
+            {
+                "Simulation Number": [3, 3, 1, 1, 2],
+                "Frame": [0, 1, 0, 1, 0],
+                "S:M": [0.1, 0.2, 0.3, 0.4, 0.5],
+                "Shape": ["Lath", "Block", "Plate", "Needle", "Block"],
+            }
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_summary_compare_multi_frame(self):
+        result = summary_compare(summary_csv=self.summary_csv, aspect_df=self.aspect_df)
+
+        self.assertListEqual(
+            list(result.columns),
+            ["Simulation Number", "Frame", "S:M", "Shape", "starting_delmu", "temperature"],
+        )
+        self.assertListEqual(list(result["Simulation Number"]), [1, 1, 2, 3, 3])
+        self.assertListEqual(list(result["Frame"]), [0, 1, 0, 0, 1])
+        self.assertListEqual(list(result["Shape"]), ["Plate", "Needle", "Block", "Lath", "Block"])
+        np.testing.assert_array_equal(result["starting_delmu"], [0.5, 0.5, 1.0, 1.5, 1.5])
+
+    def test_summary_compare_missing_simulation(self):
+        aspect_df = self.aspect_df.copy()
+        aspect_df.loc[4, "Simulation Number"] = 7
+
+        with self.assertRaisesRegex(ValueError, "growth_7"):
+            summary_compare(summary_csv=self.summary_csv, aspect_df=aspect_df)
+
+    def test_combine_xyz_cda(self):
+        cda_df = pd.DataFrame(
+            {
+                "Simulation Number": [1, 2, 3],
+                "AspectRatio_S/M": [10.0, 20.0, 30.0],
+            }
+        )
+
+        result = combine_xyz_cda(CDA_df=cda_df, XYZ_df=self.aspect_df)
+
+        self.assertListEqual(
+            list(result.columns), ["Simulation Number", "Frame", "S:M", "Shape", "AspectRatio_S/M"]
+        )
+        self.assertListEqual(list(result["Simulation Number"]), [1, 1, 2, 3, 3])
+        np.testing.assert_array_equal(result["AspectRatio_S/M"], [10.0, 10.0, 20.0, 30.0, 30.0])
+
+        with self.assertRaises(IndexError):
+            combine_xyz_cda(CDA_df=cda_df.iloc[:2], XYZ_df=self.aspect_df)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -2,9 +2,12 @@ import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 import numpy as np
+import tempfile
 from pathlib import Path
-from cgaspects.analysis.gui_threads import WorkerSignals
-from cgaspects.analysis.gr_dataframes import build_growthrates
+from types import SimpleNamespace
+from cgaspects.analysis.gui_threads import WorkerGrowthRates, WorkerSignals
+from cgaspects.analysis.gr_dataframes import build_growthrates, fit_slopes
+from cgaspects.fileio.result_cache import ResultCache
 
 
 class TestBuildGrowthrates(unittest.TestCase):
@@ -61,6 +64,98 @@ class TestBuildGrowthrates(unittest.TestCase):
             build_growthrates(size_file_list, supersat_list, directions)
 
 
+class TestGrowthRateEngine(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        self.directions = [" 1 0 0", " 0 0 1"]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name, n_rows=12, with_time=True, zero_from=None):
+        rng = np.random.default_rng(len(name))
+        time = np.cumsum(rng.uniform(0.5, 1.5, n_rows))
+        df = pd.DataFrame(
+            {d: 1.0 + rng.uniform(0.5, 2.0) * time for d in self.directions}
+        )
+        if zero_from is not None:
+            df.iloc[zero_from:, 0] = 0.0
+        if with_time:
+            df.insert(0, "time", time)
+        path = self.folder / name
+        df.to_csv(path, index=False)
+        return path, df
+
+    def test_fit_slopes_matches_polyfit(self):
+        _, df = self._write("sim_1_size.csv", zero_from=8)
+        x = df["time"].to_numpy()
+        sizes = df[self.directions].to_numpy()
+
+        slopes = fit_slopes(x, sizes)
+
+        for j, direction in enumerate(self.directions):
+            expected = np.polyfit(x[:8], df[direction].to_numpy()[:8], 1)[0]
+            self.assertAlmostEqual(slopes[j], expected)
+        np.testing.assert_array_equal(fit_slopes(x[:1], sizes[:1]), [0.0, 0.0])
+
+    def test_auto_mode_falls_back_to_index_for_all_files(self):
+        paths = [
+            self._write("sim_1_size.csv")[0],
+            self._write("sim_2_size.csv", with_time=False)[0],
+        ]
+        auto = build_growthrates(paths, [1.0, 2.0], self.directions, xaxis_mode="auto")
+        index = build_growthrates(paths, [1.0, 2.0], self.directions, xaxis_mode="index")
+        forced = build_growthrates(paths, [1.0, 2.0], self.directions, xaxis_mode="time")
+
+        pd.testing.assert_frame_equal(auto, index)
+        self.assertListEqual(list(forced["Simulation Number"]), [1.0])
+        self.assertListEqual(list(forced["Supersaturation"]), [1.0])
+
+    def test_missing_direction_skips_file(self):
+        path, df = self._write("sim_3_size.csv")
+        other = self.folder / "sim_4_size.csv"
+        df.drop(columns=[" 0 0 1"]).to_csv(other, index=False)
+
+        result = build_growthrates([path, other], [1.0, 2.0], self.directions)
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result["Simulation Number"].iloc[0], 3)
+
+    def test_cached_series_serve_every_xaxis_mode(self):
+        paths = [
+            self._write("sim_1_size.csv")[0],
+            self._write("sim_2_size.csv", with_time=False)[0],
+        ]
+        cache = ResultCache.for_input_folder(self.folder, "growth_rates", {"d": self.directions})
+        for mode in ("auto", "time", "index"):
+            fresh = build_growthrates(paths, [1.0, 2.0], self.directions, xaxis_mode=mode)
+            cached = build_growthrates(
+                paths, [1.0, 2.0], self.directions, xaxis_mode=mode, cache=cache
+            )
+            pd.testing.assert_frame_equal(fresh, cached)
+        self.assertEqual((cache.misses, cache.hits), (2, 4))
+
+    def test_worker_reuses_output_folder(self):
+        paths = [self._write("sim_1_size.csv")[0], self._write("sim_2_size.csv")[0]]
+        information = SimpleNamespace(size_files=paths, supersats=[1.0, 2.0], summary_file=None)
+
+        def run():
+            cache = ResultCache.for_input_folder(self.folder, "growth_rates", {"d": self.directions})
+            worker = WorkerGrowthRates(
+                self.folder, information, self.directions, n_workers=1, cache=cache
+            )
+            locations = []
+            worker.signals.location.connect(locations.append)
+            worker.run()
+            return locations
+
+        first = run()
+        self.assertEqual(len(first), 1)
+        self.assertTrue(first[0].is_dir())
+        self.assertListEqual(run(), first)
+
+
 if __name__ == "__main__":
     import pytest
 
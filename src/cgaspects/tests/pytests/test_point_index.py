@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from cgaspects.gui.visualisation.point_index import PointIndex
+
+
+def brute_force_pick(points, origin, direction, radius, mask):
+    direction = direction / np.linalg.norm(direction)
+    to_points = points - origin
+    projections = to_points @ direction
+    distances = np.linalg.norm(to_points - np.outer(projections, direction), axis=1)
+    distances[(projections <= 0) | ~mask] = np.inf
+    best = int(np.argmin(distances))
+    if distances[best] < radius:
+        return best, distances[best]
+    return None, None
+
+
+class TestPointIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(-20, 20, (5000, 3))
+        self.mask = rng.random(len(self.points)) > 0.2
+        self.index = PointIndex(self.points)
+
+    def test_pick_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            origin = rng.uniform(-60, 60, 3)
+            # Aim near the cloud so most rays hit something
+            direction = rng.uniform(-10, 10, 3) - origin
+            radius = rng.uniform(0.1, 2.0)
+            expected = brute_force_pick(self.points, origin, direction, radius, self.mask)
+
+            idx, dist = self.index.pick(origin, direction, radius, mask=self.mask)
+
+            self.assertEqual(idx, expected[0])
+            if idx is not None:
+                self.assertAlmostEqual(dist, expected[1])
+
+    def test_pick_ignores_points_behind_the_origin(self):
+        index = PointIndex(np.array([[0.0, 0.0, -5.0], [0.0, 0.0, 5.0]]))
+
+        self.assertEqual(index.pick([0, 0, 0], [0, 0, 1], 0.5)[0], 1)
+        self.assertEqual(index.pick([0, 0, 6], [0, 0, 1], 0.5), (None, None))
+
+    def test_ball_matches_brute_force(self):
+        center = np.array([1.0, -2.0, 3.0])
+        distances = np.linalg.norm(self.points - center, axis=1)
+
+        np.testing.assert_array_equal(self.index.ball(center, 6.0), np.flatnonzero(distances <= 6.0))
+        np.testing.assert_array_equal(
+            self.index.ball(center, 6.0, mask=self.mask),
+            np.flatnonzero((distances <= 6.0) & self.mask),
+        )
+
+    def test_empty_cloud(self):
+        index = PointIndex(np.empty((0, 3)))
+
+        self.assertEqual(index.pick([0, 0, 0], [0, 0, 1], 1.0), (None, None))
+        self.assertEqual(len(index.ball([0, 0, 0], 1.0)), 0)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
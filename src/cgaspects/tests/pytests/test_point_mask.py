@@ -0,0 +1,60 @@
+import unittest
+
+import numpy as np
+
+from cgaspects.gui.visualisation.point_mask import PointMask
+
+
+class TestPointMask(unittest.TestCase):
+    def test_behaves_like_a_set(self):
+        points = PointMask(10, [7, 2, 2, 12, -1])
+
+        self.assertEqual(len(points), 2)
+        self.assertListEqual(list(points), [2, 7])
+        self.assertIn(7, points)
+        self.assertNotIn(12, points)
+
+        points.toggle(7)
+        points.add(3)
+        points.discard(2)
+        self.assertListEqual(list(points), [3])
+        self.assertFalse(PointMask(10))
+
+    def test_vectorised_updates(self):
+        points = PointMask(10)
+        points.update(np.arange(10) % 3 == 0)
+        points.difference_update(PointMask(10, [3]))
+        np.testing.assert_array_equal(points.indices(), [0, 6, 9])
+
+        excluded = PointMask(10, [5])
+        points.add_range(4, 8, exclude=excluded)
+        np.testing.assert_array_equal(points.indices(), [0, 4, 6, 7, 9])
+
+        points.assign([1])
+        np.testing.assert_array_equal(points.mask, np.arange(10) == 1)
+
+    def test_resize_keeps_hidden_members(self):
+        points = PointMask(10, [1, 8])
+        points.resize(5)
+        self.assertListEqual(list(points), [1])
+        np.testing.assert_array_equal(points.span(0, 10), np.isin(np.arange(10), [1]))
+
+        points.resize(12)
+        self.assertListEqual(list(points), [1, 8])
+
+    def test_snapshot_restore(self):
+        points = PointMask(20, [0, 9, 19])
+        snapshot = points.snapshot()
+        self.assertEqual(snapshot[1].nbytes, 3)
+
+        points.assign([4])
+        points.resize(30)
+        points.restore(snapshot)
+        self.assertListEqual(list(points), [0, 9, 19])
+        self.assertEqual(points.size, 30)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from cgaspects.fileio.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        self.input = self.folder / "sim_1.XYZ"
+        self.input.write_text("2\nFrame 0\n1 0 1 0 0 0\n1 1 1 1 0 0\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def cache(self, options=None):
+        return ResultCache.for_input_folder(self.folder, "test", options)
+
+    def test_roundtrip(self):
+        cache = self.cache({"eps": 3.0})
+        self.assertIsNone(cache.get(self.input))
+
+        rows = [["1", 0, np.float64(1.5), float("nan"), "Block", None]]
+        labels = np.array([0, -1, 2])
+        self.assertTrue(cache.put(self.input, rows, {"labels": labels}))
+
+        data, arrays = self.cache({"eps": 3.0}).get(self.input)
+        self.assertEqual(data[0][:3], ["1", 0, 1.5])
+        self.assertTrue(np.isnan(data[0][3]))
+        self.assertEqual(data[0][4:], ["Block", None])
+        np.testing.assert_array_equal(arrays["labels"], labels)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_key_follows_content_and_options(self):
+        cache = self.cache({"eps": 3.0})
+        cache.put(self.input, {"n": 1})
+
+        self.assertIsNone(self.cache({"eps": 2.0}).get(self.input))
+        # Same contents under another name and location still hit
+        copy = self.folder / "copy" / "sim_9.XYZ"
+        copy.parent.mkdir()
+        copy.write_bytes(self.input.read_bytes())
+        self.assertEqual(self.cache({"eps": 3.0}).get(copy)[0], {"n": 1})
+
+        self.input.write_text("1\nFrame 0\n1 0 1 0 0 0\n")
+        self.assertIsNone(self.cache({"eps": 3.0}).get(self.input))
+
+    def test_digests_are_reused_until_the_file_changes(self):
+        with self.cache() as cache:
+            digest = cache.digest(self.input)
+
+        with patch("cgaspects.fileio.result_cache._file_digest") as file_digest:
+            self.assertEqual(self.cache().digest(self.input), digest)
+            file_digest.assert_not_called()
+
+            stat = self.input.stat()
+            os.utime(self.input, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            file_digest.return_value = digest
+            self.assertEqual(self.cache().digest(self.input), digest)
+            file_digest.assert_called_once()
+
+    def test_output_folder_reused_for_unchanged_runs(self):
+        cache = self.cache()
+        with patch("cgaspects.fileio.result_cache.create_aspects_folder") as create:
+            create.side_effect = lambda folder: Path(
+                tempfile.mkdtemp(dir=self.folder, prefix="run")
+            )
+            first = cache.output_folder(self.folder, [self.input], extra=["a"])
+            self.assertEqual(cache.output_folder(self.folder, [self.input], extra=["a"]), first)
+            self.assertNotEqual(cache.output_folder(self.folder, [self.input], extra=["b"]), first)
+
+            self.input.write_text("changed\n")
+            self.assertNotEqual(self.cache().output_folder(self.folder, [self.input], ["a"]), first)
+        self.assertEqual(create.call_count, 3)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
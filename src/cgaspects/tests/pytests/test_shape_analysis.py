@@ -5,8 +5,22 @@ from pathlib import Path
 import tempfile
 import os
 
-from cgaspects.fileio.xyz_file import CrystalCloud, Frame, Frames
-from cgaspects.analysis.shape_analysis import ShapeAnalyser
+from cgaspects.fileio.xyz_file import (
+    CrystalCloud,
+    Frame,
+    Frames,
+    LazyFrames,
+    XYZFrameCache,
+    XYZFrameIndex,
+)
+from scipy.spatial import ConvexHull
+
+from cgaspects.analysis.shape_analysis import (
+    ShapeAnalyser,
+    hull_candidates,
+    pca_from_scatter,
+    scatter_matrix,
+)
 
 
 class TestCrystalCloud(unittest.TestCase):
@@ -95,6 +109,127 @@ class TestCrystalCloud(unittest.TestCase):
         np.testing.assert_array_equal(frame0_coords, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
         np.testing.assert_array_equal(frame1_coords, [[7.0, 8.0, 9.0], [10.0, 11.0, 12.0]])
 
+    def test_parse_xyz_mixed_columns_and_whitespace(self):
+        """Test frames with different column counts and tab/trailing whitespace."""
+        xyz_path = Path(self.temp_dir) / "test_mixed.XYZ"
+        xyz_content = (
+            "2\nFrame 0 // 2\n1.0\t0.0 0.0 1.0 2.0 3.0 \n  2.0 0.0 0.0 4.0 5.0 6.0\n"
+            "1\nFrame 1 // 2\n1.0 0.0 0.0 7.0 8.0 9.0 5.0 0.5\n\n"
+        )
+        xyz_path.write_text(xyz_content)
+
+        frames = CrystalCloud.parse_xyz_file(xyz_path)
+
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].raw.shape, (2, 6))
+        self.assertEqual(frames[1].raw.shape, (1, 8))
+        self.assertEqual(frames[1].comment, "Frame 1 // 2")
+        np.testing.assert_array_equal(frames[0].coords, [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    def test_parse_xyz_cleans_overflow_markers(self):
+        """Test that '*' overflow markers are replaced with zeros."""
+        xyz_path = Path(self.temp_dir) / "test_overflow.XYZ"
+        xyz_path.write_text("1\nFrame 0\n1.0 0.0 0.0 1.0 2.0 ***\n")
+
+        frames = CrystalCloud.parse_xyz_file(xyz_path)
+
+        np.testing.assert_array_equal(frames[0].raw, [[1.0, 0.0, 0.0, 1.0, 2.0, 0.0]])
+
+    def test_parse_xyz_invalid_header(self):
+        """Test that a malformed frame header raises ValueError."""
+        xyz_path = Path(self.temp_dir) / "test_bad_header.XYZ"
+        xyz_path.write_text("two\nFrame 0\n1.0 0.0 0.0 1.0 2.0 3.0\n")
+
+        with self.assertRaises(ValueError):
+            CrystalCloud.parse_xyz_file(xyz_path)
+
+    def test_lazy_frames_match_eager(self):
+        """Test lazily loaded frames are parsed on access and match eager parsing."""
+        xyz_path = Path(self.temp_dir) / "test_lazy.XYZ"
+        xyz_content = "".join(
+            f"{n}\nFrame {i} // 3\n"
+            + "".join(f"{j}.0 0.0 {i}.0 {j}.0 {j + 1}.0 {i}.5\n" for j in range(n))
+            for i, n in enumerate([2, 0, 3])
+        )
+        xyz_path.write_text(xyz_content)
+
+        eager = CrystalCloud.from_file(xyz_path, normalise=False)
+        lazy = CrystalCloud.from_file(xyz_path, normalise=False, lazy=True, use_cache=False)
+
+        self.assertIsInstance(lazy.frames, LazyFrames)
+        self.assertEqual(len(lazy), 3)
+        self.assertEqual(lazy.frames.comments, eager.frames.comments)
+        for i in range(3):
+            np.testing.assert_array_equal(
+                lazy.get_raw_frame_coords(i), eager.get_raw_frame_coords(i)
+            )
+        np.testing.assert_array_equal(lazy.coords, eager.coords)
+        with self.assertRaises(IndexError):
+            lazy.frames[3]
+
+    def test_lazy_frames_lru_is_bounded(self):
+        """Test that only max_cached decoded frames are kept."""
+        xyz_path = Path(self.temp_dir) / "test_lru.XYZ"
+        xyz_path.write_text(
+            "".join(f"1\nFrame {i}\n1.0 0.0 0.0 {i}.0 0.0 0.0\n" for i in range(10))
+        )
+
+        frames = LazyFrames(filepath=xyz_path, index=XYZFrameIndex.load(xyz_path), max_cached=3)
+        for i in range(10):
+            self.assertEqual(frames[i].coords[0, 0], float(i))
+
+        self.assertEqual(list(frames._cache), [7, 8, 9])
+
+    def test_frame_index_sidecar(self):
+        """Test the frame index sidecar is written, reused and invalidated."""
+        xyz_path = Path(self.temp_dir) / "test_sidecar.XYZ"
+        xyz_path.write_text("1\nFrame 0\n1.0 0.0 0.0 1.0 2.0 3.0\n")
+
+        index = XYZFrameIndex.load(xyz_path)
+        sidecar = XYZFrameIndex.sidecar_path(xyz_path)
+        self.assertTrue(sidecar.is_file())
+        self.assertEqual(list(index.counts), [1])
+
+        with patch.object(XYZFrameIndex, "scan", side_effect=AssertionError("rescanned")):
+            reused = XYZFrameIndex.load(xyz_path)
+        self.assertEqual(reused.comments, ["Frame 0"])
+
+        xyz_path.write_text(
+            "1\nFrame 0\n1.0 0.0 0.0 1.0 2.0 3.0\n2\nFrame 1\n1 0 0 1 1 1\n2 0 0 2 2 2\n"
+        )
+        os.utime(xyz_path, ns=(0, 10**9))
+        index = XYZFrameIndex.load(xyz_path)
+        self.assertEqual(list(index.counts), [1, 2])
+
+    def test_frame_cache_roundtrip(self):
+        """Test parsed frames are cached and memory-mapped on the next load."""
+        xyz_path = Path(self.temp_dir) / "test_cache.XYZ"
+        xyz_path.write_text(
+            "2\nFrame 0 // 2\n1.0 0.0 0.0 1.0 2.0 3.0\n2.0 0.0 0.0 4.0 5.0 6.0\n"
+            "0\nFrame 1 // 2\n"
+        )
+
+        eager = CrystalCloud.from_file(xyz_path, normalise=False)
+        data_path, meta_path = XYZFrameCache.paths(xyz_path)
+        self.assertTrue(data_path.is_file() and meta_path.is_file())
+
+        with patch.object(CrystalCloud, "parse_xyz_file", side_effect=AssertionError("parsed")):
+            cached = CrystalCloud.from_file(xyz_path, normalise=False)
+        self.assertEqual(cached.frames.comments, eager.frames.comments)
+        np.testing.assert_array_equal(cached.get_raw_frame_coords(0), eager.get_raw_frame_coords(0))
+        self.assertEqual(cached.get_raw_frame_coords(1).shape, (0, 0))
+
+        # Touching the file keeps the cache valid as the contents are unchanged
+        os.utime(xyz_path, ns=(0, 10**9))
+        self.assertIsNotNone(XYZFrameCache.load(xyz_path))
+
+        # Changing the contents invalidates it
+        xyz_path.write_text("1\nFrame 0\n9.0 0.0 0.0 1.0 2.0 3.0\n")
+        os.utime(xyz_path, ns=(0, 2 * 10**9))
+        self.assertIsNone(XYZFrameCache.load(xyz_path))
+        reloaded = CrystalCloud.from_file(xyz_path, normalise=False)
+        self.assertEqual(reloaded.get_raw_frame_coords(0)[0, 0], 9.0)
+
     def test_normalise_verts(self):
         """Test vertex normalization."""
         verts = np.array([[1, 2, 3], [-1, -2, -3], [4, 5, 6]])
@@ -288,6 +423,73 @@ class TestShapeAnalyser(unittest.TestCase):
         metrics = self.analyser.get_frame_metrics(999)
         self.assertIsNone(metrics)
 
+    def test_scatter_pca_matches_svd(self):
+        """Scatter-matrix PCA reproduces the SVD, chunked and centred."""
+        rng = np.random.default_rng(2)
+        xyz = rng.normal(size=(1000, 3)) * [4.0, 2.0, 0.5] + [1e4, -2e4, 5e3]
+
+        _, s_ref, vh_ref = np.linalg.svd(xyz, full_matrices=False)
+        s, vh = pca_from_scatter(scatter_matrix(xyz, chunk_size=64))
+        # squaring the condition number costs some digits off-origin
+        np.testing.assert_allclose(s, s_ref, rtol=1e-6)
+        np.testing.assert_allclose(np.abs(vh @ vh_ref.T), np.eye(3), atol=1e-6)
+
+        centred = xyz - xyz.mean(axis=0)
+        _, s_ref, vh_ref = np.linalg.svd(centred, full_matrices=False)
+        s, vh = pca_from_scatter(scatter_matrix(xyz, center=True, chunk_size=64))
+        np.testing.assert_allclose(s, s_ref, rtol=1e-9)
+        np.testing.assert_allclose(np.abs(vh @ vh_ref.T), np.eye(3), atol=1e-6)
+
+        metrics = ShapeAnalyser(center_pca=True).shape_info(xyz, get_sa_vol=False)
+        self.assertAlmostEqual(metrics.aspect1, s_ref[2] / s_ref[1])
+        self.assertAlmostEqual(metrics.aspect2, s_ref[1] / s_ref[0])
+
+    def test_hull_candidates_preserve_hull(self):
+        """Prefiltered points give the same hull as the full cloud."""
+        rng = np.random.default_rng(3)
+        grid = np.mgrid[-20:21, -15:16, -12:13].reshape(3, -1).T.astype(float)
+        lattice = grid[((grid / [20, 15, 12]) ** 2).sum(axis=1) <= 1] + [1e3, -50.0, 7.0]
+        clouds = [lattice, rng.normal(size=(20000, 3)), rng.uniform(size=(20000, 3))]
+
+        for xyz in clouds:
+            idx = hull_candidates(xyz)
+            self.assertLess(len(idx), len(xyz))
+            full, filtered = ConvexHull(xyz), ConvexHull(xyz[idx])
+            self.assertAlmostEqual(filtered.volume, full.volume, delta=1e-9 * full.volume)
+            self.assertAlmostEqual(filtered.area, full.area, delta=1e-9 * full.area)
+            self.assertEqual(set(idx[filtered.vertices]), set(full.vertices))
+
+    def _assert_metrics_close(self, batched, reference):
+        for name in reference._fields:
+            expected, actual = getattr(reference, name), getattr(batched, name)
+            if name == "shape":
+                self.assertEqual(actual, expected)
+            else:
+                self.assertAlmostEqual(actual, expected, places=8, msg=name)
+
+    def test_analyse_frames_matches_shape_info(self):
+        """Batched analysis of a growing movie matches per-frame shape_info."""
+        rng = np.random.default_rng(0)
+        points = rng.normal(size=(400, 3)) * [3.0, 1.5, 1.0]
+        frames = [points[:n] for n in (2, 50, 120, 120, 400)]
+
+        for method in ("svd", "bounding_box"):
+            analyser = ShapeAnalyser(zingg_method=method)
+            batched = analyser.analyse_frames(frames)
+            self.assertNotIn(0, batched)
+            for idx in range(1, len(frames)):
+                self._assert_metrics_close(batched[idx], analyser.shape_info(frames[idx]))
+
+    def test_analyse_frames_non_growing_movie(self):
+        """Frames that do not extend the previous one are hulled from scratch."""
+        rng = np.random.default_rng(1)
+        frames = [rng.normal(size=(n, 3)) for n in (80, 60, 90)]
+        frames.append(frames[-1][::-1].copy())
+
+        batched = self.analyser.analyse_frames(frames)
+        for idx, xyz in enumerate(frames):
+            self._assert_metrics_close(batched[idx], self.analyser.shape_info(xyz))
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests for CrystalCloud and ShapeAnalyser."""
@@ -2,15 +2,23 @@
 Tests for the site parser module.
 """
 
+import tempfile
 import unittest
 from pathlib import Path
 
+import numpy as np
+
 from cgaspects.analysis.site_parser import (
     extract_file_prefix,
     get_site_summary,
+    group_site_files,
+    merge_interactions,
     merge_site_results,
+    parse_count,
+    parse_count_matrix,
     parse_multiple_site_csvs,
     parse_site_csv,
+    parse_site_group,
 )
 
 
@@ -157,6 +165,169 @@ class TestParseSiteCSV(unittest.TestCase):
             )
 
 
+class TestParseSiteCSVLayout(unittest.TestCase):
+    """Tests for the array layout of parsed site files, using a generated CSV."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.temp_dir.name) / "run1_populations.csv"
+        self.csv_path.write_text(
+            ",,,sitenumbers,2,3,,5\n"
+            ",,,tile type,1,1,9,2\n"
+            ",,,energies,-1.5,,9,-2.25\n"
+            ",,,grown(1) ungrown(0),1,0,9,1\n"
+            ",,,coordination,4,3,9,6\n"
+            "supersaturation,time,iterations,,,,,\n"
+            ",,,TOTAL POPULATION,6,0,9,3\n"
+            "0.5,0.0,100,,1,,9,0\n"
+            "0.5,0.5,200,,2,,9,1\n"
+            "0.5,1.0,300,,3,,9,2\n"
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_metadata_and_series(self):
+        result = parse_site_csv(self.csv_path)
+
+        self.assertEqual(result["file_type"], "population")
+        self.assertEqual(list(result["sites"]), [2, 3, 5])
+        np.testing.assert_array_equal(result["site_numbers"], [2, 3, 5])
+        np.testing.assert_array_equal(result["iterations"], [100, 200, 300])
+
+        site = result["sites"][5]
+        self.assertEqual(site["tile_type"], 2)
+        self.assertEqual(site["energy"], -2.25)
+        self.assertIs(site["occupation"], True)
+        self.assertEqual(site["total_population"], 3)
+        self.assertIsNone(site["total_events"])
+        self.assertIsNone(result["sites"][3]["energy"])
+        self.assertIsNone(result["sites"][3]["population"])
+
+    def test_series_are_views_of_one_matrix(self):
+        result = parse_site_csv(self.csv_path)
+        matrix = result["site_series"]
+
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertEqual(matrix.dtype, np.int64)
+        self.assertTrue(matrix.flags["C_CONTIGUOUS"])
+        population = result["sites"][2]["population"]
+        np.testing.assert_array_equal(population, [1, 2, 3])
+        self.assertTrue(np.shares_memory(population, matrix))
+
+
+class TestSiteGroups(unittest.TestCase):
+    """Tests for grouping and parsing the files of one prefix together."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        folder = Path(self.temp_dir.name)
+        header = (
+            ",,,sitenumbers,2,3\n"
+            ",,,tile type,1,1\n"
+            ",,,energies,-1.5,-0.5\n"
+            ",,,grown(1) ungrown(0),1,0\n"
+            ",,,coordination,4,3\n"
+            "supersaturation,time,iterations,,,\n"
+        )
+        self.events_csv = folder / "run1_crystallisation_events.csv"
+        self.events_csv.write_text(header + ",,,TOTAL EVENTS,1,2\n0.5,0.0,100,,1,2\n")
+        self.population_csv = folder / "run1_populations.csv"
+        self.population_csv.write_text(header + ",,,TOTAL POPULATION,3,0\n0.5,0.0,100,,3,0\n")
+        self.missing_csv = folder / "run2_populations.csv"
+        self.count_file = folder / "run1_count.txt"
+        self.count_file.write_text("grown tile 1 2 3(1) 1(4) coord 4\n")
+        self.orphan_count = folder / "run3_count.txt"
+        self.orphan_count.write_text("")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_group_site_files(self):
+        groups = group_site_files(
+            [self.events_csv, self.missing_csv, self.population_csv],
+            [self.count_file, self.orphan_count],
+        )
+
+        self.assertListEqual(list(groups), ["run1", "run2"])
+        self.assertListEqual(groups["run1"][0], [self.events_csv, self.population_csv])
+        self.assertListEqual(groups["run1"][1], [self.count_file])
+        self.assertListEqual(groups["run2"][1], [])
+
+    def test_parse_site_group_matches_merge(self):
+        merged, errors = parse_site_group(
+            ("run1", [self.events_csv, self.population_csv], [self.count_file])
+        )
+        expected = merge_site_results(
+            [(parse_site_csv(p), p) for p in (self.events_csv, self.population_csv)]
+        )["run1"]
+
+        self.assertListEqual(errors, [])
+        self.assertListEqual(merged["source_files"], expected["source_files"])
+        self.assertEqual(merged["sites"][2]["total_events"], 1)
+        self.assertEqual(merged["sites"][2]["total_population"], 3)
+        self.assertDictEqual(merged["sites"][2]["interactions"], {1: 3, 4: 1})
+        self.assertDictEqual(merged["sites"][3]["interactions"], {})
+
+    def test_parse_site_group_reports_errors(self):
+        merged, errors = parse_site_group(("run2", [self.missing_csv], []))
+
+        self.assertIsNone(merged)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], self.missing_csv)
+
+
+class TestParseCount(unittest.TestCase):
+    """Tests for parsing interaction count files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, text):
+        path = self.folder / "run1_count.txt"
+        path.write_text(text)
+        return path
+
+    def test_parse_count_matrix(self):
+        path = self.write(
+            "Interaction counts\n"
+            "grown tile 1 5 3(1) 1(4) coord 4\n"
+            "empty tile 2 9 coord 0\n"
+            "grown tile 1 2 2(12) coord 2 5(1)\n"
+        )
+        interactions = parse_count_matrix(path)
+
+        np.testing.assert_array_equal(interactions.site_numbers, [5, 9, 2])
+        self.assertEqual(interactions.matrix.shape, (3, 13))
+        self.assertDictEqual(
+            interactions.to_dict(), {5: {1: 3, 4: 1}, 9: {}, 2: {12: 2}}
+        )
+        self.assertDictEqual(parse_count(path), interactions.to_dict())
+
+    def test_repeated_sites_and_stray_tokens(self):
+        path = self.write(
+            "grown tile 1 5 3(1) coord 1\n"
+            "grown tile 1 7 2(3) 4(3) x coord 2\n"
+            "grown tile 1 5 1(2) coord 1\n"
+        )
+
+        # The last line of a site and the last frequency of an ID win
+        self.assertDictEqual(parse_count(path), {7: {3: 4}, 5: {2: 1}})
+        self.assertDictEqual(parse_count(self.write("")), {})
+
+    def test_merge_interactions_into_site_dicts(self):
+        interactions = parse_count_matrix(self.write("grown tile 1 2 3(1) coord 1\n"))
+        sites = {"2": {"energy": -1.0}, "3": {"energy": 0.5}}
+        merge_interactions(sites, interactions)
+
+        self.assertDictEqual(sites["2"]["interactions"], {1: 3})
+        self.assertDictEqual(sites["3"]["interactions"], {})
+
+
 class TestParseMultipleSiteCSVs(unittest.TestCase):
     """Tests for parsing multiple site CSV files."""
 
@@ -0,0 +1,144 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from cgaspects.fileio.site_results import (
+    SiteResults,
+    SiteResultsWriter,
+    export_site_results_json,
+    load_site_results,
+    save_site_results,
+)
+
+
+def _site(tile_type, energy, occupation, events=None, population=None, interactions=None):
+    return {
+        "tile_type": tile_type,
+        "energy": energy,
+        "occupation": occupation,
+        "coordination": 4 if tile_type is not None else None,
+        "total_events": int(sum(events)) if events is not None else None,
+        "total_population": int(sum(population)) if population is not None else None,
+        "events": np.array(events) if events is not None else None,
+        "population": np.array(population) if population is not None else None,
+        "interactions": interactions,
+    }
+
+
+class TestSiteResults(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        self.merged = {
+            "run1": {
+                "supersaturation": np.array([0.1, 0.2, 0.3]),
+                "time": np.array([0.0, 1.5, 3.0]),
+                "iterations": np.array([0, 100, 200]),
+                "file_prefix": "run1",
+                "source_files": ["run1_crystallisation_events.csv", "run1_populations.csv"],
+                "sites": {
+                    7: _site(1, -2.5, True, [1, 0, 3], [5, 5, 4], {3: 2, 11: 1}),
+                    2: _site(2, 0.75, False, [0, 70000, 0], None, {}),
+                    9: _site(None, None, None),
+                },
+            },
+            "run2": {
+                "supersaturation": None,
+                "time": np.array([0.0]),
+                "iterations": np.array([0]),
+                "file_prefix": "run2",
+                "source_files": ["run2_populations.csv"],
+                "sites": {1: _site(1, 1.0, False, None, [2])},
+            },
+        }
+        self.path = save_site_results(self.merged, self.folder / "site_analysis_data.npz")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_roundtrip_matches_merged_results(self):
+        results = load_site_results(self.path)
+        self.addCleanup(results.close)
+
+        self.assertIsInstance(results, SiteResults)
+        self.assertListEqual(list(results), ["run1", "run2"])
+        for prefix, expected in self.merged.items():
+            dataset = results[prefix]
+            self.assertEqual(dataset["file_prefix"], prefix)
+            self.assertListEqual(dataset["source_files"], expected["source_files"])
+            for key in ("supersaturation", "time", "iterations"):
+                if expected[key] is None:
+                    self.assertIsNone(dataset[key])
+                else:
+                    np.testing.assert_array_equal(dataset[key], expected[key])
+
+            sites = dataset["sites"]
+            self.assertListEqual(list(sites), list(expected["sites"]))
+            for site_num, site in expected["sites"].items():
+                loaded = sites[str(site_num)]
+                for key, value in site.items():
+                    if isinstance(value, np.ndarray):
+                        np.testing.assert_array_equal(loaded[key], value)
+                    else:
+                        self.assertEqual(loaded[key], value, f"{prefix}/{site_num}/{key}")
+                        self.assertIs(type(loaded[key]), type(value))
+
+        self.assertIsNone(results["run2"]["sites"][1]["interactions"])
+        np.testing.assert_array_equal(results["run1"]["sites"].table.site_numbers, [7, 2, 9])
+        self.assertTrue(np.isnan(results["run1"]["sites"].table.columns["energy"][2]))
+
+    def test_prefixes_load_on_access(self):
+        results = SiteResults(self.path)
+        self.addCleanup(results.close)
+
+        self.assertIn("run2", results)
+        self.assertEqual(len(results._datasets), 0)
+        self.assertEqual(len(results["run2"]["sites"]), 1)
+        self.assertListEqual(list(results._datasets), ["run2"])
+        self.assertIs(results["run2"], results["run2"])
+
+    def test_writer_keeps_prefix_order(self):
+        path = self.folder / "streamed.npz"
+        writer = SiteResultsWriter(path, prefixes=["run1", "missing", "run2"])
+        # Prefixes arrive in completion order, not in the requested order
+        writer.add("run2", self.merged["run2"])
+        writer.add("run1", self.merged["run1"])
+        writer.close()
+
+        results = load_site_results(path)
+        self.addCleanup(results.close)
+        self.assertListEqual(list(results), ["run1", "run2"])
+        np.testing.assert_array_equal(results["run1"]["sites"].table.site_numbers, [7, 2, 9])
+        self.assertListEqual(list(results["run2"]["sites"]), [1])
+
+    def test_writer_discard_removes_file(self):
+        path = self.folder / "cancelled.npz"
+        with self.assertRaises(RuntimeError):
+            with SiteResultsWriter(path) as writer:
+                writer.add("run1", self.merged["run1"])
+                raise RuntimeError("cancelled")
+        self.assertFalse(path.exists())
+
+    def test_json_export(self):
+        results = load_site_results(self.path)
+        self.addCleanup(results.close)
+
+        json_path = export_site_results_json(results, self.folder / "site_analysis_data.json")
+        loaded = load_site_results(json_path)
+
+        self.assertListEqual(list(loaded), ["run1", "run2"])
+        site = loaded["run1"]["sites"]["7"]
+        self.assertListEqual(site["events"], [1, 0, 3])
+        self.assertDictEqual(site["interactions"], {"3": 2, "11": 1})
+        self.assertIsNone(loaded["run1"]["sites"]["9"]["energy"])
+        with open(json_path) as f:
+            self.assertEqual(json.load(f)["run2"]["time"], [0.0])
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,210 @@
+import unittest
+
+import numpy as np
+
+from cgaspects.analysis.site_table import SitePoints, SiteTable
+
+
+def _parsed(file_type, site_numbers, tile_type, energy, occupation, series, has_series=None):
+    """A parse_site_csv-style result built from arrays."""
+    series = np.asarray(series, dtype=np.int64)
+    return {
+        "supersaturation": np.array([0.5, 0.5]),
+        "time": np.array([0.0, 1.0]),
+        "iterations": np.array([100, 200]),
+        "file_type": file_type,
+        "site_numbers": np.asarray(site_numbers, dtype=np.int64),
+        "site_metadata": {
+            "tile_type": np.asarray(tile_type, dtype=float),
+            "energy": np.asarray(energy, dtype=float),
+            "occupation": np.asarray(occupation, dtype=float),
+            "coordination": np.full(len(site_numbers), 4.0),
+            "total": series.sum(axis=1).astype(float),
+        },
+        "site_series": series,
+        "site_has_series": np.ones(len(site_numbers), dtype=bool)
+        if has_series is None
+        else np.asarray(has_series),
+    }
+
+
+class TestSiteTable(unittest.TestCase):
+    def setUp(self):
+        events = _parsed(
+            "events",
+            [5, 2, 9],
+            [1, 1, 2],
+            [-1.5, np.nan, 0.25],
+            [1, 0, 0],
+            [[1, 2], [0, 0], [3, 1]],
+            has_series=[True, False, True],
+        )
+        population = _parsed(
+            "population",
+            [2, 7, 5],
+            [1, 3, 9],
+            [-0.5, -2.0, -1.5],
+            [0, 1, 1],
+            [[4, 4], [1, 0], [0, 2]],
+        )
+        self.table = SiteTable.merge(
+            [
+                SiteTable.from_parsed(events, "run1_crystallisation_events.csv"),
+                SiteTable.from_parsed(population, "run1_populations.csv"),
+            ],
+            file_prefix="run1",
+        )
+
+    def test_merge(self):
+        table = self.table
+
+        np.testing.assert_array_equal(table.site_numbers, [5, 2, 9, 7])
+        self.assertListEqual(
+            table.source_files, ["run1_crystallisation_events.csv", "run1_populations.csv"]
+        )
+        # Metadata from the first file a site appears in, even when missing there
+        np.testing.assert_array_equal(table.columns["tile_type"], [1, 1, 2, 3])
+        np.testing.assert_array_equal(table.columns["energy"], [-1.5, np.nan, 0.25, -2.0])
+        np.testing.assert_array_equal(table.columns["total_events"], [3, 0, 4, np.nan])
+        np.testing.assert_array_equal(table.columns["total_population"], [2, 8, np.nan, 1])
+
+        np.testing.assert_array_equal(table.has_series["events"], [True, False, True, False])
+        np.testing.assert_array_equal(table.has_series["population"], [True, True, False, True])
+        np.testing.assert_array_equal(table.series["population"][0], [0, 2])
+
+        site = table.sites[5]
+        self.assertListEqual(
+            list(site),
+            [
+                "tile_type",
+                "energy",
+                "occupation",
+                "coordination",
+                "total_events",
+                "total_population",
+                "events",
+                "population",
+                "interactions",
+            ],
+        )
+        self.assertIs(site["occupation"], True)
+        self.assertIsNone(table.sites[2]["events"])
+        self.assertIsNone(table.sites[7]["total_events"])
+
+    def test_summary(self):
+        summary = self.table.summary()
+
+        self.assertEqual(summary["total_sites"], 4)
+        self.assertEqual(summary["occupied_sites"], 2)
+        self.assertEqual(summary["unoccupied_sites"], 2)
+        self.assertEqual(summary["time_points"], 2)
+        self.assertListEqual(summary["tile_types"], [1, 2, 3])
+        self.assertListEqual(summary["energy_range"], [-2.0, 0.25])
+        self.assertListEqual(summary["coordination_range"], [4, 4])
+        self.assertEqual(summary["sites_with_events"], 2)
+        self.assertEqual(summary["sites_with_population"], 3)
+        self.assertEqual(summary["sites_with_both"], 1)
+
+    def test_filter_mask(self):
+        table = self.table
+
+        def passing(column, operator, value):
+            return table.site_numbers[table.filter_mask(column, operator, value)].tolist()
+
+        self.assertListEqual(passing("energy", ">=", "-1.5"), [5, 9])
+        # Missing values only pass "!="
+        self.assertListEqual(passing("energy", "!=", "-1.5"), [2, 9, 7])
+        self.assertListEqual(passing("occupation", "==", "1"), [5, 7])
+        self.assertListEqual(passing("site_number", "<", "7"), [5, 2])
+        self.assertListEqual(passing("energy", "contains", ".25"), [9])
+        self.assertListEqual(passing("energy", "not contains", ".25"), [5, 7])
+        self.assertListEqual(passing("energy", ">", "abc"), [])
+        self.assertListEqual(passing("file_prefix", "contains", "RUN"), [5, 2, 9, 7])
+        self.assertListEqual(passing("events", "==", "1"), [])
+
+    def test_interactions_and_arrays_roundtrip(self):
+        table = self.table
+        table.set_interactions({5: {3: 2, 11: 1}, 7: {}, 100: {1: 1}})
+
+        self.assertDictEqual(table.sites[5]["interactions"], {3: 2, 11: 1})
+        self.assertDictEqual(table.sites[2]["interactions"], {})
+
+        restored = SiteTable.from_arrays(table.to_arrays(), file_prefix="run1")
+        for site_num in table.sites:
+            for key, value in table.sites[site_num].items():
+                if isinstance(value, np.ndarray):
+                    np.testing.assert_array_equal(restored.sites[site_num][key], value)
+                    self.assertEqual(restored.sites[site_num][key].dtype, np.int64)
+                else:
+                    self.assertEqual(restored.sites[site_num][key], value)
+
+        from_dicts = SiteTable.from_result(
+            {"file_prefix": "run1", "sites": {n: dict(s) for n, s in table.sites.items()}}
+        )
+        expected = {**table.summary(), "time_points": 0, "iterations": 0}
+        self.assertDictEqual(from_dicts.summary(), {**expected, "supersaturation_points": 0})
+        self.assertDictEqual(from_dicts.sites[9]["interactions"], {})
+
+    def test_interaction_and_combined_filters(self):
+        table = self.table
+
+        def passing(mask):
+            return table.site_numbers[mask].tolist()
+
+        # Without count-file data only an empty filter passes
+        self.assertListEqual(passing(table.interaction_mask({"3": ["Any"]})), [])
+        self.assertListEqual(passing(table.interaction_mask({})), [5, 2, 9, 7])
+
+        table.set_interactions({5: {3: 2, 11: 1}, 9: {3: 1}, 7: {11: 4}})
+        self.assertListEqual(passing(table.interaction_mask({"3": ["Any"]})), [5, 9])
+        self.assertListEqual(passing(table.interaction_mask({3: ["1", "4"]})), [9])
+        self.assertListEqual(passing(table.interaction_mask({"3": ["Any"], "11": ["Any"]})), [5])
+        self.assertListEqual(passing(table.interaction_mask({"42": ["Any"]})), [])
+
+        self.assertDictEqual(table.interaction_max_frequencies(), {3: 2, 11: 4})
+
+        data_filters = [{"column": "energy", "operator": "<", "value": "0"}]
+        self.assertListEqual(passing(table.passes_filters(data_filters, {"11": ["Any"]})), [5, 7])
+
+    def test_site_points(self):
+        other = SiteTable.from_result(
+            {"file_prefix": "run2", "sites": {3: {"tile_type": 4, "energy": -0.1}}}
+        )
+        points = SitePoints(
+            [self.table, other], [0, 1, 0], [3, 0, 0], matches=[True, False, True]
+        )
+
+        self.assertEqual(len(points), 3)
+        self.assertDictEqual(
+            points[1],
+            {
+                "file_prefix": "run2",
+                "site_number": 3,
+                "tile_type": 4,
+                "energy": -0.1,
+                "occupation": None,
+                "coordination": None,
+                "total_events": None,
+                "total_population": None,
+                "interactions": None,
+            },
+        )
+        self.assertEqual(points[-1]["site_number"], 5)
+        with self.assertRaises(IndexError):
+            points[3]
+
+        self.assertListEqual(points.column("file_prefix").tolist(), ["run1", "run2", "run1"])
+        np.testing.assert_array_equal(points.column("site_number"), [7, 3, 5])
+        np.testing.assert_array_equal(points.column("energy"), [-2.0, -0.1, -1.5])
+        self.assertListEqual(points.column("unknown").tolist(), [None, None, None])
+
+        trimmed = points.delete(1)
+        self.assertListEqual([p["site_number"] for p in trimmed], [7, 5])
+        np.testing.assert_array_equal(trimmed.matches, [True, True])
+        self.assertEqual(len(SitePoints.empty().column("energy")), 0)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,144 @@
+import sys
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from cgaspects.gui.visualisation.openGL import VisualisationWidget
+from cgaspects.gui.visualisation.point_cloud_renderer import (
+    FLAG_NORMAL,
+    FLAG_SELECTED,
+    MAX_SLICE_PLANES,
+)
+
+
+def slice_plane(normal, origin, thickness, two_sided=False):
+    return SimpleNamespace(
+        normal=normal,
+        origin=origin,
+        fractional=False,
+        slice_enabled=True,
+        slice_two_sided=two_sided,
+        slice_thickness=thickness,
+        visible=True,
+    )
+
+
+class TestPointAttributes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.created_app = QApplication.instance() is None
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.created_app:
+            cls.app.shutdown()
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 200
+        self.xyz = np.column_stack(
+            [
+                rng.integers(1, 3, n),
+                np.arange(n),
+                rng.integers(1, 10, n),
+                rng.uniform(-5, 5, (n, 3)),
+                np.arange(n) + 100,
+            ]
+        ).astype(float)
+        self.widget = VisualisationWidget()
+        self.widget.pass_XYZ(self.xyz)
+
+    def tearDown(self):
+        self.widget.deleteLater()
+
+    def test_vertices_follow_selection_and_visibility(self):
+        widget = self.widget
+        widget._selected_points.update([3, 10, 150])
+        widget._deleted_points.update([10, 20])
+        widget._raw_planes = [slice_plane([0, 0, 1], [0, 0, 0], 1.0, two_sided=True)]
+
+        varray = widget.updatePointCloudVertices()
+
+        visible = np.abs(self.xyz[:, 5]) <= 0.5
+        visible[[10, 20]] = False
+        np.testing.assert_array_equal(varray[:, :3], self.xyz[visible, 3:6].astype(np.float32))
+        expected_flags = np.full(len(self.xyz), FLAG_NORMAL)
+        expected_flags[[3, 10, 150]] = FLAG_SELECTED
+        np.testing.assert_array_equal(varray[:, 6], expected_flags[visible])
+        self.assertEqual(varray.shape[1], 7)
+
+    def test_slice_planes_are_left_to_the_shaders(self):
+        widget = self.widget
+        widget._deleted_points.update([0])
+        widget._raw_planes = [
+            slice_plane([0, 0, 2], [0, 0, 1], 0.5),
+            slice_plane([1, 1, 0], [1, 0, 0], 3.0, two_sided=True),
+        ]
+        points = self.xyz[:, 3:6].astype(np.float32)
+
+        expected = points[:, 2] - 1 >= -0.5
+        expected &= np.abs((points[:, 0] + points[:, 1] - 1) / np.sqrt(2)) <= 1.5
+        np.testing.assert_array_equal(widget._sliceMask(points, widget._slicePlaneRows()), expected)
+        np.testing.assert_array_equal(widget._visibleMask(points), expected & (np.arange(200) > 0))
+        # Only deletions are drawn from the CPU mask
+        np.testing.assert_array_equal(widget._drawnMask(points), np.arange(200) > 0)
+
+        # Planes past the shaders' limit fall back to the CPU mask
+        widget._raw_planes = [slice_plane([0, 0, 1], [0, 0, 10], 100.0)] * MAX_SLICE_PLANES
+        widget._raw_planes.append(slice_plane([1, 0, 0], [0, 0, 0], 0.0))
+        np.testing.assert_array_equal(
+            widget._drawnMask(points), (points[:, 0] >= 0) & (np.arange(200) > 0)
+        )
+
+    def test_highlights_recolour_only_their_sites(self):
+        widget = self.widget
+        before = widget._pointColors()
+        widget.highlight_groups = [({100, 101}, np.array([1.0, 0.0, 0.0], np.float32))]
+
+        after = widget._pointColors()
+
+        np.testing.assert_array_equal(after[:2], [[1, 0, 0], [1, 0, 0]])
+        np.testing.assert_array_equal(after[2:], before[2:])
+
+    def test_delete_undo_and_export(self):
+        widget = self.widget
+        widget.select_point(5)
+        widget.select_range(9)
+        self.assertListEqual(list(widget.get_selected_points()), [5, 6, 7, 8, 9])
+
+        self.assertEqual(widget.delete_selected_points(), 5)
+        self.assertEqual(len(widget.get_selected_points()), 0)
+        active = widget.get_active_xyz()
+        np.testing.assert_array_equal(active, np.delete(self.xyz, range(5, 10), axis=0))
+
+        # Deleted points are skipped by later selections
+        widget.select_point(3)
+        widget.select_range(12)
+        self.assertListEqual(list(widget.get_selected_points()), [3, 4, 10, 11, 12])
+
+        self.assertTrue(widget.undo_deletion())
+        self.assertListEqual(list(widget.get_selected_points()), [5, 6, 7, 8, 9])
+        active = widget.get_active_xyz()
+        np.testing.assert_array_equal(active, self.xyz)
+        self.assertTrue(np.shares_memory(active, widget.xyz))
+        with self.assertRaises(ValueError):
+            active[0, 3] = 0.0
+        self.assertFalse(widget.undo_deletion())
+
+    def test_masks_follow_frame_size(self):
+        widget = self.widget
+        widget._deleted_points.update([150, 199])
+        widget.pass_XYZ(self.xyz[:160])
+        self.assertEqual(len(widget.get_active_xyz()), 159)
+
+        widget.pass_XYZ(self.xyz)
+        self.assertListEqual(list(widget._deleted_points), [150, 199])
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -13,7 +13,9 @@ ar_selection_tuple = namedtuple(
         "checked_directions",
         "selected_directions",
         "plotting",
+        "n_workers",
     ],
+    defaults=[1],
 )
 
 shape_info_tuple = namedtuple(
@@ -33,6 +35,16 @@ plot_obj_tuple = namedtuple(
 
 cluster_options_tuple = namedtuple(
     "ClusterOptions",
-    ["algorithm", "eps", "min_samples", "frame_index", "scale", "downsample", "ratios_only"],
-    defaults=[False],
+    [
+        "algorithm",
+        "eps",
+        "min_samples",
+        "frame_index",
+        "scale",
+        "downsample",
+        "ratios_only",
+        "n_workers",
+        "frame_series",
+    ],
+    defaults=[False, 1, False],
 )
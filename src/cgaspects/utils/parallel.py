@@ -0,0 +1,68 @@
+"""Process-pool helpers shared by the batch analysis workers.
+
+The analysis workers run on a ``QThreadPool`` thread and keep their own
+progress and cancellation handling; these helpers only fan independent
+per-file work out to worker processes and stream results back as they
+complete.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Callable, Iterator, Sequence
+
+logger = logging.getLogger("CA:Parallel")
+
+
+def default_worker_count() -> int:
+    """Number of worker processes to use by default (all cores but one)."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def chunk(items: Sequence, n_workers: int, chunk_size: int | None = None) -> list[list]:
+    """Split *items* into batches, a few per worker so results stream back steadily."""
+    items = list(items)
+    if not items:
+        return []
+    if chunk_size is None:
+        chunk_size = max(1, len(items) // (max(1, n_workers) * 4))
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def iter_process_pool(
+    func: Callable[[Any], Any],
+    tasks: Sequence,
+    n_workers: int,
+    cancel_flag=None,
+    poll_interval: float = 0.2,
+) -> Iterator[tuple[int, Any]]:
+    """Run ``func(task)`` for every task in a process pool.
+
+    Yields ``(task_index, result)`` in completion order.  When *cancel_flag*
+    (a ``threading.Event``) is set, pending tasks are cancelled and the
+    generator stops; callers should check the flag after iterating.
+    Exceptions raised by *func* are re-raised in the calling thread.
+
+    Processes are started with the ``spawn`` method so that forking a
+    process that is running Qt threads is never attempted.
+    """
+    if not tasks:
+        return
+
+    context = multiprocessing.get_context("spawn")
+    n_workers = max(1, min(n_workers, len(tasks)))
+    executor = ProcessPoolExecutor(max_workers=n_workers, mp_context=context)
+    try:
+        pending = {executor.submit(func, task): i for i, task in enumerate(tasks)}
+        while pending:
+            if cancel_flag is not None and cancel_flag.is_set():
+                logger.info("Cancelling %d pending process-pool tasks", len(pending))
+                return
+            done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)